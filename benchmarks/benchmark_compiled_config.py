@@ -0,0 +1,52 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the startup of a process compiling its configuration with one loading a compiled artifact.
+
+Run from the repository root with `python -m benchmarks.benchmark_compiled_config`.
+"""
+
+import os
+import tempfile
+import time
+
+from src.taipy.config.config import Config
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+
+NB_SECTIONS = 4000
+
+
+def _startup(filename, artifact):
+    reset_configuration_singleton()
+    register_test_sections()
+    start = time.perf_counter()
+    loaded = Config.load_compiled(artifact, filename)
+    return loaded, time.perf_counter() - start
+
+
+def main():
+    reset_configuration_singleton()
+    register_test_sections()
+    with Config.batch():
+        for i in range(NB_SECTIONS):
+            Config.configure_section_for_tests(f"section_{i}", attribute=f"attribute_{i}", prop_int=i, prop_list=["a"])
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "config.toml")
+        artifact = os.path.join(directory, "config.bin")
+        Config.backup(filename)
+        print(f"{NB_SECTIONS} sections")
+        for _ in range(2):
+            loaded, duration = _startup(filename, artifact)
+            print(f"{'artifact' if loaded else 'compiled':>10}: {duration:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+"""Measure the memory held by a large configuration loaded from a file, with and without compact storage.
+
+Run from the repository root with `python -m benchmarks.benchmark_config_memory`.
+"""
+
+import gc
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.taipy.config._serializer._base_serializer import _BaseSerializer
+from src.taipy.config.config import Config
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+
+NB_SECTIONS = 40000
+
+
+def _write_config(filename):
+    with open(filename, "w") as fd:
+        fd.write("[TAIPY]\n")
+        for i in range(NB_SECTIONS):
+            fd.write(
+                f"[section_name.section_{i}]\n"
+                'attribute = "foo"\n'
+                'storage_type = "csv"\n'
+                'scope = "SCENARIO:SCOPE"\n'
+                f'prop_int = "{i % 7}:int"\n'
+                'validity_period = "1d:timedelta"\n'
+            )
+
+
+def _reset():
+    reset_configuration_singleton()
+    register_test_sections()
+    gc.collect()
+
+
+def _load(filename, compact):
+    _BaseSerializer._set_compact_storage(compact)
+    try:
+        Config.override(filename)
+    finally:
+        _BaseSerializer._set_compact_storage(False)
+
+
+def _measure(filename, compact):
+    _reset()
+    start = time.perf_counter()
+    _load(filename, compact)
+    duration = time.perf_counter() - start
+    # Tracing slows the load down, so the memory is measured on a second load.
+    _reset()
+    tracemalloc.start()
+    _load(filename, compact)
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return duration, current, peak
+
+
+def main():
+    print(f"{NB_SECTIONS} sections")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "config.toml")
+        _write_config(filename)
+        for name, compact in (("default", False), ("compact", True)):
+            duration, current, peak = _measure(filename, compact)
+            print(f"{name:>8}: {duration:.3f}s, held {current / 2**20:.1f} MiB, peak {peak / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
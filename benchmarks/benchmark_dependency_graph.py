@@ -0,0 +1,64 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+"""Measure the build and the queries of the dependency graph of a configuration with 50k references.
+
+Run from the repository root with `python -m benchmarks.benchmark_dependency_graph`.
+"""
+
+import time
+
+from src.taipy.config.config import Config
+from src.taipy.config.section import Section
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.section_of_sections_list_for_tests import SectionOfSectionsListForTest
+
+NB_LEAVES = 10000
+NB_LISTS = 10000
+NB_REFERENCES = 5
+
+
+def _configure():
+    reset_configuration_singleton()
+    register_test_sections()
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop", prop_int=0))
+    with Config.batch():
+        leaves = [SectionForTest._configure(f"leaf_{i}", attribute="foo") for i in range(NB_LEAVES)]
+        for i in range(NB_LISTS):
+            references = [leaves[(i + j) % NB_LEAVES] for j in range(NB_REFERENCES)]
+            SectionOfSectionsListForTest._configure(f"list_{i}", attribute="foo", sections_list=references)
+
+
+def _timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:>24}: {time.perf_counter() - start:.4f}s")
+    return result
+
+
+def main():
+    _configure()
+    print(f"{NB_LEAVES + NB_LISTS} sections, {NB_LISTS * NB_REFERENCES} references")
+    graph = Config._applied_config._dependency_graph()
+    leaf = (SectionForTest.name, "leaf_0")
+    _timed("build", lambda: graph._successors_of(leaf))
+    _timed("1000 adjacency lookups", lambda: [graph._predecessors_of(leaf) for _ in range(1000)])
+    _timed("dependents", lambda: graph._dependents(leaf))
+    _timed("topological order", graph._topological_order)
+    _timed("cycles", graph._find_cycles)
+    SectionOfSectionsListForTest._configure("list_0", attribute="foo", sections_list=[])
+    _timed("refresh after an update", lambda: graph._successors_of(leaf))
+
+
+if __name__ == "__main__":
+    main()
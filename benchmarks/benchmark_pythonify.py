@@ -0,0 +1,61 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the decoding of type-tagged values read from configuration files.
+
+Run from the repository root with `python -m benchmarks.benchmark_pythonify`.
+"""
+
+import timeit
+
+from src.taipy.config._serializer._base_serializer import _BaseSerializer
+from src.taipy.config.config import Config
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+
+NB_SECTIONS = 2000
+
+
+def _flat():
+    return {f"key_{i}": f"{i}:int" for i in range(10000)}
+
+
+def _wide():
+    return {f"key_{i}": [f"{j}:float" for j in range(100)] for i in range(100)}
+
+
+def _deep():
+    value = leaf = {}
+    for i in range(500):
+        leaf["child"] = [{"value": f"{i}:int"}]
+        leaf = leaf["child"][0]
+    return value
+
+
+def _config():
+    reset_configuration_singleton()
+    register_test_sections()
+    with Config.batch():
+        for i in range(NB_SECTIONS):
+            Config.configure_section_for_tests(
+                f"section_{i}", attribute=f"attribute_{i}", prop_int=i, prop_list=["a", "b", i], prop="ENV[FOO]"
+            )
+    return _BaseSerializer._str(Config._applied_config)
+
+
+def main():
+    for name, build in (("flat", _flat), ("wide", _wide), ("deep", _deep), ("config", _config)):
+        value = build()
+        duration = min(timeit.repeat(lambda: _BaseSerializer._pythonify(value), number=10, repeat=3)) / 10
+        print(f"{name:>8}: {duration * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
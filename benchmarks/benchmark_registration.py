@@ -0,0 +1,43 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Measure the cost of registering sections in the Config.
+
+Run from the repository root with `python -m benchmarks.benchmark_registration`.
+"""
+
+import time
+
+from src.taipy.config.config import Config
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+
+
+def _register(nb_sections: int, incremental: bool) -> float:
+    reset_configuration_singleton()
+    register_test_sections()
+    start = time.perf_counter()
+    for i in range(nb_sections):
+        Config.configure_section_for_tests(f"section_{i}", attribute="foo", prop=i)
+        if not incremental:
+            Config._compile_configs()
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'sections':>10} {'incremental (s)':>16} {'full rebuild (s)':>17}")
+    for nb_sections in (250, 500, 1000, 2000):
+        incremental = _register(nb_sections, incremental=True)
+        full = _register(nb_sections, incremental=False)
+        print(f"{nb_sections:>10} {incremental:>16.3f} {full:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+"""Measure the peak memory and the duration of a backup of a large configuration, with and without streaming.
+
+Run from the repository root with `python -m benchmarks.benchmark_streaming_export`.
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+from src.taipy.config._serializer._json_serializer import _JsonSerializer
+from src.taipy.config._serializer._toml_serializer import _TomlSerializer
+from src.taipy.config.config import Config
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+
+NB_SECTIONS = 20000
+
+
+def _measure(write, filename):
+    tracemalloc.start()
+    start = time.perf_counter()
+    write(filename)
+    duration = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return duration, peak
+
+
+def _write_whole_toml(filename):
+    with open(filename, "w") as fd:
+        fd.write(_TomlSerializer._writer.dumps(_TomlSerializer._str(Config._applied_config)))
+
+
+def main():
+    reset_configuration_singleton()
+    register_test_sections()
+    with Config.batch():
+        for i in range(NB_SECTIONS):
+            Config.configure_section_for_tests(f"section_{i}", attribute=f"attribute_{i}", prop_int=i, prop_list=["a"])
+    print(f"{NB_SECTIONS} sections")
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "config")
+        for name, write in (
+            ("toml whole", _write_whole_toml),
+            ("toml streamed", lambda f: _TomlSerializer._write(Config._applied_config, f)),
+            ("json streamed", lambda f: _JsonSerializer._write(Config._applied_config, f)),
+        ):
+            duration, peak = _measure(write, filename)
+            print(f"{name:>14}: {duration:.3f}s, peak {peak / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
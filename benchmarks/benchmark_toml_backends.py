@@ -0,0 +1,63 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+"""Compare the TOML libraries supported by the TOML serializer on a large synthetic configuration.
+
+Run from the repository root with `python -m benchmarks.benchmark_toml_backends`.
+"""
+
+import os
+import tempfile
+import time
+
+from src.taipy.config._serializer._toml_serializer import _load_reader, _load_writer, _TomlSerializer
+from src.taipy.config.config import Config
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+
+NB_SECTIONS = 5000
+
+
+def _build_config():
+    reset_configuration_singleton()
+    register_test_sections()
+    with Config.batch():
+        for i in range(NB_SECTIONS):
+            Config.configure_section_for_tests(
+                f"section_{i}", attribute=f"attribute_{i}", prop_int=i, prop_list=["a", "b", i], prop="ENV[FOO]"
+            )
+
+
+def main():
+    _build_config()
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "config.toml")
+        print(f"{NB_SECTIONS} sections")
+        for writer in _TomlSerializer._WRITERS:
+            if not _load_writer(writer):
+                print(f"{writer:>10}: not installed")
+                continue
+            _TomlSerializer._set_backend(writer=writer)
+            start = time.perf_counter()
+            Config.backup(filename)
+            print(f"{writer:>10}: backup in {time.perf_counter() - start:.3f}s ({os.path.getsize(filename)} bytes)")
+
+        for reader in _TomlSerializer._READERS:
+            if not _load_reader(reader):
+                print(f"{reader:>10}: not installed")
+                continue
+            _TomlSerializer._set_backend(reader=reader)
+            start = time.perf_counter()
+            _TomlSerializer._read(filename)
+            print(f"{reader:>10}: load in {time.perf_counter() - start:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
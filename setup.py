@@ -26,7 +26,10 @@ with open(f"src{os.sep}taipy{os.sep}config{os.sep}version.json") as version_file
     if vext := version.get("ext"):
         version_string = f"{version_string}.{vext}"
 
-requirements = ["toml>=0.10,<0.11", "deepdiff>=6.2,<6.3"]
+requirements = ["toml>=0.10,<0.11"]
+
+# Faster TOML libraries, used by the TOML serializer instead of `toml` when they are installed.
+extras_require = {"fast-toml": ['tomli>=1.1.0;python_version<"3.11"', "tomli_w>=1.0"]}
 
 test_requirements = ["pytest>=3.8"]
 
@@ -45,6 +48,7 @@ setup(
     ],
     description="A Taipy package dedicated to easily configure a Taipy application.",
     install_requires=requirements,
+    extras_require=extras_require,
     long_description=readme,
     long_description_content_type="text/markdown",
     include_package_data=True,
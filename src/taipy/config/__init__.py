@@ -23,6 +23,7 @@ from ._init import *
 from typing import List
 from .checker.issue import Issue
 from .checker.issue_collector import IssueCollector
+from .common._classproperty import _Classproperty
 from .global_app.global_app_config import GlobalAppConfig
 from .section import Section
 from .unique_section import UniqueSection
@@ -60,7 +61,8 @@ def _inject_section(
     Config._register_default(default)
 
     if issubclass(section_clazz, UniqueSection):
-        setattr(Config, attribute_name, Config.unique_sections[section_clazz.name])
+        # Read on each access, so the attribute follows the frozen configuration and the overlays.
+        setattr(Config, attribute_name, _Classproperty(lambda config: config.unique_sections[section_clazz.name]))
     elif issubclass(section_clazz, Section):
         setattr(Config, attribute_name, Config.sections[section_clazz.name])
     else:
@@ -0,0 +1,74 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator
+
+
+class _AppliedMapping(Mapping):
+    """Read view of a mapping of the applied config, looked up again each time the view is used.
+
+    The applied config is replaced by each compilation, so a view held across compilations keeps reading the mapping
+    of the config applied when it is used. Iterating over the items or the values of the view reads a single mapping.
+    """
+
+    def __init__(self, get_mapping: Callable[[], Mapping]):
+        self._get_mapping = get_mapping
+
+    def __getitem__(self, key):
+        return self._get_mapping()[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._get_mapping())
+
+    def __len__(self) -> int:
+        return len(self._get_mapping())
+
+    def __contains__(self, key) -> bool:
+        return key in self._get_mapping()
+
+    def items(self):
+        return self._get_mapping().items()
+
+    def values(self):
+        return self._get_mapping().values()
+
+    def __repr__(self):
+        return repr(self._get_mapping())
+
+
+class _AppliedSections(_AppliedMapping):
+    """Read view of the non unique sections of the applied config, whose values are views of the sections of a name.
+
+    The view of the sections of a name is created once, so `Config.sections[name]` always returns the same view.
+    """
+
+    def __init__(self, get_mapping: Callable[[], Mapping]):
+        super().__init__(get_mapping)
+        self.__views: Dict[str, _AppliedMapping] = {}
+
+    def __getitem__(self, section_name: str) -> _AppliedMapping:
+        if section_name not in self._get_mapping():
+            raise KeyError(section_name)
+        return self.__view(section_name)
+
+    def items(self):
+        return [(section_name, self.__view(section_name)) for section_name in self._get_mapping()]
+
+    def values(self):
+        return [self.__view(section_name) for section_name in self._get_mapping()]
+
+    def __view(self, section_name: str) -> _AppliedMapping:
+        if (view := self.__views.get(section_name, None)) is None:
+            view = self.__views.setdefault(
+                section_name, _AppliedMapping(lambda: self._get_mapping().get(section_name, {}))
+            )
+        return view
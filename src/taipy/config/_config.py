@@ -9,29 +9,86 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
+import weakref
 from copy import copy
-from typing import Dict
+from functools import partial
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from ._dependency_graph import _DependencyGraph
+from ._lazy_sections import _LazySections
+from .common._fingerprint import _Fingerprinted
 from .global_app.global_app_config import GlobalAppConfig
 from .section import Section
 from .unique_section import UniqueSection
 
+_SectionKey = Tuple[str, Optional[str]]
+
+
+class _Lineage:
+    """State shared by the successive configs published as the applied config, each one replacing the previous one.
+
+    It holds weak references to the sections replaced by the later configs, by (section name, section id) key.
+    """
+
+    def __init__(self):
+        self._replaced_sections: Dict[_SectionKey, List[weakref.ref]] = {}
+
 
 class _Config:
+    """Set of sections, compiled from configs layered one above the other to build the applied config.
+
+    The applied config is never modified once published. Each compilation builds a new config, sharing with the
+    applied one the sections and mappings it does not change, and publishes it with a single assignment. See
+    `_succeed()` for how the sections held elsewhere follow the published configs.
+    """
+
     DEFAULT_KEY = "default"
+    GLOBAL_KEY = "TAIPY"
 
     def __init__(self):
         self._sections: Dict[str, Dict[str, Section]] = {}
         self._unique_sections: Dict[str, UniqueSection] = {}
         self._global_config: GlobalAppConfig = GlobalAppConfig()
+        self._lineage = _Lineage()
+        self.__merged_configs: List["_Config"] = []
+        self.__dependency_graph: Optional[_DependencyGraph] = None
+        self.__modified_sections: Optional[Set[_SectionKey]] = None
 
     def _clean(self):
         self._global_config._clean()
         for unique_section in self._unique_sections.values():
             unique_section._clean()
         for sections in self._sections.values():
+            if isinstance(sections, _LazySections):
+                sections._discard_pending()
             for section in sections.values():
                 section._clean()
+        self.__merged_configs = []
+        self.__invalidate_caches()
+
+    def __getstate__(self):
+        # The merged configs are only needed to build pending sections, which are all built when pickled.
+        state = self.__dict__.copy()
+        state["_lineage"] = _Lineage()
+        state["_Config__merged_configs"] = []
+        state["_Config__dependency_graph"] = None
+        return state
+
+    def _fingerprint(self) -> str:
+        """Return the fingerprint of the config, combining the cached fingerprints of its sections.
+
+        Two configs with the same fingerprint have the same global config and the same sections, whatever their order.
+        Once the fingerprints of the sections are cached, only their digests are hashed again.
+        """
+        fingerprint = hashlib.sha256(self._global_config._fingerprint().encode())
+        for section_name, unique_section in sorted(self._unique_sections.items()):
+            fingerprint.update(f"\0U{section_name}\0{unique_section._fingerprint()}".encode())
+        for section_name, sections in sorted(self._sections.items()):
+            fingerprint.update(f"\0S{section_name}\0{len(sections)}".encode())
+            for section_id, section in sorted(sections.items()):
+                fingerprint.update(f"\0{section_id}\0{section._fingerprint()}".encode())
+        return fingerprint.hexdigest()
 
     @classmethod
     def _default_config(cls):
@@ -39,7 +96,35 @@ class _Config:
         config._global_config = GlobalAppConfig.default_config()
         return config
 
-    def _update(self, other_config):
+    @classmethod
+    def _compiled(cls, configs: Iterable["_Config"]) -> "_Config":
+        """Return a new config merging the ordered list of config layers.
+
+        The nested sections are pointed to the sections of the new config once all the layers are merged, so they
+        never reference a section that is not complete yet.
+
+        Args:
+            configs (Iterable[_Config]): The config layers to merge, from the lowest to the highest priority.
+        """
+        config = cls()
+        nested_section_holders: List[Section] = []
+        for other_config in configs:
+            config._update(other_config, nested_section_holders)
+        for nested_section_holder in nested_section_holders:
+            config.__point_nested_section_to_self(nested_section_holder)
+        return config
+
+    def _update(self, other_config, nested_section_holders: Optional[List[Section]] = None):
+        """Merge another config into self.
+
+        Args:
+            other_config (_Config): The config to merge.
+            nested_section_holders (Optional[List[Section]]): If provided, the sections of *other_config* holding
+                nested sections are appended to it, to be pointed to self by the caller. Otherwise, they are pointed to
+                self once all the sections are merged, whatever their order.
+        """
+        # The references of the sections modified in place since the last modification of the config are found again.
+        _Fingerprinted._invalidate_fingerprints()
         self._global_config._update(other_config._global_config._to_dict())
         if other_config._unique_sections:
             for section_name, other_section in other_config._unique_sections.items():
@@ -48,19 +133,274 @@ class _Config:
                 else:
                     self._unique_sections[section_name] = copy(other_config._unique_sections[section_name])
         if other_config._sections:
+            holders: List[Section] = [] if nested_section_holders is None else nested_section_holders
             for section_name, other_non_unique_sections in other_config._sections.items():
                 if non_unique_sections := self._sections.get(section_name, None):
-                    self.__update_sections(non_unique_sections, other_non_unique_sections)
+                    if isinstance(other_non_unique_sections, _LazySections) and self.DEFAULT_KEY in non_unique_sections:
+                        self.__update_lazy_sections(section_name, other_non_unique_sections)
+                    else:
+                        self.__update_sections(non_unique_sections, other_non_unique_sections, holders)
                 else:
                     self._sections[section_name] = {}
-                    self.__add_sections(self._sections[section_name], other_non_unique_sections)
+                    self.__add_sections(self._sections[section_name], other_non_unique_sections, holders)
+            if nested_section_holders is None:
+                for nested_section_holder in holders:
+                    self.__point_nested_section_to_self(nested_section_holder)
+        self.__merged_configs.append(other_config)
+        self.__invalidate_caches()
+
+    def _dependency_graph(self) -> _DependencyGraph:
+        """Return the graph of the references between the sections of self.
+
+        The graph is built on the first call. It is handed over to the config replacing self in the applied config,
+        which only marks the sections it changed, read again on the next query.
+        """
+        if self.__dependency_graph is None:
+            self.__dependency_graph = _DependencyGraph(self)
+        return self.__dependency_graph
+
+    def _pop_modified_sections(self) -> Optional[Set[_SectionKey]]:
+        """Return the sections modified by the compilations of the applied config since the previous call.
+
+        The sections are the ones modified by the compilations of the configs self replaced, see `_succeed()`, and
+        they are forgotten by self.
+
+        Returns:
+            The (section name, section id) keys of the modified sections. A default section key stands for all the
+            sections with the same name. None if the whole config may have changed, on the first call or after a full
+            compilation. The sections modified in place, without compiling the config, are not reported.
+        """
+        modified_sections, self.__modified_sections = self.__modified_sections, set()
+        return modified_sections
+
+    def __invalidate_caches(self, changed_sections: Optional[Iterable[_SectionKey]] = None):
+        _Fingerprinted._invalidate_fingerprints()
+        if self.__dependency_graph is not None:
+            self.__dependency_graph._invalidate(changed_sections)
+        if changed_sections is None:
+            self.__modified_sections = None
+        elif self.__modified_sections is not None:
+            self.__modified_sections.update(changed_sections)
+
+    def _succeed(self, previous: "_Config", changed_sections: Optional[Iterable[_SectionKey]] = None):
+        """Take over from the config self replaced as the applied config, once self is published.
+
+        Self continues the lineage of *previous*: it takes over its dependency graph and the sections it reports as
+        modified. Then the sections of *previous* replaced by self, and the sections they replaced themselves, take the
+        state of their replacement if it has the same type. They share it from then on, so a section held elsewhere,
+        like the unique sections held as attributes of `Config`, keeps reading the applied config. A reader holding a
+        previous config sees its replaced sections take their new state one after the other: reading the applied
+        config once gives a consistent view instead.
+
+        Args:
+            previous (_Config): The config self replaced as the applied config.
+            changed_sections (Optional[Iterable[Tuple[str, Optional[str]]]]): The (section name, section id) keys of
+                the sections self may have replaced. A default section key stands for all the sections with the same
+                name. If None, all the sections may have been replaced.
+        """
+        changed_sections = None if changed_sections is None else list(changed_sections)
+        self._lineage = previous._lineage
+        self.__dependency_graph, previous.__dependency_graph = previous.__dependency_graph, None
+        if self.__dependency_graph is not None:
+            self.__dependency_graph._config = self
+        self.__modified_sections = None if previous.__modified_sections is None else set(previous.__modified_sections)
+        self.__invalidate_caches(changed_sections)
+
+        replaced_sections = self._lineage._replaced_sections
+        if changed_sections is None:
+            # The sections no longer held are forgotten.
+            for section_key in list(replaced_sections):
+                if not (references := [reference for reference in replaced_sections[section_key] if reference()]):
+                    del replaced_sections[section_key]
+                else:
+                    replaced_sections[section_key] = references
+        for section_key, section, replacement in self.__replaced_sections(previous, changed_sections):
+            references = replaced_sections.setdefault(section_key, [])
+            if changed_sections is not None:
+                references[:] = [reference for reference in references if reference()]
+            references.append(weakref.ref(section))
+            if replacement is not None:
+                self.__forward_replaced_sections(section_key, replacement)
+
+    def __forward_replaced_sections(self, section_key: _SectionKey, section):
+        for reference in self._lineage._replaced_sections.get(section_key, ()):
+            if (replaced_section := reference()) is not None and type(replaced_section) is type(section):
+                replaced_section.__dict__ = section.__dict__
+
+    def _can_update_incrementally(self, changed_sections: Iterable[_SectionKey]) -> bool:
+        """Check if the changed sections can be recompiled without a full rebuild.
+
+        An incremental update is only possible when the structure of the config is already known, that is when every
+        changed unique section exists and every changed non unique section already has a default section.
+
+        Args:
+            changed_sections (Iterable[Tuple[str, Optional[str]]]): The (section name, section id) keys that changed.
+                The section id is None for unique sections and for the global config.
+        """
+        for section_name, section_id in changed_sections:
+            if section_name == self.GLOBAL_KEY:
+                continue
+            if section_id is None:
+                if section_name not in self._unique_sections:
+                    return False
+            elif self.DEFAULT_KEY not in self._sections.get(section_name, {}):
+                return False
+        return True
+
+    def _recompiled(self, configs: List["_Config"], changed_sections: Iterable[_SectionKey]) -> "_Config":
+        """Return a new config where only the changed sections are compiled again from the ordered config layers.
+
+        The result is the same as compiling all the layers with `_compiled()`, but only the changed entries are merged
+        again, into new sections. The other sections are shared with self, which is not modified. When a default
+        section changed, all the sections with the same name are recompiled since they inherit from it. A changed
+        section that no config of *configs* contains anymore is removed.
 
-    def __add_sections(self, entity_config, other_entity_configs):
+        Args:
+            configs (List[_Config]): The config layers to merge, from the lowest to the highest priority.
+            changed_sections (Iterable[Tuple[str, Optional[str]]]): The (section name, section id) keys that changed.
+        """
+        # The references of the sections modified in place since the last modification of the config are found again.
+        _Fingerprinted._invalidate_fingerprints()
+        config = self.__derived()
+        changed_non_unique_sections: Dict[str, Dict[str, None]] = {}
+        for section_name, section_id in changed_sections:
+            if section_name == self.GLOBAL_KEY:
+                config.__recompile_global_config(configs)
+            elif section_id is None:
+                config.__recompile_unique_section(configs, section_name)
+            else:
+                changed_non_unique_sections.setdefault(section_name, {})[section_id] = None
+        for section_name, section_ids in changed_non_unique_sections.items():
+            config.__recompile_sections(configs, section_name, list(section_ids))
+        return config
+
+    def _with_missing_sections(self, configs: List["_Config"], changed_sections: Iterable[_SectionKey]) -> "_Config":
+        """Return a new config made of self and of a copy of the changed sections self does not contain yet.
+
+        The copy is taken from the config layer with the highest priority. It is not merged with the other layers, so
+        it only stands for the section until the next compilation replaces it.
+
+        Args:
+            configs (List[_Config]): The config layers, from the lowest to the highest priority.
+            changed_sections (Iterable[Tuple[str, Optional[str]]]): The (section name, section id) keys that changed.
+        """
+        config = self.__derived()
+        for section_name, section_id in changed_sections:
+            if section_name == self.GLOBAL_KEY:
+                continue
+            if section_id is None:
+                if section_name in config._unique_sections:
+                    continue
+                for other_config in reversed(configs):
+                    if other_section := other_config._unique_sections.get(section_name, None):
+                        config._unique_sections[section_name] = copy(other_section)
+                        break
+            elif section_id not in config._sections.get(section_name, {}):
+                for other_config in reversed(configs):
+                    if other_section := other_config._sections.get(section_name, {}).get(section_id, None):
+                        entity_config = self.__copy_sections(config._sections.get(section_name, {}))
+                        entity_config[section_id] = copy(other_section)
+                        config._sections[section_name] = entity_config
+                        break
+        return config
+
+    def __derived(self) -> "_Config":
+        # The mappings of the sections of each name are shared until a section is added to or removed from them.
+        config = _Config()
+        config._sections = dict(self._sections)
+        config._unique_sections = dict(self._unique_sections)
+        config._global_config = self._global_config
+        config.__merged_configs = self.__merged_configs
+        return config
+
+    def __recompile_global_config(self, configs):
+        global_config = GlobalAppConfig()
+        for config in configs:
+            global_config._update(config._global_config._to_dict())
+        self._global_config = global_config
+
+    def __recompile_unique_section(self, configs, section_name):
+        if not any(section_name in config._unique_sections for config in configs):
+            self._unique_sections.pop(section_name, None)
+            return
+        section = copy(self._unique_sections[section_name])
+        section._clean()
+        for config in configs:
+            if other_section := config._unique_sections.get(section_name, None):
+                section._update(other_section._to_dict())
+        self._unique_sections[section_name] = section
+
+    def __recompile_sections(self, configs, section_name, section_ids):
+        entity_config = self._sections[section_name]
+        recompile_default = self.DEFAULT_KEY in section_ids
+        if recompile_default:
+            # Every section inherits from the default one, so all of them must be recompiled.
+            section_ids = dict.fromkeys(entity_config)
+            for config in configs:
+                section_ids.update(dict.fromkeys(config._sections.get(section_name, {})))
+        removed_ids = {
+            cfg_id
+            for cfg_id in section_ids
+            if cfg_id != self.DEFAULT_KEY
+            and not any(cfg_id in config._sections.get(section_name, {}) for config in configs)
+        }
+
+        # The sections are merged into new copies, the ones of self being shared with the config it was derived from.
+        default_section = copy(entity_config[self.DEFAULT_KEY])
+        default_section._clean()
+        recompiled_sections = {}
+        for cfg_id in section_ids:
+            if (
+                cfg_id != self.DEFAULT_KEY
+                and cfg_id not in removed_ids
+                and (section := entity_config.get(cfg_id, None))
+            ):
+                recompiled_sections[cfg_id] = copy(section)
+                recompiled_sections[cfg_id]._clean()
+        nested_section_holders = []
+        for config in configs:
+            if not (other_entity_configs := config._sections.get(section_name, None)):
+                continue
+            if other_default_section := other_entity_configs.get(self.DEFAULT_KEY, None):
+                default_section._update(other_default_section._to_dict())
+                # Modified in place, so the sections merged next do not inherit the properties of its previous state.
+                default_section._inherited_properties_cache = None
+                if recompile_default:
+                    nested_section_holders.append(other_default_section)
+            for cfg_id in section_ids:
+                if cfg_id == self.DEFAULT_KEY or not (sub_config := other_entity_configs.get(cfg_id, None)):
+                    continue
+                if cfg_id not in recompiled_sections:
+                    recompiled_sections[cfg_id] = copy(sub_config)
+                recompiled_sections[cfg_id]._update(sub_config._to_dict(), default_section)
+                recompiled_sections[cfg_id]._share_properties(sub_config)
+                nested_section_holders.append(sub_config)
+
+        entity_config = self.__copy_sections(entity_config)
+        if recompile_default:
+            entity_config[self.DEFAULT_KEY] = default_section
+        entity_config.update(recompiled_sections)
+        for cfg_id in removed_ids:
+            entity_config.pop(cfg_id, None)
+        self._sections[section_name] = entity_config
+        for nested_section_holder in nested_section_holders:
+            self.__point_nested_section_to_self(nested_section_holder)
+
+    @staticmethod
+    def __copy_sections(entity_config):
+        if isinstance(entity_config, _LazySections):
+            return entity_config._copy()
+        return dict(entity_config)
+
+    @staticmethod
+    def __add_sections(entity_config, other_entity_configs, nested_section_holders: List[Section]):
         for cfg_id, sub_config in other_entity_configs.items():
             entity_config[cfg_id] = copy(sub_config)
-            self.__point_nested_section_to_self(sub_config)
+            if cfg_id != _Config.DEFAULT_KEY:
+                entity_config[cfg_id]._share_properties(sub_config)
+            nested_section_holders.append(sub_config)
 
-    def __update_sections(self, entity_config, other_entity_configs):
+    def __update_sections(self, entity_config, other_entity_configs, nested_section_holders: List[Section]):
         if self.DEFAULT_KEY in other_entity_configs:
             if self.DEFAULT_KEY in entity_config:
                 entity_config[self.DEFAULT_KEY]._update(other_entity_configs[self.DEFAULT_KEY]._to_dict())
@@ -68,28 +408,125 @@ class _Config:
                 entity_config[self.DEFAULT_KEY] = other_entity_configs[self.DEFAULT_KEY]
         for cfg_id, sub_config in other_entity_configs.items():
             if cfg_id != self.DEFAULT_KEY:
-                if cfg_id in entity_config:
-                    entity_config[cfg_id]._update(sub_config._to_dict(), entity_config.get(self.DEFAULT_KEY))
-                else:
+                if cfg_id not in entity_config:
                     entity_config[cfg_id] = copy(sub_config)
-                    entity_config[cfg_id]._update(sub_config._to_dict(), entity_config.get(self.DEFAULT_KEY))
-            self.__point_nested_section_to_self(sub_config)
+                entity_config[cfg_id]._update(sub_config._to_dict(), entity_config.get(self.DEFAULT_KEY))
+                # The sections of a single layer keep sharing their properties with it until they are modified.
+                entity_config[cfg_id]._share_properties(sub_config)
+            nested_section_holders.append(sub_config)
 
-    def __point_nested_section_to_self(self, section):
-        """Loop through attributes of a Section to find if any attribute has a list of Section as value.
-        If there is, update each nested Section by the corresponding instance in self.
+    def __update_lazy_sections(self, section_name, other_entity_configs: _LazySections):
+        """Merge sections that are not built yet without building them.
 
-        Args:
-            section (Section): The Section to search for nested sections.
+        The sections of self that are built already are updated like any other section. The other ones are added as
+        pending sections, built on first access from all the configs merged into self since it was last cleaned.
         """
-        for _, attr_value in vars(section).items():
-            # ! This will fail if an attribute is a dictionary, or nested list of Sections.
-            if not isinstance(attr_value, list):
+        entity_config = self._sections[section_name]
+        if not isinstance(entity_config, _LazySections):
+            entity_config = _LazySections(partial(self.__build_section, section_name), entity_config)
+            self._sections[section_name] = entity_config
+        if self.DEFAULT_KEY in other_entity_configs:
+            entity_config[self.DEFAULT_KEY]._update(other_entity_configs[self.DEFAULT_KEY]._to_dict())
+        for cfg_id in other_entity_configs:
+            if cfg_id == self.DEFAULT_KEY:
                 continue
+            if entity_config._is_built(cfg_id):
+                sub_config = other_entity_configs[cfg_id]
+                entity_config[cfg_id]._update(sub_config._to_dict(), entity_config[self.DEFAULT_KEY])
+                entity_config[cfg_id]._share_properties(sub_config)
+                self.__point_nested_section_to_self(sub_config)
+            elif cfg_id not in entity_config:
+                entity_config._add_pending(cfg_id)
 
-            for index, item in enumerate(attr_value):
-                if not isinstance(item, Section):
-                    continue
+    def __build_section(self, section_name, section_id, _) -> Section:
+        # Replays the merged configs in order, like a full compilation would, with a scratch default section.
+        default_section = copy(self._sections[section_name][self.DEFAULT_KEY])
+        default_section._clean()
+        section = None
+        for config in self.__merged_configs:
+            if not (other_entity_configs := config._sections.get(section_name, None)):
+                continue
+            if other_default_section := other_entity_configs.get(self.DEFAULT_KEY, None):
+                default_section._update(other_default_section._to_dict())
+                # Modified in place, so the sections merged next do not inherit the properties of its previous state.
+                default_section._inherited_properties_cache = None
+            if sub_config := other_entity_configs.get(section_id, None):
+                if section is None:
+                    section = copy(sub_config)
+                section._update(sub_config._to_dict(), default_section)
+                section._share_properties(sub_config)
+                self.__point_nested_section_to_self(sub_config)
+        # The sections replaced before this one was built take its state.
+        self.__forward_replaced_sections((section_name, section_id), section)
+        return section
+
+    def __get_built_section_by_key(self, section_key: _SectionKey):
+        section_name, section_id = section_key
+        if section_name == self.GLOBAL_KEY:
+            return self._global_config
+        if section_id is None:
+            return self._unique_sections.get(section_name, None)
+        return self.__get_built_section(self._sections.get(section_name, {}), section_id)
+
+    @staticmethod
+    def __get_built_section(entity_config, cfg_id) -> Optional[Section]:
+        if isinstance(entity_config, _LazySections) and not entity_config._is_built(cfg_id):
+            return None
+        return entity_config.get(cfg_id, None)
+
+    def __replaced_sections(self, previous: "_Config", section_keys: Optional[Iterable[_SectionKey]]):
+        """Yield the (section name, section id) keys, the built sections of *previous* that self replaced and their
+        replacements, None if self has no built section with the same key, for the given keys or for all.
+        """
+        if section_keys is None:
+            section_keys = [(self.GLOBAL_KEY, None)]
+            section_keys.extend((section_name, None) for section_name in previous._unique_sections)
+            section_keys.extend((section_name, self.DEFAULT_KEY) for section_name in previous._sections)
+        for section_key in section_keys:
+            section_name, section_id = section_key
+            if section_name == self.GLOBAL_KEY or section_id is None:
+                section = previous.__get_built_section_by_key(section_key)
+                if section is not None and (replacement := self.__get_built_section_by_key(section_key)) is not section:
+                    yield section_key, section, replacement
+                continue
+            sections = previous._sections.get(section_name, {})
+            replacements = self._sections.get(section_name, {})
+            if replacements is sections:
+                # The mapping is shared, so none of its sections was replaced.
+                continue
+            if section_id != self.DEFAULT_KEY:
+                section = self.__get_built_section(sections, section_id)
+                if (
+                    section is not None
+                    and (replacement := self.__get_built_section(replacements, section_id)) is not section
+                ):
+                    yield section_key, section, replacement
+                continue
+            if isinstance(sections, _LazySections) or isinstance(replacements, _LazySections):
+                pairs: Iterable[Tuple[str, Optional[Section], Optional[Section]]] = (
+                    (cfg_id, self.__get_built_section(sections, cfg_id), self.__get_built_section(replacements, cfg_id))
+                    for cfg_id in sections
+                )
+            else:
+                pairs = ((cfg_id, section, replacements.get(cfg_id, None)) for cfg_id, section in sections.items())
+            for cfg_id, section, replacement in pairs:
+                if section is not None and replacement is not section:
+                    yield (section_name, cfg_id), section, replacement
 
-                if sub_item := self._sections.get(item.name, {}).get(item.id, None):
-                    attr_value[index] = sub_item
+    def __point_nested_section_to_self(self, section):
+        """Update the sections referenced by a Section to the corresponding instances in self.
+
+        The references are found through the lists and dictionaries of the attributes of the section, at any depth.
+        They are indexed by the section, see `Section._nested_references()`, so only the known references are visited.
+
+        Args:
+            section (Section): The Section to search for nested sections.
+        """
+        attributes = vars(section)
+        for attribute_name, path in section._nested_references():
+            container = attributes[attribute_name]
+            for key in path[:-1]:
+                container = container[key]
+            item = container[path[-1]]
+            if isinstance(item, Section) and (target := self._sections.get(item.name, {}).get(item.id, None)):
+                container[path[-1]] = target
@@ -9,15 +9,14 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-import json
 from copy import copy
-from typing import Optional, Set, Union
-
-from deepdiff import DeepDiff
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from ...logger._taipy_logger import _TaipyLogger
 from .._config import _Config
 from .._serializer._json_serializer import _JsonSerializer
+from ..global_app.global_app_config import GlobalAppConfig
+from ..section import Section
 from ._comparator_result import _ComparatorResult
 
 
@@ -91,20 +90,141 @@ class _ConfigComparator:
         return comparator_result
 
     def __get_config_diff(self, config_1, config_2):
-        json_config_1 = json.loads(_JsonSerializer._serialize(config_1))
-        json_config_2 = json.loads(_JsonSerializer._serialize(config_2))
+        comparator_result = _ComparatorResult(copy(self._unconflicted_sections))
+        if config_1._fingerprint() == config_2._fingerprint():
+            return comparator_result
 
-        config_deepdiff = DeepDiff(json_config_1, json_config_2, ignore_order=True)
+        # Modified lists are reported after the other modified values, the ones with added items first.
+        modified_lists: Tuple[List, List] = ([], [])
 
-        comparator_result = _ComparatorResult(copy(self._unconflicted_sections))
+        nodes_1 = self.__get_nodes(config_1)
+        nodes_2 = self.__get_nodes(config_2)
+        for node_name, (_, node) in nodes_2.items():
+            if node_name not in nodes_1:
+                comparator_result._add_added_item(node_name, None, None, self.__stringify_node(node))
+        for node_name, (_, node) in nodes_1.items():
+            if node_name not in nodes_2:
+                comparator_result._add_removed_item(node_name, None, None, self.__stringify_node(node))
+        for node_name, (is_unique_2, node_2) in nodes_2.items():
+            if node_name not in nodes_1:
+                continue
+            is_unique_1, node_1 = nodes_1[node_name]
+            if is_unique_1 and is_unique_2:
+                self.__diff_section(comparator_result, modified_lists, node_name, None, node_1, node_2)
+            elif not is_unique_1 and not is_unique_2:
+                self.__diff_sections(comparator_result, modified_lists, node_name, node_1, node_2)
+            else:
+                comparator_result._add_modified_item(
+                    node_name, None, None, self.__stringify_node(node_1), self.__stringify_node(node_2)
+                )
 
-        comparator_result._check_added_items(config_deepdiff, json_config_2)
-        comparator_result._check_removed_items(config_deepdiff, json_config_1)
-        comparator_result._check_modified_items(config_deepdiff, json_config_1, json_config_2)
+        for key, old_value, new_value in modified_lists[0] + modified_lists[1]:
+            comparator_result._add_modified_item(*key, old_value, new_value)
         comparator_result._sort_by_section()
 
         return comparator_result
 
+    @staticmethod
+    def __get_nodes(config: _Config) -> Dict[str, Tuple[bool, Any]]:
+        # Each node is a unique section, or the global config, or a dictionary of non unique sections.
+        nodes: Dict[str, Tuple[bool, Any]] = {_JsonSerializer._GLOBAL_NODE_NAME: (True, config._global_config)}
+        nodes.update((name, (True, section)) for name, section in config._unique_sections.items())
+        nodes.update((name, (False, sections)) for name, sections in config._sections.items())
+        return nodes
+
+    @staticmethod
+    def __stringify_node(node) -> Dict[str, Any]:
+        if isinstance(node, (Section, GlobalAppConfig)):
+            return _JsonSerializer._stringify(node._to_dict())
+        return {config_id: _JsonSerializer._stringify(section._to_dict()) for config_id, section in node.items()}
+
+    def __diff_sections(self, comparator_result, modified_lists, section_name, sections_1, sections_2):
+        for config_id, section in sections_2.items():
+            if config_id not in sections_1:
+                comparator_result._add_added_item(section_name, config_id, None, self.__stringify_node(section))
+        for config_id, section in sections_1.items():
+            if config_id not in sections_2:
+                comparator_result._add_removed_item(section_name, config_id, None, self.__stringify_node(section))
+        for config_id, section_2 in sections_2.items():
+            if config_id in sections_1:
+                self.__diff_section(
+                    comparator_result, modified_lists, section_name, config_id, sections_1[config_id], section_2
+                )
+
+    def __diff_section(self, comparator_result, modified_lists, section_name, config_id, section_1, section_2):
+        if section_1._fingerprint() == section_2._fingerprint():
+            return
+        as_dict_1 = self.__stringify_node(section_1)
+        as_dict_2 = self.__stringify_node(section_2)
+        if as_dict_1 == as_dict_2:
+            return
+
+        if config_id:
+            self.__diff_items(comparator_result, modified_lists, as_dict_1, as_dict_2, (section_name, config_id))
+            return
+
+        # A unique section, or the global config, is reported with its attribute in place of the config id. The keys
+        # of an attribute holding a dictionary are then reported in place of the attribute.
+        dict_attributes = {
+            attribute
+            for attribute, value in as_dict_2.items()
+            if isinstance(value, dict) and isinstance(as_dict_1.get(attribute, None), dict)
+        }
+        self.__diff_items(
+            comparator_result,
+            modified_lists,
+            {k: v for k, v in as_dict_1.items() if k not in dict_attributes},
+            {k: v for k, v in as_dict_2.items() if k not in dict_attributes},
+            (section_name,),
+        )
+        for attribute in as_dict_2:
+            if attribute in dict_attributes:
+                self.__diff_items(
+                    comparator_result,
+                    modified_lists,
+                    as_dict_1[attribute],
+                    as_dict_2[attribute],
+                    (section_name, attribute),
+                )
+
+    def __diff_items(self, comparator_result, modified_lists, as_dict_1, as_dict_2, key_prefix: Tuple):
+        # Each item is reported with a key made of the prefix and its key, padded with None to 3 elements.
+        def key(item_key):
+            return (*key_prefix, item_key, None)[:3]
+
+        for item_key, value in as_dict_2.items():
+            if item_key not in as_dict_1:
+                comparator_result._add_added_item(*key(item_key), value)
+        for item_key, value in as_dict_1.items():
+            if item_key not in as_dict_2:
+                comparator_result._add_removed_item(*key(item_key), value)
+        for item_key, new_value in as_dict_2.items():
+            if item_key not in as_dict_1:
+                continue
+            old_value = as_dict_1[item_key]
+            if old_value == new_value:
+                continue
+            old_items, new_items = self.__ignore_order(old_value), self.__ignore_order(new_value)
+            if old_items == new_items:
+                continue
+            if isinstance(old_value, list) and isinstance(new_value, list):
+                modified_lists[0 if new_items - old_items else 1].append((key(item_key), old_value, new_value))
+            else:
+                comparator_result._add_modified_item(*key(item_key), old_value, new_value)
+
+    @classmethod
+    def __ignore_order(cls, value):
+        """Convert a value so that two values only differing by the order or the repetition of items are equal."""
+        if isinstance(value, dict):
+            return frozenset((k, cls.__ignore_order(v)) for k, v in value.items())
+        if isinstance(value, (list, set)):
+            return frozenset(cls.__ignore_order(v) for v in value)
+        try:
+            hash(value)
+        except TypeError:
+            return repr(value)
+        return value
+
     def __log_comparison_message(
         self,
         comparator_result: _ComparatorResult,
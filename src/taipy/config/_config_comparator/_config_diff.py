@@ -0,0 +1,136 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .._config import _Config
+from .._lazy_sections import _LazySections
+from .._serializer._json_serializer import _JsonSerializer
+
+_ChangeKey = Tuple[str, Optional[str], Optional[str]]
+_SectionKey = Tuple[str, Optional[str]]
+_Snapshot = Dict[_SectionKey, Optional[Tuple[str, Dict[str, Any]]]]
+
+
+def _diff_configs(config_1: _Config, config_2: _Config) -> List[_ChangeKey]:
+    """List the keys of the values that differ between two configs.
+
+    Each key is a (section name, section id, attribute) tuple. The section id is None for unique sections and for the
+    global config, whose section name is `_Config.GLOBAL_KEY`. The attribute is None when the whole section was added
+    or removed. Sections with the same fingerprint are not compared further.
+
+    Args:
+        config_1 (_Config): The previous config.
+        config_2 (_Config): The new config.
+    Returns:
+        The keys of the added, removed and modified values, without duplicates, in a deterministic order.
+    """
+    changes: Dict[_ChangeKey, None] = {}
+    if config_1._fingerprint() == config_2._fingerprint():
+        return []
+    _diff_section(changes, _Config.GLOBAL_KEY, None, config_1._global_config, config_2._global_config)
+    for section_name in _union(config_1._unique_sections, config_2._unique_sections):
+        _diff_section(
+            changes,
+            section_name,
+            None,
+            config_1._unique_sections.get(section_name, None),
+            config_2._unique_sections.get(section_name, None),
+        )
+    for section_name in _union(config_1._sections, config_2._sections):
+        sections_1 = config_1._sections.get(section_name, {})
+        sections_2 = config_2._sections.get(section_name, {})
+        for section_id in _union(sections_1, sections_2):
+            _diff_section(
+                changes, section_name, section_id, sections_1.get(section_id, None), sections_2.get(section_id, None)
+            )
+    return list(changes)
+
+
+def _union(mapping_1, mapping_2) -> List:
+    return list(dict.fromkeys([*mapping_1, *mapping_2]))
+
+
+def _diff_section(changes: Dict[_ChangeKey, None], section_name, section_id, section_1, section_2):
+    if section_1 is None or section_2 is None:
+        if section_1 is not section_2:
+            changes[(section_name, section_id, None)] = None
+        return
+    if section_1._fingerprint() == section_2._fingerprint():
+        return
+    _diff_dicts(changes, section_name, section_id, section_1._to_dict(), section_2._to_dict())
+
+
+def _diff_dicts(changes: Dict[_ChangeKey, None], section_name, section_id, as_dict_1, as_dict_2):
+    as_dict_1 = _JsonSerializer._stringify(as_dict_1)
+    as_dict_2 = _JsonSerializer._stringify(as_dict_2)
+    for attribute in _union(as_dict_1, as_dict_2):
+        if attribute not in as_dict_1 or attribute not in as_dict_2 or as_dict_1[attribute] != as_dict_2[attribute]:
+            changes[(section_name, section_id, attribute)] = None
+
+
+def _snapshot(config: _Config, section_keys: Optional[Iterable[_SectionKey]] = None) -> _Snapshot:
+    """Record the fingerprint and the values of sections of a config, to be compared after the config is modified.
+
+    Args:
+        config (_Config): The config.
+        section_keys (Optional[Iterable[Tuple[str, Optional[str]]]]): The (section name, section id) keys of the
+            sections to record, as passed to `_Config._recompiled()`. A default section key stands for all
+            the sections of its name. If None, all the sections are recorded.
+    Returns:
+        The snapshot. The sections of a lazy mapping that are not built yet are recorded as None, without building
+        them.
+    """
+    snapshot: _Snapshot = {}
+    if section_keys is None:
+        section_keys = [(_Config.GLOBAL_KEY, None)]
+        section_keys.extend((section_name, None) for section_name in config._unique_sections)
+        section_keys.extend((section_name, _Config.DEFAULT_KEY) for section_name in config._sections)
+    else:
+        section_keys = sorted(section_keys, key=lambda section_key: (section_key[0], section_key[1] or ""))
+    for section_name, section_id in section_keys:
+        if section_name == _Config.GLOBAL_KEY:
+            snapshot[(section_name, None)] = _record(config._global_config)
+        elif section_id is None:
+            if (unique_section := config._unique_sections.get(section_name, None)) is not None:
+                snapshot[(section_name, None)] = _record(unique_section)
+        else:
+            sections = config._sections.get(section_name, {})
+            for recorded_id in sections if section_id == _Config.DEFAULT_KEY else [section_id]:
+                if recorded_id not in sections:
+                    continue
+                if isinstance(sections, _LazySections) and not sections._is_built(recorded_id):
+                    snapshot[(section_name, recorded_id)] = None
+                else:
+                    snapshot[(section_name, recorded_id)] = _record(sections[recorded_id])
+    return snapshot
+
+
+def _record(section) -> Tuple[str, Dict[str, Any]]:
+    return section._fingerprint(), section._to_dict()
+
+
+def _diff_snapshots(snapshot_1: _Snapshot, snapshot_2: _Snapshot) -> List[_ChangeKey]:
+    """List the keys of the values that differ between two snapshots, like `_diff_configs()` does for configs.
+
+    A section that is not built yet in one of the snapshots is only reported if it was added or removed.
+    """
+    changes: Dict[_ChangeKey, None] = {}
+    for section_key in _union(snapshot_1, snapshot_2):
+        section_name, section_id = section_key
+        if section_key not in snapshot_1 or section_key not in snapshot_2:
+            changes[(section_name, section_id, None)] = None
+            continue
+        record_1, record_2 = snapshot_1[section_key], snapshot_2[section_key]
+        if record_1 is None or record_2 is None or record_1[0] == record_2[0]:
+            continue
+        _diff_dicts(changes, section_name, section_id, record_1[1], record_2[1])
+    return list(changes)
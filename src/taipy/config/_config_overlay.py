@@ -0,0 +1,166 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections.abc import Mapping
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .common._template_handler import _TemplateHandler as _tpl
+from .exceptions.exceptions import ConfigurationUpdateBlocked
+from .section import Section
+from .unique_section import UniqueSection
+
+_OverlayKey = Tuple[str, Optional[str]]
+_Overlay = Dict[_OverlayKey, Dict[str, Any]]
+
+_current_overlay: ContextVar[Optional[_Overlay]] = ContextVar("taipy_config_overlay", default=None)
+
+
+class _OverlaidSection:
+    """Read view of a section, or of the `GlobalAppConfig^`, where some values are replaced by the ones of an overlay.
+
+    The other attributes are read from the section itself, which is never copied nor modified by the overlay. The
+    sections referenced by the values read are wrapped in views of the same overlay. The view reports the class of the
+    section, so `isinstance()` checks behave as for the section.
+
+    The view is read-only: setting an attribute raises a `ConfigurationUpdateBlocked^` exception, since the section is
+    shared with the other contexts. Besides the attributes and `properties`, only `_to_dict()` returns the overlaid
+    values. The other methods, like `_update()` or `_fingerprint()`, are the ones of the section and ignore the overlay.
+    """
+
+    __slots__ = ("_overlay_section", "_overlay_values", "_overlay")
+
+    def __init__(self, section, values: Dict[str, Any], overlay: _Overlay):
+        object.__setattr__(self, "_overlay_section", section)
+        object.__setattr__(self, "_overlay_values", values)
+        object.__setattr__(self, "_overlay", overlay)
+
+    def __getattribute__(self, item: str):
+        if item in _OverlaidSection.__slots__:
+            return object.__getattribute__(self, item)
+        values = object.__getattribute__(self, "_overlay_values")
+        overlay = object.__getattribute__(self, "_overlay")
+        if item in values:
+            return _overlay_references(_tpl._replace_templates(values[item]), overlay)
+        section = object.__getattribute__(self, "_overlay_section")
+        if item == "properties":
+            section_class = section.__class__
+            properties = section.properties
+            properties.update(
+                (key, _tpl._replace_templates(value))
+                for key, value in values.items()
+                if not isinstance(getattr(section_class, key, None), property)
+            )
+            return {key: _overlay_references(value, overlay) for key, value in properties.items()}
+        if item == "_to_dict":
+            return lambda: {**section._to_dict(), **values}
+        return _overlay_references(getattr(section, item), overlay)
+
+    def __setattr__(self, key, value):
+        raise ConfigurationUpdateBlocked(f"A section read with an overlay can not be modified. Attribute: `{key}`.")
+
+    def __repr__(self):
+        return repr(object.__getattribute__(self, "_overlay_section"))
+
+
+class _OverlaidMapping(Mapping):
+    """Read view of a mapping of the applied config where the values read are wrapped by a function.
+
+    The view holds the mapping of the applied config read when it was created.
+    """
+
+    def __init__(self, mapping: Mapping, wrap):
+        self._mapping = mapping
+        self._wrap = wrap
+
+    def __getitem__(self, key):
+        return self._wrap(self._mapping[key])
+
+    def __iter__(self) -> Iterator:
+        return iter(self._mapping)
+
+    def __len__(self) -> int:
+        return len(self._mapping)
+
+    def __contains__(self, key) -> bool:
+        return key in self._mapping
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {dict(self.items())}>"
+
+
+def _get_overlay() -> Optional[_Overlay]:
+    return _current_overlay.get()
+
+
+def _merge_overlay(overlay: Optional[_Overlay], values: _Overlay) -> _Overlay:
+    """Return a new overlay made of *overlay* where the values of *values* take precedence."""
+    merged = dict(overlay) if overlay else {}
+    for key, section_values in values.items():
+        merged[key] = {**merged[key], **section_values} if key in merged else dict(section_values)
+    return merged
+
+
+def _overlay_unique_sections(unique_sections: Mapping, overlay: _Overlay) -> Mapping:
+    if not overlay:
+        return unique_sections
+    return _OverlaidMapping(unique_sections, lambda section: _overlay_referenced_section(section, overlay))
+
+
+def _overlay_sections(sections: Mapping, overlay: _Overlay) -> Mapping:
+    if not overlay:
+        return sections
+    return _OverlaidMapping(
+        sections,
+        lambda entity_configs: _OverlaidMapping(
+            entity_configs, lambda section: _overlay_referenced_section(section, overlay)
+        ),
+    )
+
+
+def _overlay_section(section, overlay: _Overlay, key: _OverlayKey):
+    if (values := overlay.get(key, None)) is None:
+        return section
+    return _OverlaidSection(section, values, overlay)
+
+
+def _overlay_referenced_section(section, overlay: _Overlay):
+    # A section without overlaid values is only wrapped if it references other sections, which may be overlaid.
+    key = (section.name, None if isinstance(section, UniqueSection) else section.id)
+    if (values := overlay.get(key, None)) is None and not _references_sections(section):
+        return section
+    return _OverlaidSection(section, values or {}, overlay)
+
+
+def _references_sections(section) -> bool:
+    if not isinstance(section, Section):
+        return False
+    return bool(section._nested_references()) or any(isinstance(value, Section) for value in vars(section).values())
+
+
+def _overlay_references(value, overlay: _Overlay):
+    """Wrap the sections found in a value, at any depth of its lists, tuples and dictionaries, in overlaid views.
+
+    The lists, tuples and dictionaries holding sections are copied, the other values are returned as is.
+    """
+    if isinstance(value, Section):
+        return _overlay_referenced_section(value, overlay)
+    if isinstance(value, (list, tuple)):
+        items = [_overlay_references(item, overlay) for item in value]
+        if all(item is original for item, original in zip(items, value)):
+            return value
+        return items if isinstance(value, list) else tuple(items)
+    if isinstance(value, dict):
+        items = {key: _overlay_references(item, overlay) for key, item in value.items()}
+        if all(items[key] is item for key, item in value.items()):
+            return value
+        return items
+    return value
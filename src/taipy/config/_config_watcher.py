@@ -0,0 +1,226 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..logger._taipy_logger import _TaipyLogger
+from ._config_comparator._config_diff import _ChangeKey
+
+
+class _PollingBackend:
+    """Detect the changes of files by comparing their status at regular intervals."""
+
+    def __init__(self, poll_interval: float, stop_event: threading.Event):
+        self._poll_interval = poll_interval
+        self.__stop_event = stop_event
+        self.__files: Dict[str, Optional[Tuple[int, int, int]]] = {}
+
+    def _watch(self, filenames: Iterable[str]):
+        self.__files = {filename: self.__files.get(filename, self.__stat(filename)) for filename in filenames}
+
+    def _wait(self, timeout: float) -> Set[str]:
+        """Wait for at most *timeout* seconds, and return the watched files that changed meanwhile."""
+        self.__stop_event.wait(min(timeout, self._poll_interval))
+        changed = set()
+        for filename, previous_stat in self.__files.items():
+            if (current_stat := self.__stat(filename)) != previous_stat:
+                self.__files[filename] = current_stat
+                changed.add(filename)
+        return changed
+
+    def _close(self):
+        self.__files = {}
+
+    @staticmethod
+    def __stat(filename: str) -> Optional[Tuple[int, int, int]]:
+        try:
+            file_stat = os.stat(filename)
+        except OSError:
+            return None
+        return file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size
+
+
+class _InotifyBackend:
+    """Detect the changes of files with the Linux inotify API.
+
+    The directories of the files are watched rather than the files themselves, since editors and atomic writes replace
+    a file by renaming another one over it.
+    """
+
+    _IN_MODIFY = 0x00000002
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_TO = 0x00000080
+    _IN_CREATE = 0x00000100
+    _IN_DELETE = 0x00000200
+    _IN_NONBLOCK = 0o4000
+    _IN_CLOEXEC = 0o2000000
+    _MASK = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    _EVENT = struct.Struct("iIII")
+    _BUFFER_SIZE = 64 * 1024
+
+    def __init__(self):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.__add_watch = libc.inotify_add_watch
+        self.__add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.__fd = libc.inotify_init1(self._IN_NONBLOCK | self._IN_CLOEXEC)
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.__directories: Dict[int, str] = {}
+        self.__files: Set[str] = set()
+
+    @classmethod
+    def _is_available(cls) -> bool:
+        return sys.platform.startswith("linux") and bool(ctypes.util.find_library("c"))
+
+    def _watch(self, filenames: Iterable[str]):
+        self.__files = set(filenames)
+        watched_directories = set(self.__directories.values())
+        for directory in {os.path.dirname(filename) for filename in self.__files} - watched_directories:
+            watch_descriptor = self.__add_watch(self.__fd, os.fsencode(directory), self._MASK)
+            if watch_descriptor < 0:
+                raise OSError(ctypes.get_errno(), f"Can not watch directory '{directory}'")
+            self.__directories[watch_descriptor] = directory
+
+    def _wait(self, timeout: float) -> Set[str]:
+        """Wait for at most *timeout* seconds, and return the watched files that changed meanwhile."""
+        deadline = time.monotonic() + timeout
+        # Events about the other files of the directories, like the temporary file of an atomic write, are skipped.
+        while (remaining := deadline - time.monotonic()) > 0:
+            if changed := self.__read_events(remaining):
+                return changed
+        return set()
+
+    def __read_events(self, timeout: float) -> Set[str]:
+        readable, _, _ = select.select([self.__fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            buffer = os.read(self.__fd, self._BUFFER_SIZE)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(buffer):
+            watch_descriptor, _, _, name_length = self._EVENT.unpack_from(buffer, offset)
+            offset += self._EVENT.size
+            name = os.fsdecode(buffer[offset : offset + name_length].rstrip(b"\0"))
+            offset += name_length
+            if (directory := self.__directories.get(watch_descriptor)) is not None:
+                if (filename := os.path.join(directory, name)) in self.__files:
+                    changed.add(filename)
+        return changed
+
+    def _close(self):
+        os.close(self.__fd)
+
+
+class _ConfigWatcher:
+    """Reload the configuration when the files it was read from change.
+
+    The watcher runs in a daemon thread. Changes are detected with inotify when available, and by polling the status
+    of the files otherwise. The changes happening within the debounce window of a first one are reloaded together, so
+    a file written in several steps is only reloaded once.
+
+    Args:
+        get_files (Callable[[], Iterable[str]]): Return the paths of the files to watch. It is called again after each
+            reload, since the files to watch may change.
+        reload (Callable[[Set[str]], List[_ChangeKey]]): Reload the files whose paths are given, and return the
+            (section name, section id, attribute) keys that changed.
+        debounce (float): The debounce window in seconds.
+        poll_interval (float): The interval in seconds between two checks of the files when polling. With inotify,
+            it bounds the time taken by `stop()`.
+        use_inotify (bool): If False, or if inotify is not available, the files are polled.
+    """
+
+    def __init__(
+        self,
+        get_files: Callable[[], Iterable[str]],
+        reload: Callable[[Set[str]], List[_ChangeKey]],
+        debounce: float = 0.2,
+        poll_interval: float = 1.0,
+        use_inotify: bool = True,
+    ):
+        self.__logger = _TaipyLogger._get_logger()
+        self.__get_files = get_files
+        self.__reload = reload
+        self._debounce = debounce
+        self._poll_interval = poll_interval
+        self.__subscribers: List[Callable[[List[_ChangeKey]], None]] = []
+        self.__stop_event = threading.Event()
+        self.__backend = self.__create_backend(use_inotify, poll_interval)
+        self.__backend._watch(self.__get_watched_files())
+        self.__thread = threading.Thread(target=self.__run, name="TaipyConfigWatcher", daemon=True)
+
+    def subscribe(self, callback: Callable[[List[_ChangeKey]], None]):
+        """Call *callback* with the list of the (section name, section id, attribute) keys changed by each reload."""
+        self.__subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[List[_ChangeKey]], None]):
+        self.__subscribers.remove(callback)
+
+    @property
+    def is_alive(self) -> bool:
+        return self.__thread.is_alive()
+
+    def _start(self) -> "_ConfigWatcher":
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        """Stop watching the files and wait for the watcher thread to end."""
+        self.__stop_event.set()
+        if self.__thread.is_alive() and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__backend._close()
+
+    def __create_backend(self, use_inotify: bool, poll_interval: float):
+        if use_inotify and _InotifyBackend._is_available():
+            try:
+                return _InotifyBackend()
+            except (OSError, AttributeError) as e:
+                self.__logger.warning(f"Can not use inotify to watch the configuration files: {e}. Polling instead.")
+        return _PollingBackend(poll_interval, self.__stop_event)
+
+    def __get_watched_files(self) -> List[str]:
+        return [os.path.abspath(filename) for filename in self.__get_files()]
+
+    def __run(self):
+        while not self.__stop_event.is_set():
+            if not (changed_files := self.__backend._wait(self._poll_interval)):
+                continue
+            while not self.__stop_event.is_set() and (more_changed_files := self.__backend._wait(self._debounce)):
+                changed_files |= more_changed_files
+            if not self.__stop_event.is_set():
+                self._reload(changed_files)
+
+    def _reload(self, changed_files: Set[str]):
+        try:
+            changes = self.__reload(changed_files)
+        except Exception as e:
+            self.__logger.error(f"Can not reload the configuration files {sorted(changed_files)}: {e}")
+            return
+        finally:
+            self.__backend._watch(self.__get_watched_files())
+        if not changes:
+            return
+        for subscriber in list(self.__subscribers):
+            try:
+                subscriber(changes)
+            except Exception as e:
+                self.__logger.error(f"Configuration change subscriber {subscriber} failed: {e}")
@@ -0,0 +1,242 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .exceptions.exceptions import CyclicDependencyError
+from .unique_section import UniqueSection
+
+_SectionKey = Tuple[str, Optional[str]]
+
+
+class _DependencyGraph:
+    """Graph of the references between the sections of a config.
+
+    A section depends on the sections it references, whether they are held in lists, dictionaries or nested containers
+    of its attributes. The nodes of the graph are the (section name, section id) keys of the sections, the section id
+    being None for unique sections. Default sections are not part of the graph.
+
+    Each node is numbered, and the edges are stored as arrays of node numbers, one array of successors and one array of
+    predecessors per node. The direct dependencies and dependents of a section are then found in constant time, and
+    the other queries are linear in the number of nodes and edges visited.
+
+    The graph is refreshed from the config when it is queried. A compilation only marks the sections it changed, and
+    the next query reads the references of these sections again.
+    """
+
+    def __init__(self, config):
+        self._config = config
+        self._index: Dict[_SectionKey, int] = {}
+        self._keys: List[_SectionKey] = []
+        self._present: List[bool] = []
+        self._successors: List[List[int]] = []
+        self._predecessors: List[List[int]] = []
+        self.__rebuild = True
+        self.__stale_keys: Set[_SectionKey] = set()
+
+    def _invalidate(self, section_keys: Optional[Iterable[_SectionKey]] = None):
+        """Mark sections whose references must be read again on the next query.
+
+        Args:
+            section_keys (Optional[Iterable[Tuple[str, Optional[str]]]]): The (section name, section id) keys of the
+                sections that changed. A default section key stands for all the sections with the same name. If None,
+                the whole graph is rebuilt.
+        """
+        if section_keys is None:
+            self.__rebuild = True
+            self.__stale_keys.clear()
+        elif not self.__rebuild:
+            self.__stale_keys.update(section_keys)
+
+    def _successors_of(self, section_key: _SectionKey) -> List[_SectionKey]:
+        """Return the keys of the sections directly referenced by a section."""
+        self.__refresh()
+        if (node := self._index.get(section_key, None)) is None:
+            return []
+        return [self._keys[successor] for successor in self._successors[node]]
+
+    def _predecessors_of(self, section_key: _SectionKey) -> List[_SectionKey]:
+        """Return the keys of the sections directly referencing a section."""
+        self.__refresh()
+        if (node := self._index.get(section_key, None)) is None:
+            return []
+        return [self._keys[predecessor] for predecessor in self._predecessors[node]]
+
+    def _dependencies(self, section_key: _SectionKey) -> List[_SectionKey]:
+        """Return the keys of the sections a section depends on, directly or not, in breadth-first order."""
+        self.__refresh()
+        return self.__reachable(section_key, self._successors)
+
+    def _dependents(self, section_key: _SectionKey) -> List[_SectionKey]:
+        """Return the keys of the sections depending on a section, directly or not, in breadth-first order."""
+        self.__refresh()
+        return self.__reachable(section_key, self._predecessors)
+
+    def _topological_order(self) -> List[_SectionKey]:
+        """Return the keys of all the sections, each section coming after the sections it depends on.
+
+        Raises:
+            CyclicDependencyError: If sections reference each other in a cycle.
+        """
+        self.__refresh()
+        nb_nodes = len(self._keys)
+        nb_dependencies = [0] * nb_nodes
+        for node in range(nb_nodes):
+            if self._present[node]:
+                nb_dependencies[node] = sum(1 for successor in self._successors[node] if self._present[successor])
+        ready = deque(node for node in range(nb_nodes) if self._present[node] and nb_dependencies[node] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(self._keys[node])
+            for predecessor in self._predecessors[node]:
+                if self._present[predecessor]:
+                    nb_dependencies[predecessor] -= 1
+                    if nb_dependencies[predecessor] == 0:
+                        ready.append(predecessor)
+        if len(order) != sum(self._present):
+            cycles = ", ".join(" -> ".join(f"{name}:{id}" for name, id in cycle) for cycle in self._find_cycles())
+            raise CyclicDependencyError(f"Sections reference each other in a cycle: {cycles}.")
+        return order
+
+    def _find_cycles(self) -> List[List[_SectionKey]]:
+        """Return the groups of sections referencing each other in a cycle.
+
+        Each group is a strongly connected component of the graph with more than one section, or a single section
+        referencing itself.
+        """
+        self.__refresh()
+        cycles = []
+        for component in self.__strongly_connected_components():
+            node = component[0]
+            if len(component) > 1 or node in self._successors[node]:
+                cycles.append([self._keys[node] for node in sorted(component)])
+        return cycles
+
+    def __reachable(self, section_key: _SectionKey, adjacency: List[List[int]]) -> List[_SectionKey]:
+        if (start := self._index.get(section_key, None)) is None:
+            return []
+        visited = {start}
+        to_visit = deque([start])
+        reached = []
+        while to_visit:
+            for neighbour in adjacency[to_visit.popleft()]:
+                if neighbour not in visited:
+                    visited.add(neighbour)
+                    to_visit.append(neighbour)
+                    reached.append(self._keys[neighbour])
+        return reached
+
+    def __strongly_connected_components(self) -> List[List[int]]:
+        # Iterative Tarjan algorithm, so deep dependency chains do not hit the recursion limit.
+        nb_nodes = len(self._keys)
+        indices: List[Optional[int]] = [None] * nb_nodes
+        low_links = [0] * nb_nodes
+        on_stack = [False] * nb_nodes
+        stack: List[int] = []
+        components = []
+        next_index = 0
+        for root in range(nb_nodes):
+            if indices[root] is not None or not self._present[root]:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, position = work.pop()
+                if position == 0:
+                    indices[node] = low_links[node] = next_index
+                    next_index += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = self._successors[node]
+                while position < len(successors):
+                    successor = successors[position]
+                    position += 1
+                    if indices[successor] is None:
+                        if self._present[successor]:
+                            work.append((node, position))
+                            work.append((successor, 0))
+                            break
+                    elif on_stack[successor]:
+                        low_links[node] = min(low_links[node], indices[successor])  # type: ignore
+                else:
+                    if low_links[node] == indices[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        components.append(component)
+                    if work:
+                        parent = work[-1][0]
+                        low_links[parent] = min(low_links[parent], low_links[node])
+        return components
+
+    def __refresh(self):
+        if self.__rebuild:
+            self.__rebuild = False
+            self._index, self._keys, self._present, self._successors, self._predecessors = {}, [], [], [], []
+            for section_name, section in self._config._unique_sections.items():
+                self.__refresh_node((section_name, None), section)
+            for section_name, sections in self._config._sections.items():
+                for section_id in list(sections):
+                    if section_id != self._config.DEFAULT_KEY:
+                        self.__refresh_node((section_name, section_id), sections.get(section_id, None))
+            return
+        if not self.__stale_keys:
+            return
+        stale_keys, self.__stale_keys = self.__stale_keys, set()
+        for section_name, section_id in stale_keys:
+            if section_name == self._config.GLOBAL_KEY:
+                continue
+            if section_id is None:
+                self.__refresh_node((section_name, None), self._config._unique_sections.get(section_name, None))
+                continue
+            sections = self._config._sections.get(section_name, {})
+            if section_id != self._config.DEFAULT_KEY:
+                self.__refresh_node((section_name, section_id), sections.get(section_id, None))
+                continue
+            # All the sections with this name inherit from the default one.
+            section_ids = dict.fromkeys(key[1] for key in self._keys if key[0] == section_name)
+            section_ids.update(dict.fromkeys(sections))
+            for other_id in section_ids:
+                if other_id not in (None, self._config.DEFAULT_KEY):
+                    self.__refresh_node((section_name, other_id), sections.get(other_id, None))
+
+    def __refresh_node(self, section_key: _SectionKey, section):
+        node = self.__node(section_key)
+        for successor in self._successors[node]:
+            self._predecessors[successor].remove(node)
+        self._successors[node] = successors = []
+        self._present[node] = section is not None
+        if section is None:
+            return
+        index, predecessors = self._index, self._predecessors
+        seen: Set[int] = set()
+        for nested_section in section._nested_sections():
+            nested_key = (nested_section.name, None if isinstance(nested_section, UniqueSection) else nested_section.id)
+            if (successor := index.get(nested_key, None)) is None:
+                successor = self.__node(nested_key)
+            if successor not in seen:
+                seen.add(successor)
+                successors.append(successor)
+                predecessors[successor].append(node)
+
+    def __node(self, section_key: _SectionKey) -> int:
+        if (node := self._index.get(section_key, None)) is None:
+            node = self._index[section_key] = len(self._keys)
+            self._keys.append(section_key)
+            self._present.append(False)
+            self._successors.append([])
+            self._predecessors.append([])
+        return node
@@ -0,0 +1,164 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Tuple, Type
+
+from ._config import _Config
+from .exceptions.exceptions import ConfigurationUpdateBlocked
+from .global_app.global_app_config import GlobalAppConfig
+from .section import Section
+
+
+def _copy_containers(value, copy_section: Callable[[Section], Any]):
+    """Copy the lists, tuples and dictionaries of a value at any depth, and the sections they hold with a function."""
+    if isinstance(value, Section):
+        return copy_section(value)
+    if isinstance(value, list):
+        return [_copy_containers(item, copy_section) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_copy_containers(item, copy_section) for item in value)
+    if isinstance(value, dict):
+        return {key: _copy_containers(item, copy_section) for key, item in value.items()}
+    return value
+
+
+class _FrozenSection:
+    """Immutable snapshot of a `Section^` or of the `GlobalAppConfig^`.
+
+    The snapshot of a section is an instance of a subclass of both `_FrozenSection` and the class of the section. The
+    values of all the properties defined by the section class are stored in slots, and the other properties of the
+    section in a read-only mapping. All the values are resolved when the snapshot is taken, including the `ENV[...]`
+    templates. Like for the section, reading a property that is not set returns None. `_to_dict()` returns the values
+    of the section as they were set, before being resolved.
+    """
+
+    __slots__ = ("id", "name", "properties", "_as_dict")
+
+    __classes: Dict[Tuple[Type, Tuple[str, ...]], Type["_FrozenSection"]] = {}
+
+    def __getattr__(self, item: str) -> Any:
+        # Only called when the item is neither a slot nor defined by the section class, so it can only be a property.
+        if item.startswith("__") or item in _FrozenSection.__slots__:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{item}'")
+        return self.properties.get(item, None)
+
+    def _to_dict(self) -> Dict[str, Any]:
+        return _copy_containers(self._as_dict, lambda section: section)
+
+    def __setattr__(self, key, value):
+        raise ConfigurationUpdateBlocked(f"The frozen configuration can not be modified. Attribute: `{key}`.")
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.name} {self.id}>"
+
+    @classmethod
+    def _new(cls, section, attribute_names: Tuple[str, ...]) -> "_FrozenSection":
+        key = (section.__class__, attribute_names)
+        if (frozen_class := cls.__classes.get(key, None)) is None:
+            frozen_class = type(
+                f"_Frozen{section.__class__.__name__}", (cls, section.__class__), {"__slots__": attribute_names}
+            )
+            cls.__classes[key] = frozen_class
+        return object.__new__(frozen_class)
+
+
+class _FrozenConfig:
+    """Immutable and read-optimized snapshot of a `_Config`."""
+
+    __slots__ = ("sections", "unique_sections", "global_config")
+
+    def __setattr__(self, key, value):
+        raise ConfigurationUpdateBlocked(f"The frozen configuration can not be modified. Attribute: `{key}`.")
+
+    @classmethod
+    def _from_config(cls, config: _Config) -> "_FrozenConfig":
+        """Take a snapshot of a config.
+
+        Nested sections are replaced by their own snapshot, lists by tuples and dictionaries by read-only mappings.
+
+        Raises:
+            MissingEnvVariableError: If an environment variable used in a template is not set.
+        """
+        frozen_sections: Dict[int, _FrozenSection] = {}
+        sections_to_freeze = list(config._unique_sections.values())
+        for sections in config._sections.values():
+            sections_to_freeze.extend(sections.values())
+        attribute_names = {id(section): cls.__get_attribute_names(section) for section in sections_to_freeze}
+        for section in sections_to_freeze:
+            frozen_sections[id(section)] = _FrozenSection._new(section, attribute_names[id(section)])
+        for section in sections_to_freeze:
+            cls.__fill(frozen_sections[id(section)], section, attribute_names[id(section)], frozen_sections)
+
+        frozen_config = object.__new__(cls)
+        object.__setattr__(
+            frozen_config,
+            "unique_sections",
+            MappingProxyType({name: frozen_sections[id(s)] for name, s in config._unique_sections.items()}),
+        )
+        object.__setattr__(
+            frozen_config,
+            "sections",
+            MappingProxyType(
+                {
+                    name: MappingProxyType({section_id: frozen_sections[id(s)] for section_id, s in sections.items()})
+                    for name, sections in config._sections.items()
+                }
+            ),
+        )
+        global_attribute_names = cls.__get_attribute_names(config._global_config)
+        global_config = _FrozenSection._new(config._global_config, global_attribute_names)
+        cls.__fill(global_config, config._global_config, global_attribute_names, frozen_sections)
+        object.__setattr__(frozen_config, "global_config", global_config)
+        return frozen_config
+
+    @staticmethod
+    def __get_attribute_names(section) -> Tuple[str, ...]:
+        # All the properties defined by the class of the section, including the computed ones.
+        names = {
+            name
+            for section_class in section.__class__.__mro__
+            for name, value in vars(section_class).items()
+            if isinstance(value, property)
+        }
+        return tuple(sorted(names.difference(_FrozenSection.__slots__)))
+
+    @classmethod
+    def __fill(cls, frozen_section: _FrozenSection, section, attribute_names, frozen_sections: Dict[int, Any]):
+        if isinstance(section, GlobalAppConfig):
+            object.__setattr__(frozen_section, "id", None)
+            object.__setattr__(frozen_section, "name", None)
+        else:
+            object.__setattr__(frozen_section, "id", section.id)
+            object.__setattr__(frozen_section, "name", section.name)
+        as_dict = _copy_containers(section._to_dict(), lambda value: frozen_sections.get(id(value), value))
+        object.__setattr__(frozen_section, "_as_dict", as_dict)
+        properties = {
+            key: cls.__freeze_value(value, frozen_sections)
+            for key, value in section.properties.items()
+            if key not in attribute_names
+        }
+        object.__setattr__(frozen_section, "properties", MappingProxyType(properties))
+        for attribute_name in attribute_names:
+            value = cls.__freeze_value(getattr(section, attribute_name), frozen_sections)
+            object.__setattr__(frozen_section, attribute_name, value)
+
+    @classmethod
+    def __freeze_value(cls, value, frozen_sections: Dict[int, Any]):
+        if isinstance(value, Section):
+            return frozen_sections.get(id(value), value)
+        if isinstance(value, (list, tuple)):
+            return tuple(cls.__freeze_value(v, frozen_sections) for v in value)
+        if isinstance(value, (set, frozenset)):
+            return frozenset(cls.__freeze_value(v, frozen_sections) for v in value)
+        if isinstance(value, Mapping):
+            return MappingProxyType({k: cls.__freeze_value(v, frozen_sections) for k, v in value.items()})
+        return value
@@ -0,0 +1,103 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, Optional, Set
+
+from .section import Section
+
+
+class _LazySections(MutableMapping):
+    """Mapping of section ids to the sections of a given name, where sections are built on first access.
+
+    A pending entry holds the payload the section is built from, for instance the dictionary parsed from a
+    configuration file. The builder is called with the section id and this payload the first time the entry is
+    accessed, then the built section replaces the payload. Iterating over the ids, checking if an id is in the mapping
+    and counting the entries do not build any section.
+
+    While a section is being built, it is hidden from the mapping, so a section referencing itself, directly or not,
+    does not build it again. Sections are built under a lock, so a section accessed by several threads at once is
+    built only once and the other threads wait for it.
+    """
+
+    _build_lock = threading.RLock()
+
+    def __init__(self, builder: Callable[[str, Any], Section], sections: Optional[Dict[str, Section]] = None):
+        self._builder = builder
+        self._entries: Dict[str, Any] = dict(sections) if sections else {}
+        self._pending: Set[str] = set()
+        self._building: Set[str] = set()
+
+    def _add_pending(self, section_id: str, payload: Any = None):
+        self._entries[section_id] = payload
+        self._pending.add(section_id)
+
+    def _is_built(self, section_id: str) -> bool:
+        return section_id in self._entries and section_id not in self._pending
+
+    def _copy(self) -> "_LazySections":
+        """Return a copy of the mapping, sharing its builder and its sections, built or not."""
+        with self._build_lock:
+            lazy_sections = _LazySections(self._builder)
+            lazy_sections._entries = dict(self._entries)
+            lazy_sections._pending = set(self._pending)
+        return lazy_sections
+
+    def _discard_pending(self):
+        for section_id in self._pending:
+            del self._entries[section_id]
+        self._pending.clear()
+
+    def __getitem__(self, section_id: str) -> Section:
+        # The section replaces the payload before the entry stops being pending, so a built entry is never read as a
+        # payload.
+        if section_id not in self._pending:
+            return self._entries[section_id]
+        with self._build_lock:
+            # Another thread may have built the section while this one was waiting for the lock.
+            if section_id not in self._pending:
+                return self._entries[section_id]
+            entry = self._entries[section_id]
+            if section_id in self._building:
+                raise KeyError(section_id)
+            self._building.add(section_id)
+            try:
+                section = self._builder(section_id, entry)
+            finally:
+                self._building.discard(section_id)
+            self._entries[section_id] = section
+            self._pending.discard(section_id)
+            return section
+
+    def __setitem__(self, section_id: str, section: Section):
+        self._entries[section_id] = section
+        self._pending.discard(section_id)
+
+    def __delitem__(self, section_id: str):
+        del self._entries[section_id]
+        self._pending.discard(section_id)
+
+    def __contains__(self, section_id) -> bool:
+        return section_id in self._entries and section_id not in self._building
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __reduce__(self):
+        # The builder can not be pickled, so all the sections are built and pickled as a plain dictionary.
+        return dict, (dict(self.items()),)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {len(self._entries)} sections, {len(self._pending)} not built>"
@@ -10,13 +10,17 @@
 # specific language governing permissions and limitations under the License.
 
 import inspect
-import re
+import sys
 import types
 from abc import abstractmethod
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 from .._config import _Config
+from .._lazy_sections import _LazySections
+from ..common._lazy_reference import _LazyReference
+from ..common._section_reference import _SectionReference
 from ..common._template_handler import _TemplateHandler
 from ..common._validate_id import _validate_id
 from ..common.frequency import Frequency
@@ -25,6 +29,7 @@ from ..exceptions.exceptions import LoadingError
 from ..global_app.global_app_config import GlobalAppConfig
 from ..section import Section
 from ..unique_section import UniqueSection
+from ._file_writer import _FileWriter
 
 
 class _BaseSerializer(object):
@@ -32,24 +37,146 @@ class _BaseSerializer(object):
 
     _GLOBAL_NODE_NAME = "TAIPY"
     _section_class = {_GLOBAL_NODE_NAME: GlobalAppConfig}
+    _TYPE_DECODERS: Dict[str, Callable[[str], Any]] = {
+        "bool": _TemplateHandler._to_bool,
+        "str": str,
+        "int": _TemplateHandler._to_int,
+        "float": _TemplateHandler._to_float,
+        "datetime": _TemplateHandler._to_datetime,
+        "timedelta": _TemplateHandler._to_timedelta,
+        "function": _TemplateHandler._to_function,
+        "class": _TemplateHandler._to_class,
+        "SCOPE": lambda val: Scope[val],
+        "FREQUENCY": lambda val: Frequency[val],
+        "SECTION": _SectionReference,
+    }
+    _LAZY_TYPES = ("function", "class")
+    _SHAREABLE_TYPES = (str, int, float, bool, datetime, timedelta, Scope, Frequency)
+    _lazy_resolution = False
+    _lazy_sections = False
+    _compact_storage = False
+    _atomic_write = False
+    _write_buffer_size = -1
+    _fsync = False
+    _skip_unchanged = False
+
+    @classmethod
+    def _set_lazy_resolution(cls, lazy: bool):
+        """Choose when the functions and classes of the configuration files are resolved.
+
+        Args:
+            lazy (bool): If True, the `:function` and `:class` values read from a file are resolved the first time
+                they are accessed instead of when the file is loaded. An invalid path then raises on access.
+        """
+        _BaseSerializer._lazy_resolution = lazy
+
+    @classmethod
+    def _set_lazy_sections(cls, lazy: bool):
+        """Choose when the non unique sections of the configuration files are built.
+
+        Args:
+            lazy (bool): If True, each non unique section read from a file is built the first time it is accessed
+                instead of when the file is loaded. The sections of the applied configuration are then built on first
+                access as well, unless they are also configured in Python. The `id:SECTION` references of a section are
+                resolved when it is built, and the ones that can not be resolved are kept as ids.
+        """
+        _BaseSerializer._lazy_sections = lazy
+
+    @classmethod
+    def _set_compact_storage(cls, compact: bool):
+        """Choose whether the values read from the configuration files are shared between sections.
+
+        Args:
+            compact (bool): If True, the strings read from a file are interned, and the values decoded from equal
+                type-tagged strings, such as `"1:int"` or `"SCENARIO:SCOPE"`, are a single object. Configurations with
+                many sections using the same values then use much less memory. The keys read from a file are always
+                interned.
+        """
+        _BaseSerializer._compact_storage = compact
+
+    @classmethod
+    def _set_write_options(
+        cls,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        skip_unchanged: Optional[bool] = None,
+    ):
+        """Choose how the configuration files are written. The options that are None are left unchanged.
+
+        Args:
+            atomic (Optional[bool]): If True, a file is written to a temporary file of the same directory first, which
+                then replaces it. Readers never see a partially written file.
+            buffer_size (Optional[int]): The size of the write buffer in bytes, -1 for the default size.
+            fsync (Optional[bool]): If True, the written file is flushed to disk before the write returns.
+            skip_unchanged (Optional[bool]): If True, a file whose content would not change is not rewritten. The
+                content is then kept in memory until it is compared with the file.
+        """
+        if atomic is not None:
+            _BaseSerializer._atomic_write = atomic
+        if buffer_size is not None:
+            _BaseSerializer._write_buffer_size = buffer_size
+        if fsync is not None:
+            _BaseSerializer._fsync = fsync
+        if skip_unchanged is not None:
+            _BaseSerializer._skip_unchanged = skip_unchanged
+
+    @classmethod
+    def _open_for_write(
+        cls,
+        filename: str,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        skip_unchanged: Optional[bool] = None,
+    ) -> _FileWriter:
+        """Open a file to write. The write options that are None take the values set by `_set_write_options()`."""
+        return _FileWriter(
+            filename,
+            atomic=_BaseSerializer._atomic_write if atomic is None else atomic,
+            buffer_size=_BaseSerializer._write_buffer_size if buffer_size is None else buffer_size,
+            fsync=_BaseSerializer._fsync if fsync is None else fsync,
+            skip_unchanged=_BaseSerializer._skip_unchanged if skip_unchanged is None else skip_unchanged,
+        )
 
     @classmethod
     @abstractmethod
-    def _write(cls, configuration: _Config, filename: str):
+    def _write(cls, configuration: _Config, filename: str, **write_options):
+        """Write a configuration to a file.
+
+        Args:
+            configuration (_Config): The configuration to write.
+            filename (str): The path of the file to write.
+            **write_options: The write options of `_open_for_write()`.
+        """
         raise NotImplementedError
 
     @classmethod
     def _str(cls, configuration: _Config):
-        config_as_dict = {cls._GLOBAL_NODE_NAME: configuration._global_config._to_dict()}
-        for u_sect_name, u_sect in configuration._unique_sections.items():
-            config_as_dict[u_sect_name] = u_sect._to_dict()
+        config_as_dict = dict(cls._iter_unique_nodes(configuration))
         for sect_name, sections in configuration._sections.items():
             config_as_dict[sect_name] = cls._to_dict(sections)
-        return cls._stringify(config_as_dict)
+        return config_as_dict
 
     @classmethod
     def _to_dict(cls, sections: Dict[str, Any]):
-        return {section_id: section._to_dict() for section_id, section in sections.items()}
+        return dict(cls._iter_sections(sections))
+
+    @classmethod
+    def _iter_unique_nodes(cls, configuration: _Config) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield the name and the stringified dictionary of the global config and of each unique section, one at a time.
+
+        Writers use it with `_iter_sections()` to stream a configuration without converting it all at once.
+        """
+        yield cls._GLOBAL_NODE_NAME, cls._stringify(configuration._global_config._to_dict())
+        for u_sect_name, u_sect in configuration._unique_sections.items():
+            yield str(u_sect_name), cls._stringify(u_sect._to_dict())
+
+    @classmethod
+    def _iter_sections(cls, sections: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Yield the id and the stringified dictionary of each of the non-unique sections given, one at a time."""
+        for section_id, section in sections.items():
+            yield str(section_id), cls._stringify(section._to_dict())
 
     @classmethod
     def _stringify(cls, as_dict):
@@ -57,6 +184,8 @@ class _BaseSerializer(object):
             return None
         if isinstance(as_dict, Section):
             return as_dict.id + ":SECTION"
+        if isinstance(as_dict, _SectionReference):
+            return as_dict + ":SECTION"
         if isinstance(as_dict, Scope):
             return as_dict.name + ":SCOPE"
         if isinstance(as_dict, Frequency):
@@ -71,6 +200,8 @@ class _BaseSerializer(object):
             return as_dict.isoformat() + ":datetime"
         if isinstance(as_dict, timedelta):
             return cls._timedelta_to_str(as_dict) + ":timedelta"
+        if isinstance(as_dict, _LazyReference):
+            return f"{as_dict.path}:{as_dict.type_tag}"
         if inspect.isfunction(as_dict) or isinstance(as_dict, types.BuiltinFunctionType):
             return as_dict.__module__ + "." + as_dict.__name__ + ":function"
         if inspect.isclass(as_dict):
@@ -85,6 +216,15 @@ class _BaseSerializer(object):
 
     @staticmethod
     def _extract_node(config_as_dict, cls_config, node, config: Optional[Any]) -> Dict[str, Section]:
+        if _BaseSerializer._lazy_sections:
+            lazy_res = _LazySections(
+                lambda key, value: _BaseSerializer._resolve_references_when_built(
+                    cls_config._from_dict(value, key, config), config
+                )
+            )
+            for key, value in config_as_dict.get(node, {}).items():
+                lazy_res._add_pending(_validate_id(key), value)
+            return lazy_res  # type: ignore
         res = {}
         for key, value in config_as_dict.get(node, {}).items():  # my_task, {input=[], output=[my_data_node], ...}
             key = _validate_id(key)
@@ -104,50 +244,174 @@ class _BaseSerializer(object):
                     )  # type: ignore
                 elif issubclass(section_class, Section):
                     config._sections[section_name] = cls._extract_node(as_dict, section_class, section_name, config)
+        if _BaseSerializer._lazy_sections:
+            for unique_section in config._unique_sections.values():
+                cls._resolve_references_when_built(unique_section, config)
+        else:
+            cls.__resolve_references(config)
         return config
 
+    @classmethod
+    def __resolve_references(cls, config: _Config):
+        """Replace the `id:SECTION` references left in the attributes of the sections of a config by the sections.
+
+        The sections are indexed by name and id once, then the attributes of each section are walked once. The cost is
+        linear in the size of the configuration, and does not depend on the order of the sections in the file. The
+        properties keep the ids, since only the section classes know which of their properties are references.
+
+        A reference is looked up in the section names its attribute designates, see `Section._REFERENCED_SECTION_NAMES`.
+        Otherwise, it is looked up by id in all the sections, and kept as an id if several sections match it. A
+        reference matching no section is kept as an id too, since a file can override a configuration defined
+        elsewhere, and reference sections the file does not contain. The ids left are reported by the checkers of the
+        compiled configuration.
+        """
+        sections_by_key: Dict[Tuple[str, str], Section] = {}
+        sections_by_id: Dict[str, List[Section]] = {}
+        for section_name, section in config._unique_sections.items():
+            sections_by_key[(section_name, section_name)] = section
+            sections_by_id.setdefault(section_name, []).append(section)
+        for section_name, sections in config._sections.items():
+            for section_id, section in sections.items():
+                if section_id != _Config.DEFAULT_KEY:
+                    sections_by_key[(section_name, section_id)] = section
+                    sections_by_id.setdefault(section_id, []).append(section)
+
+        def find_sections(section_names: Optional[Tuple[str, ...]], section_id: str) -> List[Section]:
+            if section_names is None:
+                return sections_by_id.get(section_id, [])
+            for section_name in section_names:
+                if (section := sections_by_key.get((section_name, section_id), None)) is not None:
+                    return [section]
+            return []
+
+        for section in config._unique_sections.values():
+            cls.__resolve_section_references(section, find_sections)
+        for sections in config._sections.values():
+            for section in sections.values():
+                cls.__resolve_section_references(section, find_sections)
+
+    @staticmethod
+    def _resolve_references_when_built(section: Section, config: _Config) -> Section:
+        """Replace the `id:SECTION` references of a section of a config with lazy sections, keeping unresolved ones."""
+        _BaseSerializer.__resolve_section_references(section, partial(_BaseSerializer.__find_sections, config))
+        return section
+
+    @staticmethod
+    def __find_sections(config: _Config, section_names: Optional[Tuple[str, ...]], section_id: str) -> List[Section]:
+        # Lazy sections are only built if they are found, and a section being built is not found.
+        if section_names is None:
+            found = [config._unique_sections[section_id]] if section_id in config._unique_sections else []
+            if section_id != _Config.DEFAULT_KEY:
+                found.extend(sections[section_id] for sections in config._sections.values() if section_id in sections)
+            return found
+        for section_name in section_names:
+            if section_name == section_id and section_name in config._unique_sections:
+                return [config._unique_sections[section_name]]
+            sections = config._sections.get(section_name, {})
+            if section_id != _Config.DEFAULT_KEY and section_id in sections:
+                return [sections[section_id]]
+        return []
+
+    @classmethod
+    def __resolve_section_references(
+        cls,
+        section: Section,
+        find_sections: Callable[[Optional[Tuple[str, ...]], str], List[Section]],
+    ):
+        referenced_section_names = section._REFERENCED_SECTION_NAMES
+        for attribute_name, container, key, reference in cls.__find_section_references(section):
+            candidates = find_sections(referenced_section_names.get(attribute_name, None), reference)
+            if len(candidates) != 1:
+                continue
+            if container is None:
+                setattr(section, key, candidates[0])
+            else:
+                container[key] = candidates[0]
+
+    @staticmethod
+    def __find_section_references(section: Section) -> List[Tuple[str, Any, Any, _SectionReference]]:
+        # The (attribute name, container, key, reference) of each reference, the container being None for an attribute
+        # of the section.
+        references: List[Tuple[str, Any, Any, _SectionReference]] = []
+        to_visit = []
+        for attribute_name, value in vars(section).items():
+            if isinstance(value, _SectionReference):
+                references.append((attribute_name, None, attribute_name, value))
+            elif isinstance(value, (list, dict)) and attribute_name != "_properties":
+                to_visit.append((attribute_name, value))
+        while to_visit:
+            attribute_name, container = to_visit.pop()
+            for key, item in enumerate(container) if isinstance(container, list) else container.items():
+                if isinstance(item, _SectionReference):
+                    references.append((attribute_name, container, key, item))
+                elif isinstance(item, (list, dict)):
+                    to_visit.append((attribute_name, item))
+        return references
+
     @classmethod
     def _pythonify(cls, val):
-        match = re.fullmatch(_TemplateHandler._PATTERN, str(val))
-        if not match:
-            if isinstance(val, str):
-                TYPE_PATTERN = (
-                    r"^(.+):(\bbool\b|\bstr\b|\bint\b|\bfloat\b|\bdatetime\b||\btimedelta\b|"
-                    r"\bfunction\b|\bclass\b|\bSCOPE\b|\bFREQUENCY\b|\bSECTION\b)?$"
-                )
-                match = re.fullmatch(TYPE_PATTERN, str(val))
-                if match:
-                    actual_val = match.group(1)
-                    dynamic_type = match.group(2)
-                    if dynamic_type == "SECTION":
-                        return actual_val
-                    if dynamic_type == "FREQUENCY":
-                        return Frequency[actual_val]
-                    if dynamic_type == "SCOPE":
-                        return Scope[actual_val]
-                    if dynamic_type == "bool":
-                        return _TemplateHandler._to_bool(actual_val)
-                    elif dynamic_type == "int":
-                        return _TemplateHandler._to_int(actual_val)
-                    elif dynamic_type == "float":
-                        return _TemplateHandler._to_float(actual_val)
-                    elif dynamic_type == "datetime":
-                        return _TemplateHandler._to_datetime(actual_val)
-                    elif dynamic_type == "timedelta":
-                        return _TemplateHandler._to_timedelta(actual_val)
-                    elif dynamic_type == "function":
-                        return _TemplateHandler._to_function(actual_val)
-                    elif dynamic_type == "class":
-                        return _TemplateHandler._to_class(actual_val)
-                    elif dynamic_type == "str":
-                        return actual_val
-                    else:
-                        error_msg = f"Error loading toml configuration at {val}. {dynamic_type} type is not supported."
-                        raise LoadingError(error_msg)
-            if isinstance(val, dict):
-                return {str(k): cls._pythonify(v) for k, v in val.items()}
-            if isinstance(val, list):
-                return [cls._pythonify(v) for v in val]
+        """Convert the type-tagged strings of a value read from a file into Python objects.
+
+        The value is walked in a single iterative pass. Each container is visited once and is never converted to a
+        string, so the cost is linear in the size of the value whatever its nesting depth.
+        """
+        shared: Optional[Dict[str, Any]] = {} if _BaseSerializer._compact_storage else None
+        if isinstance(val, str):
+            return cls.__decode_shared_str(val, shared)
+        if not isinstance(val, (dict, list)):
+            return val
+        result: Any = {} if isinstance(val, dict) else []
+        to_visit = [(val, result)]
+        while to_visit:
+            source, target = to_visit.pop()
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    target[sys.intern(str(key))] = cls.__decode(value, to_visit, shared)
+            else:
+                for value in source:
+                    target.append(cls.__decode(value, to_visit, shared))
+        return result
+
+    @classmethod
+    def __decode(cls, val, to_visit: List, shared: Optional[Dict[str, Any]]):
+        if isinstance(val, str):
+            return cls.__decode_shared_str(val, shared)
+        if isinstance(val, dict):
+            decoded: Any = {}
+        elif isinstance(val, list):
+            decoded = []
+        else:
+            return val
+        to_visit.append((val, decoded))
+        return decoded
+
+    @classmethod
+    def __decode_shared_str(cls, val: str, shared: Optional[Dict[str, Any]]):
+        if shared is None:
+            return cls.__decode_str(val)
+        if (decoded := shared.get(val, None)) is not None:
+            return decoded
+        decoded = cls.__decode_str(val)
+        if type(decoded) is str:
+            decoded = sys.intern(decoded)
+        if isinstance(decoded, cls._SHAREABLE_TYPES):
+            shared[val] = decoded
+        return decoded
+
+    @classmethod
+    def __decode_str(cls, val: str):
+        actual_val, separator, dynamic_type = val.rpartition(":")
+        if not separator or not actual_val or "\n" in val:
+            return val
+        if val.startswith("ENV[") and _TemplateHandler._COMPILED_PATTERN.fullmatch(val):
+            return val
+        if decoder := cls._TYPE_DECODERS.get(dynamic_type, None):
+            if cls._lazy_resolution and dynamic_type in cls._LAZY_TYPES:
+                return _LazyReference(actual_val, dynamic_type, decoder)
+            return decoder(actual_val)
+        if not dynamic_type:
+            error_msg = f"Error loading toml configuration at {val}. {dynamic_type} type is not supported."
+            raise LoadingError(error_msg)
         return val
 
     @classmethod
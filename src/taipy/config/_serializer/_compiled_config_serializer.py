@@ -0,0 +1,82 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import hmac
+import pickle
+import struct
+import sys
+from typing import Optional, Tuple
+
+from .._config import _Config
+from ._file_writer import _FileWriter
+
+
+class _CompiledConfigSerializer:
+    """Write and read compiled configurations as a binary artifact.
+
+    The artifact starts with a fixed size header made of a magic number, the version of the artifact format, the
+    version of Python and the digest of the configuration layers the configurations were compiled from. An HMAC-SHA256
+    of the header and of the pickled configurations follows, then the pickled configurations. An artifact whose header
+    or HMAC does not match is never unpickled.
+
+    Without a key, the HMAC only detects corrupted artifacts: anyone able to write the artifact can make it run code
+    when it is read. The artifact must then be stored in a trusted location, not shared with other users.
+    """
+
+    _MAGIC = b"TAIPYCFG"
+    _FORMAT_VERSION = 2
+    _HEADER = struct.Struct(">8sHBB32s")
+    _TAG_SIZE = hashlib.sha256().digest_size
+
+    @classmethod
+    def _header(cls, layers_digest: bytes) -> bytes:
+        return cls._HEADER.pack(
+            cls._MAGIC, cls._FORMAT_VERSION, sys.version_info.major, sys.version_info.minor, layers_digest
+        )
+
+    @staticmethod
+    def _tag(key: Optional[bytes], header: bytes, payload: bytes) -> bytes:
+        tag = hmac.new(key or b"", header, hashlib.sha256)
+        tag.update(payload)
+        return tag.digest()
+
+    @classmethod
+    def _write(cls, configs: Tuple[_Config, ...], layers_digest: bytes, filename: str, key: Optional[bytes] = None):
+        header = cls._header(layers_digest)
+        payload = pickle.dumps(configs, protocol=pickle.HIGHEST_PROTOCOL)
+        # Written atomically, so concurrent processes never read a partially written artifact.
+        with _FileWriter(filename, atomic=True, binary=True) as f:
+            f.write(header)
+            f.write(cls._tag(key, header, payload))
+            f.write(payload)
+
+    @classmethod
+    def _read(cls, filename: str, layers_digest: bytes, key: Optional[bytes] = None) -> Optional[Tuple[_Config, ...]]:
+        """Read the configurations of an artifact.
+
+        Returns:
+            The configurations, or None if the artifact does not exist, was compiled from other layers, by another
+            version of the format or of Python, or with another key, or can not be unpickled.
+        """
+        try:
+            with open(filename, "rb") as f:
+                header = f.read(cls._HEADER.size)
+                if header != cls._header(layers_digest):
+                    return None
+                tag = f.read(cls._TAG_SIZE)
+                payload = f.read()
+            if not hmac.compare_digest(tag, cls._tag(key, header, payload)):
+                return None
+            return pickle.loads(payload)
+        except Exception:
+            # A missing or truncated artifact, or one referencing classes that moved, is simply compiled again.
+            return None
@@ -0,0 +1,143 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import io
+import os
+import secrets
+import shutil
+from contextlib import suppress
+from typing import IO, Iterable, Optional, Union
+
+
+class _FileWriter:
+    """Context manager writing a text or binary file.
+
+    In atomic mode, the content is written to a temporary file of the same directory, which replaces the destination
+    only once it is complete. Readers then see either the previous file or the new one, never a truncated one.
+    In skip-unchanged mode, the content is kept in memory and compared with the destination when the context exits.
+    The destination is left untouched if its content is the same, and no file is created.
+
+    Args:
+        filename (str): The path of the file to write.
+        atomic (bool): If True, write atomically.
+        buffer_size (int): The size of the write buffer in bytes, -1 for the default size.
+        fsync (bool): If True, flush the file to disk before closing it, and its directory after replacing it.
+        skip_unchanged (bool): If True, do not rewrite the destination when its content is the same.
+        binary (bool): If True, write bytes instead of text.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        atomic: bool = False,
+        buffer_size: int = -1,
+        fsync: bool = False,
+        skip_unchanged: bool = False,
+        binary: bool = False,
+    ):
+        self._filename = filename
+        self._atomic = atomic
+        self._buffer_size = buffer_size
+        self._fsync = fsync
+        self._binary = binary
+        self._content: Optional[io.BytesIO] = io.BytesIO() if skip_unchanged else None
+        self._tmp_filename: Optional[str] = None
+        self.written = False
+
+    def __enter__(self) -> "_FileWriter":
+        if self._content is None:
+            self._file: IO = self.__open(self._binary)
+        elif self._binary:
+            self._file = self._content
+        else:
+            # Encoded like `open()` would, with the default encoding and the newline translation of the text mode.
+            self._file = io.TextIOWrapper(self._content, write_through=True)
+        return self
+
+    def write(self, data: Union[str, bytes]):
+        self._file.write(data)
+
+    def writelines(self, data: Iterable[Union[str, bytes]]):
+        for chunk in data:
+            self.write(chunk)
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._content is not None:
+            if exc_type is not None:
+                return
+            self._file.flush()
+            content = self._content.getvalue()
+            if self.__has_content(self._filename, content):
+                return
+            self._file = self.__open(binary=True)
+            try:
+                self._file.write(content)
+            except BaseException as e:
+                self.__close(type(e))
+                raise
+        self.__close(exc_type)
+
+    def __open(self, binary: bool) -> IO:
+        mode = "wb" if binary else "w"
+        if not self._atomic:
+            return open(self._filename, mode, buffering=self._buffer_size)
+        directory, basename = os.path.split(os.path.abspath(self._filename))
+        self._tmp_filename = os.path.join(directory, f".{basename}.{secrets.token_hex(4)}.tmp")
+        # Unlike mkstemp, the permissions of the temporary file follow the umask like the ones of `open()`.
+        fd = os.open(self._tmp_filename, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        return open(fd, mode, buffering=self._buffer_size)
+
+    def __close(self, exc_type):
+        try:
+            if exc_type is None and self._fsync:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+        if not self._atomic:
+            self.written = exc_type is None
+            return
+        try:
+            if exc_type is not None:
+                os.remove(self._tmp_filename)
+                return
+            if os.path.exists(self._filename):
+                shutil.copymode(self._filename, self._tmp_filename)
+            os.replace(self._tmp_filename, self._filename)
+            self.written = True
+            if self._fsync:
+                self.__fsync_directory(os.path.dirname(os.path.abspath(self._filename)))
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.remove(self._tmp_filename)
+            raise
+
+    @staticmethod
+    def __has_content(filename: str, content: bytes) -> bool:
+        try:
+            # A file of another size is known to differ without being read.
+            if os.stat(filename).st_size != len(content):
+                return False
+            with open(filename, "rb") as f:
+                return f.read() == content
+        except OSError:
+            return False
+
+    @staticmethod
+    def __fsync_directory(directory: str):
+        # Directories can not be opened on Windows, where the rename is made durable by the file system.
+        if not hasattr(os, "O_DIRECTORY"):
+            return
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
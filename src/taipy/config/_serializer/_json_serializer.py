@@ -10,6 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import json  # type: ignore
+from typing import Any, Iterator
 
 from .._config import _Config
 from ..exceptions.exceptions import LoadingError
@@ -17,12 +18,36 @@ from ._base_serializer import _BaseSerializer
 
 
 class _JsonSerializer(_BaseSerializer):
-    """Convert configuration from JSON representation to Python Dict and reciprocally."""
+    """Convert configuration from JSON representation to Python Dict and reciprocally.
+
+    The configuration is written one section at a time, without building the dictionary of the whole configuration.
+    """
+
+    @classmethod
+    def _write(cls, configuration: _Config, filename: str, **write_options):
+        with cls._open_for_write(filename, **write_options) as fd:
+            fd.writelines(cls.__iter_chunks(configuration))
 
     @classmethod
-    def _write(cls, configuration: _Config, filename: str):
-        with open(filename, "w") as fd:
-            json.dump(cls._str(configuration), fd, ensure_ascii=False, indent=0, check_circular=False)
+    def __iter_chunks(cls, configuration: _Config) -> Iterator[str]:
+        # With no indentation, the JSON text of a node does not depend on its depth. So dumping the sections one at a
+        # time gives the same text as dumping the whole configuration at once.
+        separator = "{\n"
+        for node_name, node in cls._iter_unique_nodes(configuration):
+            yield f"{separator}{cls.__dumps(node_name)}: {cls.__dumps(node)}"
+            separator = ",\n"
+        for node_name, sections in configuration._sections.items():
+            yield f"{separator}{cls.__dumps(node_name)}: "
+            section_separator = "{\n"
+            for section_id, section in cls._iter_sections(sections):
+                yield f"{section_separator}{cls.__dumps(section_id)}: {cls.__dumps(section)}"
+                section_separator = ",\n"
+            yield "{}" if section_separator == "{\n" else "\n}"
+        yield "\n}"
+
+    @staticmethod
+    def __dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, indent=0, check_circular=False)
 
     @classmethod
     def _read(cls, filename: str) -> _Config:
@@ -36,7 +61,7 @@ class _JsonSerializer(_BaseSerializer):
 
     @classmethod
     def _serialize(cls, configuration: _Config) -> str:
-        return json.dumps(cls._str(configuration), ensure_ascii=False, indent=0, check_circular=False)
+        return "".join(cls.__iter_chunks(configuration))
 
     @classmethod
     def _deserialize(cls, config_as_string: str) -> _Config:
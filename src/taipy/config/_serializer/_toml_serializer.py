@@ -9,34 +9,130 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-import toml  # type: ignore
+import os
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterator, NamedTuple, Optional, Tuple, Type
 
 from .._config import _Config
 from ..exceptions.exceptions import LoadingError
 from ._base_serializer import _BaseSerializer
 
 
+class _TomlReader(NamedTuple):
+    name: str
+    loads: Callable[[str], Dict[str, Any]]
+    decode_error: Type[Exception]
+
+
+class _TomlWriter(NamedTuple):
+    name: str
+    dumps: Callable[[Dict[str, Any]], str]
+
+
+def _load_reader(name: str) -> Optional[_TomlReader]:
+    try:
+        module = import_module(name)
+    except ImportError:
+        return None
+    decode_error = module.TomlDecodeError if name == "toml" else module.TOMLDecodeError
+    return _TomlReader(name, module.loads, decode_error)
+
+
+def _load_writer(name: str) -> Optional[_TomlWriter]:
+    try:
+        module = import_module(name)
+    except ImportError:
+        return None
+    return _TomlWriter(name, module.dumps)
+
+
+def _select_backend(names: Tuple[str, ...], loader):
+    for name in names:
+        if backend := loader(name):
+            return backend
+    raise ImportError(f"No TOML library found. Please install one of: {', '.join(names)}.")
+
+
 class _TomlSerializer(_BaseSerializer):
-    """Convert configuration from TOML representation to Python Dict and reciprocally."""
+    """Convert configuration from TOML representation to Python Dict and reciprocally.
+
+    The TOML library used to read and write files is pluggable. Reading uses the first library available among
+    `tomllib` (Python 3.11+), `tomli` and `toml`. Writing uses `toml` by default, since the layout of the files it
+    writes is the one of the existing configuration files, and falls back to `tomli_w`. The backend in use therefore
+    depends on the Python version and on the libraries installed: `tomli` and `tomli_w` are installed with the
+    `fast-toml` extra of the package, and `_set_backend()` selects a library explicitly.
+
+    A configuration with at least `_STREAMING_THRESHOLD` sections is written one section at a time, without building
+    the dictionary of the whole configuration. The tables of each section are then grouped together, while `toml`
+    writes all the tables of a level before the tables of the next level. Both layouts are read identically.
+    """
+
+    _READERS = ("tomllib", "tomli", "toml")
+    _WRITERS = ("toml", "tomli_w")
+    _STREAMING_THRESHOLD = 1000
+
+    _reader: _TomlReader = _select_backend(_READERS, _load_reader)
+    _writer: _TomlWriter = _select_backend(_WRITERS, _load_writer)
+
+    @classmethod
+    def _set_backend(cls, reader: Optional[str] = None, writer: Optional[str] = None):
+        """Select the TOML libraries used to read and write the configuration.
+
+        Args:
+            reader (Optional[str]): The name of the library used to read TOML. One of "tomllib", "tomli" or "toml".
+            writer (Optional[str]): The name of the library used to write TOML. One of "toml" or "tomli_w".
+        Raises:
+            ImportError: If the requested library is not installed.
+        """
+        if reader:
+            cls._reader = _select_backend((reader,), _load_reader)
+        if writer:
+            cls._writer = _select_backend((writer,), _load_writer)
+
+    @classmethod
+    def _write(cls, configuration: _Config, filename: str, **write_options):
+        with cls._open_for_write(filename, **write_options) as fd:
+            if cls.__nb_sections(configuration) < cls._STREAMING_THRESHOLD:
+                fd.write(cls._writer.dumps(cls._str(configuration)))
+            else:
+                fd.writelines(cls.__iter_chunks(configuration))
+
+    @staticmethod
+    def __nb_sections(configuration: _Config) -> int:
+        return len(configuration._unique_sections) + sum(len(sections) for sections in configuration._sections.values())
 
     @classmethod
-    def _write(cls, configuration: _Config, filename: str):
-        with open(filename, "w") as fd:
-            toml.dump(cls._str(configuration), fd)
+    def __iter_chunks(cls, configuration: _Config) -> Iterator[str]:
+        separator = ""
+        for node_name, node in cls._iter_unique_nodes(configuration):
+            yield separator + cls._writer.dumps({node_name: node})
+            separator = "\n"
+        for node_name, sections in configuration._sections.items():
+            is_empty = True
+            for section_id, section in cls._iter_sections(sections):
+                yield separator + cls._writer.dumps({node_name: {section_id: section}})
+                is_empty = False
+            if is_empty:
+                yield separator + cls._writer.dumps({node_name: {}})
 
     @classmethod
     def _read(cls, filename: str) -> _Config:
         try:
-            config_as_dict = cls._pythonify(dict(toml.load(filename)))
+            if isinstance(filename, (str, bytes, os.PathLike)):
+                with open(filename, encoding="utf-8") as fd:
+                    config_as_string = fd.read()
+            else:
+                config_as_string = filename.read()
+            config_as_dict = cls._pythonify(dict(cls._reader.loads(config_as_string)))
             return cls._from_dict(config_as_dict)
-        except toml.TomlDecodeError as e:
+        except cls._reader.decode_error as e:
             error_msg = f"Can not load configuration {e}"
             raise LoadingError(error_msg)
 
     @classmethod
     def _serialize(cls, configuration: _Config) -> str:
-        return toml.dumps(cls._str(configuration))
+        return cls._writer.dumps(cls._str(configuration))
 
     @classmethod
     def _deserialize(cls, config_as_string: str) -> _Config:
-        return cls._from_dict(cls._pythonify(dict(toml.loads(config_as_string))))
+        return cls._from_dict(cls._pythonify(dict(cls._reader.loads(config_as_string))))
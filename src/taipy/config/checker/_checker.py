@@ -9,24 +9,187 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
-from typing import List
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+from typing import Any, Dict, List, NamedTuple, Optional, Set, Tuple, Type
 
+from ...logger._taipy_logger import _TaipyLogger
+from .._config import _Config
 from ._checkers._config_checker import _ConfigChecker
+from ._checkers._dependency_checker import _DependencyChecker
 from .issue_collector import IssueCollector
 
 
+class _CheckUnit(NamedTuple):
+    checker: Type[_ConfigChecker]
+    key: Tuple
+    section: Optional[Any]
+
+
+def _run_checker(checker_class: Type[_ConfigChecker], _applied_config, section=None) -> Tuple[IssueCollector, float]:
+    collector = IssueCollector()
+    start = perf_counter()
+    if section is None:
+        checker_class(_applied_config, collector)._check()
+    else:
+        checker_class(_applied_config, collector)._check_section(section)
+    return collector, perf_counter() - start
+
+
+_worker_config: Optional[_Config] = None
+
+
+def _init_worker(_applied_config):
+    # The config is sent once to each worker process, instead of once for each checker and section to check.
+    global _worker_config
+    _worker_config = _applied_config
+
+
+def _run_checker_in_worker(
+    checker_class: Type[_ConfigChecker], section_key: Optional[Tuple[str, Optional[str]]] = None
+) -> Tuple[IssueCollector, float]:
+    section = None if section_key is None else _Checker._get_section(_worker_config, *section_key)
+    return _run_checker(checker_class, _worker_config, section)
+
+
 class _Checker:
-    """Holds the various checkers to perform on the config."""
+    """Holds the various checkers to perform on the config.
+
+    By default, the checkers run one after the other. An executor can be selected with `_set_executor()` to run them
+    concurrently. In that case, each checker fills its own `IssueCollector^` and the collectors are merged in the
+    order in which the checkers were registered, so the issues reported do not depend on the executor.
+
+    The issues found are kept, so an incremental check only re-runs the checkers whose inspected sections were
+    modified since the previous check, as reported by `_Config._pop_modified_sections()`. See
+    `_ConfigChecker._SECTION_NAMES`.
+    """
+
+    _THREAD_EXECUTOR = "thread"
+    _PROCESS_EXECUTOR = "process"
+
+    _checkers: List[_ConfigChecker] = [_DependencyChecker]
+    _executor: Optional[str] = None
+    _max_workers: Optional[int] = None
+    _timings: Dict[str, float] = {}
 
-    _checkers: List[_ConfigChecker] = []
+    __logger = _TaipyLogger._get_logger()
+    # The lineage of the last config checked, shared by the applied configs replacing one another.
+    __checked_lineage: Optional[object] = None
+    __results: Dict[Tuple, Tuple[IssueCollector, float]] = {}
 
     @classmethod
-    def _check(cls, _applied_config):
+    def _set_executor(cls, executor: Optional[str] = None, max_workers: Optional[int] = None):
+        """Select how the checkers are run.
+
+        Args:
+            executor (Optional[str]): "thread" or "process" to run the checkers concurrently in a pool of the
+                corresponding kind, None to run them sequentially. With "process", the checker classes must be
+                importable and the applied config picklable. The config is sent once to each worker process.
+            max_workers (Optional[int]): The maximum number of workers of the pool. The default of the pool is used
+                if None.
+        Raises:
+            ValueError: If the executor is unknown.
+        """
+        if executor not in (None, cls._THREAD_EXECUTOR, cls._PROCESS_EXECUTOR):
+            raise ValueError(f"Unknown checker executor `{executor}`. Use `thread`, `process` or None.")
+        cls._executor = executor
+        cls._max_workers = max_workers
+
+    @classmethod
+    def _check(cls, _applied_config, incremental: bool = False):
+        """Run the checkers on the applied config.
+
+        Args:
+            _applied_config (_Config): The config to check.
+            incremental (bool): If True, the issues found by the previous check of the same config, or of the applied
+                config it replaced, are reused for the checkers and sections that were not modified since. Otherwise, all the checkers are run.
+        Returns:
+            The collector of all the issues found.
+        """
+        modified_sections = _applied_config._pop_modified_sections()
+        if not incremental or modified_sections is None or cls.__checked_lineage is not _applied_config._lineage:
+            cls.__results = {}
+            modified_sections = set()
+        cls.__checked_lineage = _applied_config._lineage
+
+        units = [unit for checker in cls._checkers for unit in cls.__get_units(checker, _applied_config)]
+        modified_names = {section_name for section_name, _ in modified_sections}
+        to_run = [unit for unit in units if cls.__is_outdated(unit, modified_sections, modified_names)]
+        run_keys = {unit.key for unit in to_run}
+        for unit, result in zip(to_run, cls.__run(to_run, _applied_config)):
+            cls.__results[unit.key] = result
+
         collector = IssueCollector()
-        for checker in cls._checkers:
-            checker(_applied_config, collector)._check()
+        timings: Dict[str, float] = {checker.__name__: 0.0 for checker in cls._checkers}
+        for unit in units:
+            unit_collector, elapsed = cls.__results[unit.key]
+            collector._errors.extend(unit_collector._errors)
+            collector._warnings.extend(unit_collector._warnings)
+            collector._infos.extend(unit_collector._infos)
+            timings[unit.checker.__name__] += elapsed if unit.key in run_keys else 0.0
+        cls.__results = {unit.key: cls.__results[unit.key] for unit in units}
+        cls._timings = timings
+        for checker_name, elapsed in timings.items():
+            cls.__logger.debug(f"Checker {checker_name} ran in {elapsed:.6f}s.")
         return collector
 
+    @classmethod
+    def __get_units(cls, checker: Type[_ConfigChecker], _applied_config) -> List[_CheckUnit]:
+        if not checker._CHECKS_EACH_SECTION or checker._SECTION_NAMES is None:
+            return [_CheckUnit(checker, (checker,), None)]
+        return [
+            _CheckUnit(checker, (checker, section_name, section_id), section)
+            for section_name in checker._SECTION_NAMES
+            for section_id, section in cls.__get_sections(_applied_config, section_name)
+        ]
+
+    @staticmethod
+    def __get_sections(_applied_config, section_name: str) -> List[Tuple[Optional[str], Any]]:
+        # The section id is None for the global config and the unique sections, as in the modified section keys.
+        if section_name == _Config.GLOBAL_KEY:
+            return [(None, _applied_config._global_config)]
+        if section := _applied_config._unique_sections.get(section_name, None):
+            return [(None, section)]
+        return list(_applied_config._sections.get(section_name, {}).items())
+
+    @staticmethod
+    def _get_section(_applied_config, section_name: str, section_id: Optional[str]):
+        if section_name == _Config.GLOBAL_KEY:
+            return _applied_config._global_config
+        if section_name in _applied_config._unique_sections:
+            return _applied_config._unique_sections[section_name]
+        return _applied_config._sections[section_name][section_id]
+
+    @classmethod
+    def __is_outdated(
+        cls, unit: _CheckUnit, modified_sections: Set[Tuple[str, Optional[str]]], modified_names: Set[str]
+    ) -> bool:
+        if unit.checker._SECTION_NAMES is None or unit.key not in cls.__results:
+            return True
+        if unit.section is None:
+            return any(section_name in modified_names for section_name in unit.checker._SECTION_NAMES)
+        # A modified default section stands for all the sections with the same name, which inherit from it.
+        section_name = unit.key[1]
+        return unit.key[1:] in modified_sections or (section_name, _Config.DEFAULT_KEY) in modified_sections
+
+    @classmethod
+    def __run(cls, units: List[_CheckUnit], _applied_config) -> List[Tuple[IssueCollector, float]]:
+        if cls._executor is None or len(units) < 2:
+            return [_run_checker(unit.checker, _applied_config, unit.section) for unit in units]
+        max_workers = min(cls._max_workers or len(units), len(units))
+        if cls._executor == cls._PROCESS_EXECUTOR:
+            # The workers look the sections up by their (section name, section id) key in their own copy of the config.
+            section_keys = [unit.key[1:] if unit.section is not None else None for unit in units]
+            with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(_applied_config,)) as executor:
+                futures = [
+                    executor.submit(_run_checker_in_worker, unit.checker, section_key)
+                    for unit, section_key in zip(units, section_keys)
+                ]
+                return [future.result() for future in futures]
+        with ThreadPoolExecutor(max_workers) as executor:
+            futures = [executor.submit(_run_checker, unit.checker, _applied_config, unit.section) for unit in units]
+            return [future.result() for future in futures]
+
     @classmethod
     def add_checker(cls, checker_class: _ConfigChecker):
         cls._checkers.append(checker_class)
@@ -10,7 +10,7 @@
 # specific language governing permissions and limitations under the License.
 
 import abc
-from typing import Any, List, Optional, Set
+from typing import Any, List, Optional, Set, Tuple
 
 from ..._config import _Config
 from ..issue_collector import IssueCollector
@@ -20,6 +20,13 @@ class _ConfigChecker:
 
     _PREDEFINED_PROPERTIES_KEYS = ["_entity_owner"]
 
+    # Names of the sections inspected by the checker. The issues it found are reused by incremental checks as long as
+    # these sections are not modified. None means the checker may inspect anything, so it is always re-run.
+    _SECTION_NAMES: Optional[Tuple[str, ...]] = None
+    # If True, the checker inspects each section of `_SECTION_NAMES` independently with `_check_section()`, so only
+    # the modified sections are checked again by incremental checks.
+    _CHECKS_EACH_SECTION: bool = False
+
     def __init__(self, config: _Config, collector):
         self._collector = collector
         self._config = config
@@ -28,6 +35,13 @@ class _ConfigChecker:
     def _check(self) -> IssueCollector:
         raise NotImplementedError
 
+    def _check_section(self, section) -> IssueCollector:
+        """Check a single section, called instead of `_check()` on each section if `_CHECKS_EACH_SECTION` is True.
+
+        The default implementation checks nothing.
+        """
+        return self._collector
+
     def _error(self, field: str, value: Any, message: str):
         self._collector._add_error(field, value, message, self.__class__.__name__)
 
@@ -64,6 +78,15 @@ class _ConfigChecker:
                     f"of {child_config_class.__name__} objects.",
                 )
 
+    def _check_no_cyclic_dependency(self):
+        for cycle in self._config._dependency_graph()._find_cycles():
+            cycle_as_str = " -> ".join(f"{section_name}:{section_id}" for section_name, section_id in cycle)
+            self._error(
+                "sections",
+                cycle,
+                f"Sections {cycle_as_str} reference each other in a cycle.",
+            )
+
     def _check_existing_config_id(self, config):
         if not config.id:
             self._error(
@@ -0,0 +1,21 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from ..issue_collector import IssueCollector
+from ._config_checker import _ConfigChecker
+
+
+class _DependencyChecker(_ConfigChecker):
+    """Report the sections referencing each other in a cycle, using the dependency graph of the config."""
+
+    def _check(self) -> IssueCollector:
+        self._check_no_cyclic_dependency()
+        return self._collector
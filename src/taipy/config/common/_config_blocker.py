@@ -13,6 +13,7 @@ import functools
 
 from ...logger._taipy_logger import _TaipyLogger
 from ..exceptions.exceptions import ConfigurationUpdateBlocked
+from ._fingerprint import _Fingerprinted
 
 
 class _ConfigBlocker:
@@ -43,7 +44,13 @@ class _ConfigBlocker:
                     cls.__logger.error("ConfigurationUpdateBlocked: " + error_message)
                     raise ConfigurationUpdateBlocked(error_message)
 
-                return f(*args, **kwargs)
+                # The checked methods are the ones modifying the configuration. The caches of the configuration objects
+                # are invalidated before, so they are not used while it is modified, and after.
+                _Fingerprinted._invalidate_fingerprints()
+                try:
+                    return f(*args, **kwargs)
+                finally:
+                    _Fingerprinted._invalidate_fingerprints()
 
             return _check_if_is_blocking
 
@@ -0,0 +1,64 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import functools
+import threading
+from typing import Callable, List
+
+
+class _ConfigLock:
+    """Lock serializing the updates of the configuration singleton.
+
+    Readers do not take the lock. The updates build a new applied config and publish it with a single assignment, so
+    readers never wait and never see a partially compiled configuration.
+
+    The functions registered with `_call_when_released()` while the lock is held are called once the outermost
+    synchronized call releases it, so they can wait for other threads updating the configuration.
+    """
+
+    _lock = threading.RLock()
+    __depth = 0
+    __pending_calls: List[Callable[[], None]] = []
+
+    @classmethod
+    def _synchronized(cls):
+        def inner(f):
+            @functools.wraps(f)
+            def _call_with_lock(*args, **kwargs):
+                pending_calls = []
+                try:
+                    with cls._lock:
+                        cls.__depth += 1
+                        try:
+                            return f(*args, **kwargs)
+                        finally:
+                            cls.__depth -= 1
+                            if cls.__depth == 0:
+                                pending_calls, cls.__pending_calls = cls.__pending_calls, []
+                finally:
+                    for call in pending_calls:
+                        call()
+
+            return _call_with_lock
+
+        return inner
+
+    @classmethod
+    def _call_when_released(cls, call: Callable[[], None]):
+        """Call a function once the current synchronized call releases the lock, or now outside of synchronized calls.
+
+        The depth of the synchronized calls is only modified by the thread holding the lock, so this must only be called
+        by a synchronized call or outside of any.
+        """
+        if cls.__depth:
+            cls.__pending_calls.append(call)
+        else:
+            call()
@@ -0,0 +1,68 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import hashlib
+import inspect
+import json
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+
+class _Fingerprinted:
+    """Mixin giving a configuration object a content fingerprint, computed from its `_to_dict()` value and cached.
+
+    The cached fingerprints are all invalidated at once when the configuration is modified, that is when a config is
+    compiled and after each call to a method checked by the `_ConfigBlocker`, like the setters of the sections and the
+    `Config` methods registering or loading sections. A list or dictionary of a section modified in place, without
+    going through such a method, is only taken into account after the next modification of the configuration.
+    """
+
+    # Replaced by a new object on each modification of the configuration. Unlike a counter, an object is never equal
+    # to the one of a fingerprint unpickled from another process.
+    _epoch: object = object()
+    _fingerprint_cache: Optional[Tuple[object, str]] = None
+
+    @staticmethod
+    def _invalidate_fingerprints():
+        """Invalidate the cached fingerprints of all the configuration objects, and the other caches sharing the epoch."""
+        _Fingerprinted._epoch = object()
+
+    def _fingerprint(self) -> str:
+        """Return the fingerprint of the object. Two objects with equal `_to_dict()` values share their fingerprint."""
+        epoch = _Fingerprinted._epoch
+        if (cache := self._fingerprint_cache) is not None and cache[0] is epoch:
+            return cache[1]
+        fingerprint = _Fingerprinted._of_dict(self._to_dict())  # type: ignore
+        # Set like a slot-less attribute, since the snapshots of frozen configurations reject assignments.
+        object.__setattr__(self, "_fingerprint_cache", (epoch, fingerprint))
+        return fingerprint
+
+    @staticmethod
+    def _of_dict(as_dict: Dict[str, Any]) -> str:
+        try:
+            encoded = json.dumps(as_dict, sort_keys=True, default=_Fingerprinted.__encode, ensure_ascii=False)
+        except TypeError:
+            # Keys of different types can not be sorted.
+            encoded = json.dumps(as_dict, default=_Fingerprinted.__encode, ensure_ascii=False)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def __encode(value: Any):
+        if isinstance(value, _Fingerprinted):
+            # A nested section is only referenced by its id, like when it is serialized.
+            return f"{getattr(value, 'name', None)}:{getattr(value, 'id', None)}:SECTION"
+        if isinstance(value, Enum):
+            return f"{type(value).__qualname__}.{value.name}"
+        if inspect.isfunction(value) or inspect.isbuiltin(value) or inspect.isclass(value):
+            return f"{value.__module__}.{value.__qualname__}"
+        if isinstance(value, (set, frozenset)):
+            return sorted(value, key=repr)
+        return repr(value)
@@ -0,0 +1,140 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, Optional, Set
+
+_MISSING = object()
+# Inherited by the mappings inheriting nothing, never modified.
+_NOTHING_INHERITED: Dict[str, Any] = {}
+
+
+class _InheritedProperties(MutableMapping):
+    """Properties of a section made of its own properties and of the properties inherited from a default section.
+
+    It reads like `{**inherited, **own}`, with the same order of keys, but the inherited properties are shared and never
+    copied nor modified: the writes go to the own properties, and the inherited properties deleted are only recorded
+    as such. Clearing the mapping also drops the inherited properties.
+
+    The own properties can be shared too, for instance between the sections of two config layers holding the same
+    properties. Shared own properties are copied on the first write, and writing the value a property already holds
+    does not copy them.
+
+    Args:
+        own (Dict[str, Any]): The properties of the section, modified in place unless *shared* is True.
+        inherited (Dict[str, Any]): The properties inherited, never modified.
+        deleted (Optional[Set[str]]): The inherited properties deleted, if any.
+        shared (bool): If True, *own* is shared with other mappings, and copied before being modified.
+    """
+
+    __slots__ = ("_own", "_inherited", "_deleted", "_shared")
+
+    def __init__(
+        self,
+        own: Dict[str, Any],
+        inherited: Dict[str, Any],
+        deleted: Optional[Set[str]] = None,
+        shared: bool = False,
+    ):
+        self._own = own
+        self._inherited = inherited
+        self._deleted = deleted
+        self._shared = shared
+
+    @staticmethod
+    def _shared_by(own: Dict[str, Any]) -> "_InheritedProperties":
+        """Return a mapping of the properties *own*, inheriting nothing, and copying *own* before modifying it."""
+        return _InheritedProperties(own, _NOTHING_INHERITED, shared=True)
+
+    def _writable_own(self) -> Dict[str, Any]:
+        if self._shared:
+            self._own = dict(self._own)
+            self._shared = False
+        return self._own
+
+    def __getitem__(self, key: str):
+        try:
+            return self._own[key]
+        except KeyError:
+            if self._deleted and key in self._deleted:
+                raise
+            return self._inherited[key]
+
+    def get(self, key: str, default=None):
+        if key in self._own:
+            return self._own[key]
+        if self._deleted and key in self._deleted:
+            return default
+        return self._inherited.get(key, default)
+
+    def __contains__(self, key) -> bool:
+        return key in self._own or (key in self._inherited and not (self._deleted and key in self._deleted))
+
+    def __setitem__(self, key: str, value):
+        if self._shared and self._own.get(key, _MISSING) is value:
+            return
+        self._writable_own()[key] = value
+        if self._deleted:
+            self._deleted.discard(key)
+
+    def __delitem__(self, key: str):
+        if key not in self:
+            raise KeyError(key)
+        if key in self._own:
+            del self._writable_own()[key]
+        if key in self._inherited:
+            if self._deleted is None:
+                self._deleted = set()
+            self._deleted.add(key)
+
+    def __iter__(self) -> Iterator[str]:
+        if not self._inherited:
+            # Nothing is inherited, and so nothing is deleted, like for the properties shared between config layers.
+            return iter(self._own)
+        return self.__merged_keys()
+
+    def __merged_keys(self) -> Iterator[str]:
+        deleted = self._deleted
+        for key in self._inherited:
+            if not (deleted and key in deleted):
+                yield key
+        for key in self._own:
+            if key not in self._inherited:
+                yield key
+
+    def __len__(self) -> int:
+        if not self._inherited:
+            return len(self._own)
+        return sum(1 for _ in self)
+
+    def items(self):
+        if not self._inherited:
+            return self._own.items()
+        return super().items()
+
+    def clear(self):
+        if self._shared:
+            self._own = {}
+            self._shared = False
+        else:
+            self._own.clear()
+        self._inherited = _NOTHING_INHERITED
+        self._deleted = None
+
+    def copy(self) -> "_InheritedProperties":
+        # The copy shares the own properties of self, copied by the first of the two mappings modifying them.
+        self._shared = True
+        return _InheritedProperties(self._own, self._inherited, set(self._deleted) if self._deleted else None, True)
+
+    __copy__ = copy
+
+    def __repr__(self):
+        return repr(dict(self.items()))
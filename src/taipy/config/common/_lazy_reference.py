@@ -0,0 +1,69 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from typing import Any, Callable
+
+_UNRESOLVED = object()
+
+
+class _LazyReference:
+    """Placeholder for a function or a class read from a configuration file and not resolved yet.
+
+    The reference is resolved, then memoized, the first time the value is read through the template handler, and it
+    is serialized back as the type-tagged string it was read from.
+
+    A placeholder read without the template handler, for example from an attribute returned as is by a section,
+    stands for the function or the class: calling it calls the function or instantiates the class, and its public
+    attributes, `__name__`, `__qualname__` and `__bases__` are the ones of the function or the class. It is resolved
+    on the first such use. It is not an instance of the type of the function or the class though, since checking
+    the type of a value must not import it.
+    """
+
+    __slots__ = ("path", "type_tag", "_resolver", "_value")
+
+    # Special attributes read on functions and classes. The other ones, such as `__deepcopy__` or `__reduce__`, are
+    # looked up by copy and pickle on the placeholder itself.
+    _DELEGATED_SPECIAL_ATTRIBUTES = frozenset(
+        ("__name__", "__qualname__", "__bases__", "__mro__", "__wrapped__", "__annotations__", "__defaults__")
+    )
+
+    def __init__(self, path: str, type_tag: str, resolver: Callable[[str], Any]):
+        self.path = path
+        self.type_tag = type_tag
+        self._resolver = resolver
+        self._value = _UNRESOLVED
+
+    def _resolve(self) -> Any:
+        if self._value is _UNRESOLVED:
+            self._value = self._resolver(self.path)
+        return self._value
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, item: str) -> Any:
+        # Only called for the attributes the placeholder does not have.
+        if item in _LazyReference.__slots__ or (
+            item.startswith("__") and item not in _LazyReference._DELEGATED_SPECIAL_ATTRIBUTES
+        ):
+            raise AttributeError(item)
+        return getattr(self._resolve(), item)
+
+    def __eq__(self, other):
+        if isinstance(other, _LazyReference):
+            return self.path == other.path and self.type_tag == other.type_tag
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.path, self.type_tag))
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {self.path}:{self.type_tag}>"
@@ -0,0 +1,92 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import functools
+from typing import Any, Dict, List, Optional, Tuple
+
+from ._fingerprint import _Fingerprinted
+from ._template_handler import _TemplateHandler as _tpl
+
+
+class _ResolvedProperties:
+    """Mixin reading the values of the `_properties` dictionary of a configuration object as attributes.
+
+    The values are read with their templates replaced. A resolved value that does not depend on an environment
+    variable is stored as an attribute of the object, so the next reads find it without calling `__getattr__()`. The
+    other resolved values are cached per object, and reused as long as their environment variables do not change.
+
+    The stored values and the cache are dropped after each call to the `_update()` and `_clean()` methods of a
+    subclass. A subclass replacing or modifying its properties otherwise must call `_forget_resolved_properties()`.
+    """
+
+    _resolved_properties: Optional[Dict[str, Tuple[Any, Any, Tuple]]] = None
+    _stored_property_names: Optional[List[str]] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for method_name in ("_update", "_clean"):
+            method = vars(cls).get(method_name, None)
+            if method is not None and not getattr(method, "__isabstractmethod__", False):
+                setattr(cls, method_name, _ResolvedProperties.__forgetting_resolved_properties(method))
+
+    @staticmethod
+    def __forgetting_resolved_properties(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                self._forget_resolved_properties()
+
+        return wrapper
+
+    def _forget_resolved_properties(self):
+        """Drop the resolved values stored or cached by the object, to resolve them again on the next reads."""
+        if self._resolved_properties is None and self._stored_property_names is None:
+            # Returns before reading `vars()`, which would allocate the attributes dictionary of most objects.
+            return
+        attributes = vars(self)
+        if (names := attributes.pop("_stored_property_names", None)) is not None:
+            for name in names:
+                attributes.pop(name, None)
+        # Removed rather than set to None, so the objects never resolved do not grow their attributes.
+        attributes.pop("_resolved_properties", None)
+
+    def _resolution_cache(self) -> Dict[str, Tuple[Any, Any, Tuple]]:
+        if (cache := self._resolved_properties) is None:
+            cache = {}
+            # Filling the cache does not change the content, so the fingerprint is kept.
+            object.__setattr__(self, "_resolved_properties", cache)
+        return cache
+
+    def __getattr__(self, item: str) -> Optional[Any]:
+        if item.startswith("__") or item == "_properties":
+            # Special attributes looked up by pickle or copy are never properties, and neither are the properties
+            # themselves, missing from an object created without calling `__init__()`.
+            raise AttributeError(item)
+        properties = self._properties
+        if item not in properties:
+            return None
+        cache = self._resolution_cache()
+        value = _tpl._replace_templates_with_cache(cache, item, properties[item])
+        if (cached := cache.get(item, None)) is not None and not cached[2] and not self.__is_mutable(value):
+            # Stored after the other attributes, so `__getattr__()` is no longer called for it.
+            if (names := self._stored_property_names) is None:
+                names = []
+                object.__setattr__(self, "_stored_property_names", names)
+            names.append(item)
+            vars(self)[item] = value
+        return value
+
+    @staticmethod
+    def __is_mutable(value) -> bool:
+        # A section referenced by a property is replaced in place when the configuration is compiled.
+        return isinstance(value, (list, dict, set, _Fingerprinted))
@@ -0,0 +1,23 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+
+class _SectionReference(str):
+    """Id of a section read from a configuration file as an `id:SECTION` value, and not resolved yet.
+
+    It is equal to the id, so section classes can look it up like any id. It is serialized back as the type-tagged
+    string it was read from.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} {str(self)}>"
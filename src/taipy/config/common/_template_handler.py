@@ -13,11 +13,14 @@ import os
 import re
 from collections import UserDict
 from datetime import datetime, timedelta
+from functools import lru_cache
 from importlib import import_module
 from operator import attrgetter
 from pydoc import locate
+from typing import Any, Dict, Optional, Tuple
 
 from ..exceptions.exceptions import InconsistentEnvVariableError, MissingEnvVariableError
+from ._lazy_reference import _LazyReference
 from .frequency import Frequency
 from .scope import Scope
 
@@ -26,9 +29,44 @@ class _TemplateHandler:
     """Factory to handle actions related to config value templating."""
 
     _PATTERN = r"^ENV\[([a-zA-Z_]\w*)\](:(\bbool\b|\bstr\b|\bfloat\b|\bint\b))?$"
+    _COMPILED_PATTERN = re.compile(_PATTERN)
+    _RESOLUTION_CACHE_SIZE = 1024
+
+    @classmethod
+    def _replace_templates_with_cache(cls, cache: Dict[str, Tuple[Any, Any, Tuple]], key: str, template):
+        """Replace the templates of a value, reusing the value resolved by a previous call when it is still valid.
+
+        A resolved value is stored in *cache* under *key*, together with the template it was resolved from and the
+        values of the environment variables it depends on. It is reused as long as the template is the same object
+        and these environment variables did not change. Lists and dictionaries are mutable, so they are never cached.
+
+        Args:
+            cache (Dict[str, Tuple[Any, Any, Tuple]]): The cache of resolved values, usually one per section.
+            key (str): The key of the value in the cache, usually the property name.
+            template (Any): The value to replace templates in.
+        """
+        cached = cache.get(key)
+        if cached is not None and cached[0] is template:
+            if not cached[2] or all(os.environ.get(var) == val for var, val in cached[2]):
+                return cached[1]
+        resolved = cls._replace_templates(template)
+        if not isinstance(template, (list, dict, UserDict)):
+            cache[key] = (template, resolved, cls.__get_env_variables(template))
+        return resolved
+
+    @classmethod
+    def __get_env_variables(cls, template) -> Tuple[Tuple[str, Optional[str]], ...]:
+        templates = template if isinstance(template, tuple) else (template,)
+        env_variables = []
+        for tpl in templates:
+            if isinstance(tpl, str) and "ENV" in tpl and (match := cls._COMPILED_PATTERN.fullmatch(tpl)):
+                env_variables.append((match.group(1), os.environ.get(match.group(1))))
+        return tuple(env_variables)
 
     @classmethod
     def _replace_templates(cls, template, type=str, required=True, default=None):
+        if isinstance(template, str):
+            return cls._replace_template(template, type, required, default)
         if isinstance(template, tuple):
             return tuple(cls._replace_template(item, type, required, default) for item in template)
         if isinstance(template, list):
@@ -41,9 +79,11 @@ class _TemplateHandler:
 
     @classmethod
     def _replace_template(cls, template, type, required, default):
-        if "ENV" not in str(template):
+        if not isinstance(template, str):
+            return template._resolve() if isinstance(template, _LazyReference) else template
+        if "ENV" not in template:
             return template
-        match = re.fullmatch(cls._PATTERN, str(template))
+        match = cls._COMPILED_PATTERN.fullmatch(template)
         if match:
             var = match.group(1)
             dynamic_type = match.group(3)
@@ -138,14 +178,34 @@ class _TemplateHandler:
     def _to_function(val: str):
         module_name, fct_name = val.rsplit(".", 1)
         try:
-            module = import_module(module_name)
-            return attrgetter(fct_name)(module)
+            return _TemplateHandler.__import_function(module_name, fct_name)
         except Exception:
             raise InconsistentEnvVariableError(f"{val} is not a valid function.")
 
     @staticmethod
     def _to_class(val: str):
         try:
-            return locate(val)
+            return _TemplateHandler.__locate_class(val)
+        except LookupError:
+            return None
         except Exception:
             raise InconsistentEnvVariableError(f"{val} is not a valid class.")
+
+    @classmethod
+    def _clear_resolution_cache(cls):
+        """Forget the functions and classes resolved so far, for instance after a module is reloaded."""
+        cls.__import_function.cache_clear()
+        cls.__locate_class.cache_clear()
+
+    @staticmethod
+    @lru_cache(maxsize=_RESOLUTION_CACHE_SIZE)
+    def __import_function(module_name: str, fct_name: str):
+        return attrgetter(fct_name)(import_module(module_name))
+
+    @staticmethod
+    @lru_cache(maxsize=_RESOLUTION_CACHE_SIZE)
+    def __locate_class(val: str):
+        # A path that can not be located is not cached, since the module may become importable later.
+        if (located := locate(val)) is None:
+            raise LookupError(val)
+        return located
@@ -9,18 +9,37 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import hashlib
 import os
-from typing import Dict
+import threading
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
 from ..logger._taipy_logger import _TaipyLogger
+from ._applied_sections import _AppliedMapping, _AppliedSections
 from ._config import _Config
 from ._config_comparator._config_comparator import _ConfigComparator
+from ._config_comparator._config_diff import _ChangeKey, _diff_configs, _diff_snapshots, _Snapshot, _snapshot
+from ._config_overlay import (
+    _current_overlay,
+    _get_overlay,
+    _merge_overlay,
+    _Overlay,
+    _overlay_section,
+    _overlay_sections,
+    _overlay_unique_sections,
+)
+from ._config_watcher import _ConfigWatcher
+from ._frozen_config import _FrozenConfig
+from ._serializer._compiled_config_serializer import _CompiledConfigSerializer
 from ._serializer._json_serializer import _JsonSerializer
 from ._serializer._toml_serializer import _TomlSerializer
 from .checker._checker import _Checker
 from .checker.issue_collector import IssueCollector
 from .common._classproperty import _Classproperty
 from .common._config_blocker import _ConfigBlocker
+from .common._config_lock import _ConfigLock
 from .global_app.global_app_config import GlobalAppConfig
 from .section import Section
 from .unique_section import UniqueSection
@@ -36,28 +55,63 @@ class Config:
     _file_config = _Config()
     _env_file_config = _Config()
     _applied_config = _Config()
+    _frozen_config: Optional[_FrozenConfig] = None
     _collector = IssueCollector()
     _serializer = _TomlSerializer()
     __json_serializer = _JsonSerializer()
     _comparator: _ConfigComparator = _ConfigComparator()
+    _subscribers: List[Tuple[Callable[[List[_ChangeKey]], None], Optional[str], Optional[str]]] = []
+    __env_file_cache: Optional[Tuple[Tuple[str, int, int], _Config]] = None
+    __file_config_source: Optional[Tuple[_Config, str]] = None
+    # Counts the calls to `_compile_configs()`, made after each modification of the config layers.
+    __compilation_count = 0
+    # The digest of the default and Python configs, with the compilation count and the configs it was computed for.
+    __code_layers_digest: Optional[Tuple[int, _Config, _Config, bytes]] = None
+    # The state of the `Config.batch()` blocks of each thread.
+    __batch = threading.local()
+    # The applied config is replaced by each compilation, so the mappings returned read the current one when used.
+    __unique_sections = _AppliedMapping(lambda: Config.__read_unique_sections())
+    __sections = _AppliedSections(lambda: Config.__read_sections())
 
     @_Classproperty
     def unique_sections(cls) -> Dict[str, UniqueSection]:
         """Return all unique sections."""
-        return cls._applied_config._unique_sections
+        if (overlay := _get_overlay()) is None:
+            return cls.__unique_sections  # type: ignore
+        return _overlay_unique_sections(cls._applied_config._unique_sections, overlay)  # type: ignore
 
     @_Classproperty
     def sections(cls) -> Dict[str, Dict[str, Section]]:
         """Return all non unique sections."""
-        return cls._applied_config._sections
+        if (overlay := _get_overlay()) is None:
+            return cls.__sections  # type: ignore
+        return _overlay_sections(cls._applied_config._sections, overlay)  # type: ignore
 
     @_Classproperty
     def global_config(cls) -> GlobalAppConfig:
         """Return configuration values related to the global application as a `GlobalAppConfig^`."""
-        return cls._applied_config._global_config
+        if (overlay := _get_overlay()) is None:
+            if (frozen_config := cls._frozen_config) is not None:
+                return frozen_config.global_config  # type: ignore
+            return cls._applied_config._global_config
+        return _overlay_section(cls._applied_config._global_config, overlay, (_Config.GLOBAL_KEY, None))
+
+    @classmethod
+    def __read_unique_sections(cls) -> Mapping[str, UniqueSection]:
+        # While the configuration is frozen, the sections are read from its snapshot.
+        if (frozen_config := cls._frozen_config) is not None:
+            return frozen_config.unique_sections
+        return cls._applied_config._unique_sections
+
+    @classmethod
+    def __read_sections(cls) -> Mapping[str, Mapping[str, Section]]:
+        if (frozen_config := cls._frozen_config) is not None:
+            return frozen_config.sections
+        return cls._applied_config._sections
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def load(cls, filename):
         """Load a configuration file.
 
@@ -72,7 +126,16 @@ class Config:
         cls.__logger.info(f"Configuration '{filename}' successfully loaded.")
 
     @classmethod
-    def export(cls, filename):
+    @_ConfigLock._synchronized()
+    def export(
+        cls,
+        filename,
+        *,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        skip_unchanged: Optional[bool] = None,
+    ):
         """Export a configuration.
 
         The export is done in a toml file.
@@ -81,13 +144,35 @@ class Config:
 
         Parameters:
             filename (Union[str, Path]): The path of the file to export.
+            atomic (Optional[bool]): If True, the file is written to a temporary file of the same directory first,
+                which then replaces it, so readers never see a partially written file.
+            buffer_size (Optional[int]): The size of the write buffer in bytes, -1 for the default size.
+            fsync (Optional[bool]): If True, the file is flushed to disk before the method returns.
+            skip_unchanged (Optional[bool]): If True, the file is not rewritten if its content would not change.
         Note:
-            If *filename* already exists, it is overwritten.
+            If *filename* already exists, it is overwritten. The write options that are not provided take their
+            default values.
         """
-        cls._serializer._write(cls._python_config, filename)
+        cls._serializer._write(
+            cls._python_config,
+            filename,
+            atomic=atomic,
+            buffer_size=buffer_size,
+            fsync=fsync,
+            skip_unchanged=skip_unchanged,
+        )
 
     @classmethod
-    def backup(cls, filename):
+    @_ConfigLock._synchronized()
+    def backup(
+        cls,
+        filename,
+        *,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        skip_unchanged: Optional[bool] = None,
+    ):
         """Backup a configuration.
 
         The backup is done in a toml file.
@@ -98,13 +183,27 @@ class Config:
 
         Parameters:
             filename (Union[str, Path]): The path of the file to export.
+            atomic (Optional[bool]): If True, the file is written to a temporary file of the same directory first,
+                which then replaces it, so readers never see a partially written file.
+            buffer_size (Optional[int]): The size of the write buffer in bytes, -1 for the default size.
+            fsync (Optional[bool]): If True, the file is flushed to disk before the method returns.
+            skip_unchanged (Optional[bool]): If True, the file is not rewritten if its content would not change.
         Note:
-            If *filename* already exists, it is overwritten.
+            If *filename* already exists, it is overwritten. The write options that are not provided take their
+            default values.
         """
-        cls._serializer._write(cls._applied_config, filename)
+        cls._serializer._write(
+            cls._applied_config,
+            filename,
+            atomic=atomic,
+            buffer_size=buffer_size,
+            fsync=fsync,
+            skip_unchanged=skip_unchanged,
+        )
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def restore(cls, filename):
         """Restore a configuration file and replace the current applied configuration.
 
@@ -112,11 +211,14 @@ class Config:
             filename (Union[str, Path]): The path of the toml configuration file to load.
         """
         cls.__logger.info(f"Restoring configuration. Filename: '{filename}'")
-        cls._applied_config = cls._serializer._read(filename)
+        snapshot = _snapshot(cls._applied_config) if cls._subscribers else None
+        cls.__publish(cls._serializer._read(filename))
+        cls.__notify(snapshot)
         cls.__logger.info(f"Configuration '{filename}' successfully restored.")
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def override(cls, filename):
         """Load a configuration from a file and overrides the current config.
 
@@ -125,10 +227,254 @@ class Config:
         """
         cls.__logger.info(f"Loading configuration. Filename: '{filename}'")
         cls._file_config = cls._serializer._read(filename)
+        cls.__file_config_source = (cls._file_config, filename)
         cls.__logger.info("Overriding configuration.'")
         cls._compile_configs()
         cls.__logger.info(f"Configuration '{filename}' successfully loaded.")
 
+    @classmethod
+    @_ConfigLock._synchronized()
+    def dump_compiled(cls, filename, key: Optional[bytes] = None):
+        """Dump the compiled configuration to a binary artifact.
+
+        The artifact holds the applied configuration, the file and environment configurations, and a digest of the
+        configuration layers they were compiled from. Other processes can load it with `Config.load_compiled()` to
+        skip parsing the configuration files and compiling the configuration.
+
+        Parameters:
+            filename (Union[str, Path]): The path of the artifact.
+            key (Optional[bytes]): The secret key signing the artifact, if any. It must not be stored next to the
+                artifact.
+        Note:
+            If *filename* already exists, it is overwritten.
+        Warning:
+            Loading the artifact unpickles it, so anyone able to write it can run code in the processes loading it.
+            Without a *key*, the artifact must be stored in a trusted location, not writable by other users.
+        """
+        cls.__write_compiled(filename, cls.__layers_digest(cls.__get_file_config_source()), key)
+
+    @classmethod
+    @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
+    def load_compiled(cls, filename, override_filename=None, key: Optional[bytes] = None) -> bool:
+        """Load the compiled configuration from a binary artifact written by `Config.dump_compiled()`.
+
+        The artifact is only used if it was compiled from the same default and Python configurations as the current
+        ones, from the same file *override_filename*, and from the same file provided by the `TAIPY_CONFIG_PATH`
+        environment variable. Otherwise, the configuration is compiled as usual, as if `Config.override()` was called
+        with *override_filename*, and the artifact is written again.
+
+        Parameters:
+            filename (Union[str, Path]): The path of the artifact.
+            override_filename (Optional[Union[str, Path]]): The path of the toml configuration file overriding the
+                Python configuration, if any.
+            key (Optional[bytes]): The secret key the artifact was signed with by `Config.dump_compiled()`, if any.
+                An artifact signed with another key, or not signed, is never unpickled.
+        Returns:
+            True if the configuration was loaded from the artifact, False if it was compiled.
+        Warning:
+            Loading the artifact unpickles it, so anyone able to write it can run code in this process. Without a
+            *key*, the artifact must be stored in a trusted location, not writable by other users.
+        """
+        file_source = override_filename or cls.__get_file_config_source()
+        layers_digest = cls.__layers_digest(file_source)
+        if not (configs := _CompiledConfigSerializer._read(filename, layers_digest, key)):
+            cls.__logger.info(f"Compiled configuration '{filename}' is missing or outdated. Compiling configuration.")
+            if override_filename:
+                cls.override(override_filename)
+            else:
+                cls._compile_configs()
+            cls.__write_compiled(filename, layers_digest, key)
+            return False
+
+        file_config, env_file_config, applied_config = configs
+        cls._file_config = file_config
+        cls.__file_config_source = (file_config, file_source) if file_source else None
+        cls._env_file_config = env_file_config
+        if env_filename := os.environ.get(cls._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH):
+            cls.__env_file_cache = (cls.__env_file_cache_key(env_filename), env_file_config)
+        snapshot = _snapshot(cls._applied_config) if cls._subscribers else None
+        cls.__publish(applied_config)
+        cls.__notify(snapshot)
+        cls.__logger.info(f"Compiled configuration '{filename}' successfully loaded.")
+        return True
+
+    @classmethod
+    def subscribe(
+        cls,
+        callback: Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None],
+        section_name: Optional[str] = None,
+        section_id: Optional[str] = None,
+    ):
+        """Register a callback to be notified of the changes of the applied configuration.
+
+        Each time the configuration is compiled, loaded, overridden or restored, the callback is called once with the
+        list of the (section name, section id, attribute) keys of the values that changed, if any. The section id is
+        None for unique sections and for the global configuration, whose section name is "TAIPY". The attribute is
+        None when a whole section was added or removed.
+
+        Inside a `Config.batch()^` block, the callback is called once when the block exits. The callback is called
+        once the configuration is no longer locked, so it can update the configuration or wait for other threads
+        updating it.
+
+        Parameters:
+            callback (Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None]): The function to call.
+            section_name (Optional[str]): If provided, only the changes of the sections with this name are notified.
+            section_id (Optional[str]): If provided, only the changes of the sections with this id are notified.
+        Note:
+            The sections of configuration files loaded lazily are only notified when added or removed until they are
+            built.
+        """
+        cls._subscribers.append((callback, section_name, section_id))
+
+    @classmethod
+    def unsubscribe(cls, callback: Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None]):
+        """Unregister a callback registered with `Config.subscribe()^`.
+
+        Parameters:
+            callback (Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None]): The function to unregister.
+        """
+        cls._subscribers = [subscriber for subscriber in cls._subscribers if subscriber[0] is not callback]
+
+    @classmethod
+    def watch(cls, debounce: float = 0.2, poll_interval: float = 1.0) -> _ConfigWatcher:
+        """Watch the configuration files and reload them when they change.
+
+        The files watched are the one provided to `Config.override()^` and the one provided by the
+        `TAIPY_CONFIG_PATH` environment variable. When one of them changes, only this file is read again. The
+        configuration it provides is compared with the previous one, and only the sections that changed are compiled
+        again.
+
+        Changes are detected with inotify on Linux, and by polling the files elsewhere.
+
+        Parameters:
+            debounce (float): The time in seconds to wait for more changes after a first one before reloading.
+            poll_interval (float): The interval in seconds between two checks of the files when they are polled.
+        Returns:
+            The watcher. Its `subscribe()` method registers a callback called after each reload with the list of the
+            (section name, section id, attribute) keys that changed. Its `stop()` method stops watching the files.
+        """
+        return _ConfigWatcher(cls.__get_watched_files, cls._reload_files, debounce, poll_interval)._start()
+
+    @classmethod
+    def __get_watched_files(cls) -> List[str]:
+        watched_files = []
+        if file_source := cls.__get_file_config_source():
+            watched_files.append(os.fspath(file_source))
+        if env_filename := os.environ.get(cls._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH):
+            watched_files.append(env_filename)
+        return watched_files
+
+    @classmethod
+    @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
+    def _reload_files(cls, filenames: Set[str]) -> List[_ChangeKey]:
+        """Read again the configurations provided by the given files, and compile only the sections that changed.
+
+        Parameters:
+            filenames (Set[str]): The absolute paths of the files that changed. The other files are ignored.
+        Returns:
+            The (section name, section id, attribute) keys that changed.
+        """
+        file_source = cls.__get_file_config_source()
+        env_filename = os.environ.get(cls._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH)
+        # Both files are read before anything is applied, so a file that can not be read leaves the config unchanged.
+        file_config = env_file_config = None
+        if file_source and os.path.abspath(file_source) in filenames:
+            file_config = cls._serializer._read(file_source)
+        if env_filename and os.path.abspath(env_filename) in filenames:
+            env_file_config = cls._serializer._read(env_filename)
+
+        changes: Dict[_ChangeKey, None] = {}
+        if file_config is not None:
+            changes.update(dict.fromkeys(_diff_configs(cls._file_config, file_config)))
+            cls._file_config = file_config
+            cls.__file_config_source = (file_config, file_source)
+        if env_file_config is not None:
+            changes.update(dict.fromkeys(_diff_configs(cls._env_file_config, env_file_config)))
+            cls._env_file_config = env_file_config
+            cls.__env_file_cache = (cls.__env_file_cache_key(env_filename), env_file_config)
+        if changes:
+            cls.__logger.info(f"Configuration files {sorted(filenames)} changed. Reloading configuration.")
+            cls._compile_configs({(section_name, section_id) for section_name, section_id, _ in changes})
+        return list(changes)
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """Defer the compilation of the configuration until the end of a block of code.
+
+        Inside a `with Config.batch():` block, the sections configured or registered are only recorded, and the
+        configuration is compiled once when the outermost block exits. This makes configuring a large number of
+        sections much faster.
+
+        The block only defers the compilations triggered by the current thread. It does not prevent the other
+        threads from updating the configuration meanwhile.
+
+        Note:
+            Inside the block, the sections returned by the `Config.configure_*` methods are not merged yet with the
+            default values and the other configuration sources. They take their compiled state when the block exits.
+        """
+        batch = cls.__batch_state()
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0:
+                changed_sections = None if batch.requires_full_compilation else batch.changed_sections
+                batch.requires_full_compilation = False
+                batch.changed_sections = set()
+                if changed_sections is None or changed_sections:
+                    cls._compile_configs(changed_sections)
+
+    @classmethod
+    def __batch_state(cls):
+        batch = cls.__batch
+        if not hasattr(batch, "depth"):
+            batch.depth = 0
+            batch.requires_full_compilation = False
+            batch.changed_sections = set()
+            batch.added_sections = set()
+        return batch
+
+    @classmethod
+    @contextmanager
+    def overlay(cls, values: Dict[str, Any]):
+        """Override some configuration values in the current context only.
+
+        Inside a `with Config.overlay(...):` block, the sections read from `Config.sections`, `Config.unique_sections`
+        and `Config.global_config` return the values of the overlay instead of the ones of the applied configuration.
+        The applied configuration is neither copied nor modified, and the other threads and asyncio tasks keep reading
+        it unchanged. An asyncio task created inside the block inherits the overlay.
+
+        The values are given with the layout of a configuration file. For example:
+        ```python
+        with Config.overlay({"TAIPY": {"storage_folder": "tenant_1/"}, "DATA_NODE": {"sales": {"path": "t1.csv"}}}):
+            ...
+        ```
+
+        Overlays can be nested, the values of the inner overlay taking precedence. An overlay only overrides the
+        values of existing sections: it does not add sections. The sections referenced by a section read with the
+        overlay, like the tasks of a scenario, are read with the overlay too.
+
+        Parameters:
+            values (Dict[str, Any]): The values to override, by section name, then by section id for the non unique
+                sections, then by attribute or property name. The global application values are under the "TAIPY" key.
+        """
+        overlay_values: _Overlay = {}
+        for section_name, section_values in values.items():
+            if section_name == _Config.GLOBAL_KEY or section_name in cls._applied_config._unique_sections:
+                overlay_values[(section_name, None)] = section_values
+            else:
+                for section_id, values_by_id in section_values.items():
+                    overlay_values[(section_name, section_id)] = values_by_id
+        token = _current_overlay.set(_merge_overlay(_get_overlay(), overlay_values))
+        try:
+            yield
+        finally:
+            _current_overlay.reset(token)
+
     @classmethod
     def block_update(cls):
         """Block update on the configuration signgleton."""
@@ -138,9 +484,35 @@ class Config:
     def unblock_update(cls):
         """Unblock update on the configuration signgleton."""
         _ConfigBlocker._unblock()
+        cls._frozen_config = None
+
+    @classmethod
+    def freeze(cls) -> _FrozenConfig:
+        """Block update on the configuration singleton and take an immutable snapshot of it.
+
+        The snapshot exposes the `sections`, `unique_sections` and `global_config` of the applied configuration. Its
+        sections are read-only objects whose attributes and properties are resolved once when the snapshot is taken,
+        including the values provided by environment variables. Reading them is as fast as a plain attribute access.
+
+        Until the snapshot is discarded, `Config.sections`, `Config.unique_sections`, `Config.global_config` and the
+        section attributes of `Config` read the sections of the snapshot. Inside a `Config.overlay()^` block, they
+        keep reading the applied configuration with the values of the overlay.
+
+        The snapshot is discarded when the configuration is unblocked with `Config.unblock_update()^`.
+
+        Returns:
+            The immutable snapshot of the applied configuration.
+        Raises:
+            MissingEnvVariableError: If an environment variable used in a configuration value is not set.
+        """
+        frozen_config = _FrozenConfig._from_config(cls._applied_config)
+        _ConfigBlocker._block()
+        cls._frozen_config = frozen_config
+        return frozen_config
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def configure_global_app(cls, **properties) -> GlobalAppConfig:
         """Configure the global application.
 
@@ -154,24 +526,29 @@ class Config:
             cls._python_config._global_config = glob_cfg
         else:
             cls._python_config._global_config._update(glob_cfg._to_dict())
-        cls._compile_configs()
+        cls._compile_configs({(_Config.GLOBAL_KEY, None)})
         return cls._applied_config._global_config
 
     @classmethod
-    def check(cls) -> IssueCollector:
+    def check(cls, incremental: bool = False) -> IssueCollector:
         """Check configuration.
 
         This method logs issue messages and returns an issue collector.
 
+        Parameters:
+            incremental (bool): If True, only the checks of the sections modified since the previous check are
+                performed again, the issues found by the others are reused. Otherwise, the whole configuration is
+                checked.
         Returns:
             Collector containing the info, warning and error issues.
         """
-        cls._collector = _Checker._check(cls._applied_config)
+        cls._collector = _Checker._check(cls._applied_config, incremental)
         cls.__log_message(cls)
         return cls._collector
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def _register_default(cls, default_section: Section):
         if isinstance(default_section, UniqueSection):
             if cls._default_config._unique_sections.get(default_section.name, None):
@@ -185,10 +562,11 @@ class Config:
                 cls._default_config._sections[default_section.name] = {default_section.id: default_section}
         cls._serializer._section_class[default_section.name] = default_section.__class__  # type: ignore
         cls.__json_serializer._section_class[default_section.name] = default_section.__class__  # type: ignore
-        cls._compile_configs()
+        cls._compile_configs({cls.__section_key(default_section)})
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def _register(cls, section):
         if isinstance(section, UniqueSection):
             if cls._python_config._unique_sections.get(section.name, None):
@@ -205,27 +583,191 @@ class Config:
                 cls._python_config._sections[section.name] = {section.id: section}
         cls._serializer._section_class[section.name] = section.__class__
         cls.__json_serializer._section_class[section.name] = section.__class__
-        cls._compile_configs()
+        cls._compile_configs({cls.__section_key(section)})
+
+    @staticmethod
+    def __section_key(section: Section) -> Tuple[str, Optional[str]]:
+        return (section.name, None) if isinstance(section, UniqueSection) else (section.name, section.id)
 
     @classmethod
-    def _override_env_file(cls):
+    def _override_env_file(cls) -> bool:
+        """Set the environment file config from the file provided by the `TAIPY_CONFIG_PATH` environment variable.
+
+        The file is only read again if its path, modification time or size changed since the last time it was read.
+
+        Returns:
+            True if the environment file config changed, False otherwise.
+        """
         if config_filename := os.environ.get(cls._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH):
+            cache_key = cls.__env_file_cache_key(config_filename)
+            if cls.__env_file_cache and cls.__env_file_cache[0] == cache_key:
+                env_file_config = cls.__env_file_cache[1]
+                if cls._env_file_config is env_file_config:
+                    return False
+                cls._env_file_config = env_file_config
+                return True
             cls.__logger.info(f"Loading configuration provided by environment variable. Filename: '{config_filename}'")
             cls._env_file_config = cls._serializer._read(config_filename)
+            cls.__env_file_cache = (cache_key, cls._env_file_config)
             cls.__logger.info(f"Configuration '{config_filename}' successfully loaded.")
+            return True
+        return False
+
+    @staticmethod
+    def __env_file_cache_key(config_filename: str) -> Tuple[str, int, int]:
+        file_stat = os.stat(config_filename)
+        return config_filename, file_stat.st_mtime_ns, file_stat.st_size
+
+    @classmethod
+    def _invalidate_env_file_cache(cls):
+        """Force the environment file config to be read again at the next compilation.
+
+        This is only needed when the file is modified without changing its modification time or its size.
+        """
+        cls.__env_file_cache = None
+
+    @classmethod
+    @_ConfigLock._synchronized()
+    def _compile_configs(cls, changed_sections: Optional[Set[Tuple[str, Optional[str]]]] = None):
+        """Compile the applied config from the default, python, file and environment file configs.
+
+        Parameters:
+            changed_sections (Optional[Set[Tuple[str, Optional[str]]]]): The (section name, section id) keys that
+                changed since the last compilation. The section id is None for unique sections and for the global
+                config. If provided, only these sections are merged again into the applied config. Otherwise, or if
+                the environment file config was reloaded, the applied config is fully rebuilt.
+        """
+        cls.__compilation_count += 1
+        if cls.__batch_state().depth:
+            cls.__defer_compilation(changed_sections)
+            return
+
+        env_file_reloaded = Config._override_env_file()
+        if (
+            changed_sections is not None
+            and not env_file_reloaded
+            and cls._applied_config._can_update_incrementally(changed_sections)
+        ):
+            snapshot = _snapshot(cls._applied_config, changed_sections) if cls._subscribers else None
+            cls.__publish(cls._applied_config._recompiled(cls.__config_layers(), changed_sections), changed_sections)
+            cls.__notify(snapshot, changed_sections)
+            return
+
+        snapshot = _snapshot(cls._applied_config) if cls._subscribers else None
+        cls.__publish(_Config._compiled(cls.__config_layers()))
+        cls.__notify(snapshot)
+
+    @classmethod
+    def __publish(cls, applied_config: _Config, changed_sections: Optional[Set[Tuple[str, Optional[str]]]] = None):
+        # A single assignment, so a reader sees either the previous applied config or the new one, both complete.
+        previous_config = cls._applied_config
+        cls._applied_config = applied_config
+        applied_config._succeed(previous_config, changed_sections)
+
+    @classmethod
+    def __notify(cls, snapshot: Optional[_Snapshot], section_keys: Optional[Set[Tuple[str, Optional[str]]]] = None):
+        # The snapshot was taken before the applied config changed, if there were subscribers.
+        batch = cls.__batch_state()
+        if snapshot is not None:
+            for section_key in batch.added_sections:
+                snapshot.pop(section_key, None)
+        batch.added_sections = set()
+        if snapshot is None or not (changes := _diff_snapshots(snapshot, _snapshot(cls._applied_config, section_keys))):
+            return
+        for callback, section_name, section_id in list(cls._subscribers):
+            if selected_changes := [
+                change
+                for change in changes
+                if (section_name is None or change[0] == section_name)
+                and (section_id is None or change[1] == section_id)
+            ]:
+                # The callbacks are called once the lock is released, so they can wait for other threads updating the
+                # configuration.
+                _ConfigLock._call_when_released(partial(cls.__call_subscriber, callback, selected_changes))
+
+    @classmethod
+    def __call_subscriber(cls, callback: Callable[[List[_ChangeKey]], None], changes: List[_ChangeKey]):
+        try:
+            callback(changes)
+        except Exception as e:
+            cls.__logger.error(f"Configuration change subscriber {callback} failed: {e}")
+
+    @classmethod
+    def __config_layers(cls) -> List[_Config]:
+        return [cls._default_config, cls._python_config, cls._file_config, cls._env_file_config]
+
+    @classmethod
+    def __defer_compilation(cls, changed_sections: Optional[Set[Tuple[str, Optional[str]]]]):
+        batch = cls.__batch_state()
+        if changed_sections is None:
+            batch.requires_full_compilation = True
+            return
+        batch.changed_sections.update(changed_sections)
+        if cls._subscribers:
+            # The sections added until the batch is compiled must be notified as added ones.
+            batch.added_sections.update(
+                section_key
+                for section_key in changed_sections
+                if not cls.__contains_section(cls._applied_config, section_key)
+            )
+        cls.__publish(
+            cls._applied_config._with_missing_sections(cls.__config_layers(), changed_sections), changed_sections
+        )
+
+    @staticmethod
+    def __contains_section(config: _Config, section_key: Tuple[str, Optional[str]]) -> bool:
+        section_name, section_id = section_key
+        if section_id is None:
+            return section_name == _Config.GLOBAL_KEY or section_name in config._unique_sections
+        return section_id in config._sections.get(section_name, {})
+
+    @classmethod
+    def __get_file_config_source(cls) -> Optional[str]:
+        if cls.__file_config_source and cls.__file_config_source[0] is cls._file_config:
+            return cls.__file_config_source[1]
+        return None
+
+    @classmethod
+    def __layers_digest(cls, file_source) -> bytes:
+        # The layers read from files are identified by the content of the files, so they do not need to be parsed.
+        env_filename = os.environ.get(cls._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH)
+        layers_digest = hashlib.sha256(cls.__code_layers_digest_of(cls._default_config, cls._python_config))
+        layers_digest.update(cls.__file_digest(file_source) if file_source else cls.__config_digest(cls._file_config))
+        layers_digest.update(
+            cls.__file_digest(env_filename) if env_filename else cls.__config_digest(cls._env_file_config)
+        )
+        return layers_digest.digest()
+
+    @classmethod
+    def __code_layers_digest_of(cls, default_config: _Config, python_config: _Config) -> bytes:
+        # Digested on each load, so it is kept until the next compilation, unless other configs replaced these ones.
+        if (cache := cls.__code_layers_digest) is not None:
+            compilation_count, cached_default_config, cached_python_config, digest = cache
+            if (
+                compilation_count == cls.__compilation_count
+                and cached_default_config is default_config
+                and cached_python_config is python_config
+            ):
+                return digest
+        digest = cls.__config_digest(default_config) + cls.__config_digest(python_config)
+        cls.__code_layers_digest = (cls.__compilation_count, default_config, python_config, digest)
+        return digest
+
+    @staticmethod
+    def __config_digest(config: _Config) -> bytes:
+        # The fingerprints of the sections are cached, so only the modified sections are serialized again.
+        return hashlib.sha256(b"config:" + config._fingerprint().encode()).digest()
+
+    @staticmethod
+    def __file_digest(filename) -> bytes:
+        with open(filename, "rb") as f:
+            return hashlib.sha256(b"file:" + f.read()).digest()
 
     @classmethod
-    def _compile_configs(cls):
-        Config._override_env_file()
-        cls._applied_config._clean()
-        if cls._default_config:
-            cls._applied_config._update(cls._default_config)
-        if cls._python_config:
-            cls._applied_config._update(cls._python_config)
-        if cls._file_config:
-            cls._applied_config._update(cls._file_config)
-        if cls._env_file_config:
-            cls._applied_config._update(cls._env_file_config)
+    def __write_compiled(cls, filename, layers_digest: bytes, key: Optional[bytes]):
+        _CompiledConfigSerializer._write(
+            (cls._file_config, cls._env_file_config, cls._applied_config), layers_digest, filename, key
+        )
 
     @classmethod
     def __log_message(cls, config):
@@ -10,14 +10,19 @@
 # specific language governing permissions and limitations under the License.
 
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from datetime import timedelta
 
 from taipy.core.config import DataNodeConfig, JobConfig, ScenarioConfig, TaskConfig, MigrationConfig, CoreSection
 
+from ._config_comparator._config_diff import _ChangeKey
+from ._config_watcher import _ConfigWatcher
+from ._frozen_config import _FrozenConfig
 from .checker.issue_collector import IssueCollector
 from .common._classproperty import _Classproperty
 from .common._config_blocker import _ConfigBlocker
+from .common._config_lock import _ConfigLock
 from .common.frequency import Frequency
 from .common.scope import Scope
 from .global_app.global_app_config import GlobalAppConfig
@@ -41,6 +46,7 @@ class Config:
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def load(cls, filename):
         """Load a configuration file.
 
@@ -51,7 +57,16 @@ class Config:
         """
 
     @classmethod
-    def export(cls, filename):
+    @_ConfigLock._synchronized()
+    def export(
+        cls,
+        filename,
+        *,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        skip_unchanged: Optional[bool] = None,
+    ):
         """Export a configuration.
 
         The export is done in a toml file.
@@ -60,12 +75,27 @@ class Config:
 
         Parameters:
             filename (Union[str, Path]): The path of the file to export.
+            atomic (Optional[bool]): If True, the file is written to a temporary file of the same directory first,
+                which then replaces it, so readers never see a partially written file.
+            buffer_size (Optional[int]): The size of the write buffer in bytes, -1 for the default size.
+            fsync (Optional[bool]): If True, the file is flushed to disk before the method returns.
+            skip_unchanged (Optional[bool]): If True, the file is not rewritten if its content would not change.
         Note:
-            If *filename* already exists, it is overwritten.
+            If *filename* already exists, it is overwritten. The write options that are not provided take their
+            default values.
         """
 
     @classmethod
-    def backup(cls, filename):
+    @_ConfigLock._synchronized()
+    def backup(
+        cls,
+        filename,
+        *,
+        atomic: Optional[bool] = None,
+        buffer_size: Optional[int] = None,
+        fsync: Optional[bool] = None,
+        skip_unchanged: Optional[bool] = None,
+    ):
         """Backup a configuration.
 
         The backup is done in a toml file.
@@ -76,12 +106,19 @@ class Config:
 
         Parameters:
             filename (Union[str, Path]): The path of the file to export.
+            atomic (Optional[bool]): If True, the file is written to a temporary file of the same directory first,
+                which then replaces it, so readers never see a partially written file.
+            buffer_size (Optional[int]): The size of the write buffer in bytes, -1 for the default size.
+            fsync (Optional[bool]): If True, the file is flushed to disk before the method returns.
+            skip_unchanged (Optional[bool]): If True, the file is not rewritten if its content would not change.
         Note:
-            If *filename* already exists, it is overwritten.
+            If *filename* already exists, it is overwritten. The write options that are not provided take their
+            default values.
         """
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def restore(cls, filename):
         """Restore a configuration file and replace the current applied configuration.
 
@@ -91,6 +128,7 @@ class Config:
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def override(cls, filename):
         """Load a configuration from a file and overrides the current config.
 
@@ -98,6 +136,158 @@ class Config:
             filename (Union[str, Path]): The path of the toml configuration file to load.
         """
 
+    @classmethod
+    @_ConfigLock._synchronized()
+    def dump_compiled(cls, filename, key: Optional[bytes] = None):
+        """Dump the compiled configuration to a binary artifact.
+
+        The artifact holds the applied configuration, the file and environment configurations, and a digest of the
+        configuration layers they were compiled from. Other processes can load it with `Config.load_compiled()` to
+        skip parsing the configuration files and compiling the configuration.
+
+        Parameters:
+            filename (Union[str, Path]): The path of the artifact.
+            key (Optional[bytes]): The secret key signing the artifact, if any. It must not be stored next to the
+                artifact.
+        Note:
+            If *filename* already exists, it is overwritten.
+        Warning:
+            Loading the artifact unpickles it, so anyone able to write it can run code in the processes loading it.
+            Without a *key*, the artifact must be stored in a trusted location, not writable by other users.
+        """
+
+    @classmethod
+    @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
+    def load_compiled(cls, filename, override_filename=None, key: Optional[bytes] = None) -> bool:
+        """Load the compiled configuration from a binary artifact written by `Config.dump_compiled()`.
+
+        The artifact is only used if it was compiled from the same default and Python configurations as the current
+        ones, from the same file *override_filename*, and from the same file provided by the `TAIPY_CONFIG_PATH`
+        environment variable. Otherwise, the configuration is compiled as usual, as if `Config.override()` was called
+        with *override_filename*, and the artifact is written again.
+
+        Parameters:
+            filename (Union[str, Path]): The path of the artifact.
+            override_filename (Optional[Union[str, Path]]): The path of the toml configuration file overriding the
+                Python configuration, if any.
+            key (Optional[bytes]): The secret key the artifact was signed with by `Config.dump_compiled()`, if any.
+                An artifact signed with another key, or not signed, is never unpickled.
+        Returns:
+            True if the configuration was loaded from the artifact, False if it was compiled.
+        Warning:
+            Loading the artifact unpickles it, so anyone able to write it can run code in this process. Without a
+            *key*, the artifact must be stored in a trusted location, not writable by other users.
+        """
+
+    @classmethod
+    def subscribe(
+        cls,
+        callback: Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None],
+        section_name: Optional[str] = None,
+        section_id: Optional[str] = None,
+    ):
+        """Register a callback to be notified of the changes of the applied configuration.
+
+        Each time the configuration is compiled, loaded, overridden or restored, the callback is called once with the
+        list of the (section name, section id, attribute) keys of the values that changed, if any. The section id is
+        None for unique sections and for the global configuration, whose section name is "TAIPY". The attribute is
+        None when a whole section was added or removed.
+
+        Inside a `Config.batch()^` block, the callback is called once when the block exits. The callback is called
+        once the configuration is no longer locked, so it can update the configuration or wait for other threads
+        updating it.
+
+        Parameters:
+            callback (Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None]): The function to call.
+            section_name (Optional[str]): If provided, only the changes of the sections with this name are notified.
+            section_id (Optional[str]): If provided, only the changes of the sections with this id are notified.
+        Note:
+            The sections of configuration files loaded lazily are only notified when added or removed until they are
+            built.
+        """
+
+    @classmethod
+    def unsubscribe(cls, callback: Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None]):
+        """Unregister a callback registered with `Config.subscribe()^`.
+
+        Parameters:
+            callback (Callable[[List[Tuple[str, Optional[str], Optional[str]]]], None]): The function to unregister.
+        """
+
+    @classmethod
+    def watch(cls, debounce: float = 0.2, poll_interval: float = 1.0) -> _ConfigWatcher:
+        """Watch the configuration files and reload them when they change.
+
+        The files watched are the one provided to `Config.override()^` and the one provided by the
+        `TAIPY_CONFIG_PATH` environment variable. When one of them changes, only this file is read again. The
+        configuration it provides is compared with the previous one, and only the sections that changed are compiled
+        again.
+
+        Changes are detected with inotify on Linux, and by polling the files elsewhere.
+
+        Parameters:
+            debounce (float): The time in seconds to wait for more changes after a first one before reloading.
+            poll_interval (float): The interval in seconds between two checks of the files when they are polled.
+        Returns:
+            The watcher. Its `subscribe()` method registers a callback called after each reload with the list of the
+            (section name, section id, attribute) keys that changed. Its `stop()` method stops watching the files.
+        """
+
+    @classmethod
+    @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
+    def _reload_files(cls, filenames: Set[str]) -> List[_ChangeKey]:
+        """Read again the configurations provided by the given files, and compile only the sections that changed.
+
+        Parameters:
+            filenames (Set[str]): The absolute paths of the files that changed. The other files are ignored.
+        Returns:
+            The (section name, section id, attribute) keys that changed.
+        """
+
+    @classmethod
+    @contextmanager
+    def batch(cls):
+        """Defer the compilation of the configuration until the end of a block of code.
+
+        Inside a `with Config.batch():` block, the sections configured or registered are only recorded, and the
+        configuration is compiled once when the outermost block exits. This makes configuring a large number of
+        sections much faster.
+
+        The block only defers the compilations triggered by the current thread. It does not prevent the other
+        threads from updating the configuration meanwhile.
+
+        Note:
+            Inside the block, the sections returned by the `Config.configure_*` methods are not merged yet with the
+            default values and the other configuration sources. They take their compiled state when the block exits.
+        """
+
+    @classmethod
+    @contextmanager
+    def overlay(cls, values: Dict[str, Any]):
+        """Override some configuration values in the current context only.
+
+        Inside a `with Config.overlay(...):` block, the sections read from `Config.sections`, `Config.unique_sections`
+        and `Config.global_config` return the values of the overlay instead of the ones of the applied configuration.
+        The applied configuration is neither copied nor modified, and the other threads and asyncio tasks keep reading
+        it unchanged. An asyncio task created inside the block inherits the overlay.
+
+        The values are given with the layout of a configuration file. For example:
+        ```python
+        with Config.overlay({"TAIPY": {"storage_folder": "tenant_1/"}, "DATA_NODE": {"sales": {"path": "t1.csv"}}}):
+            ...
+        ```
+
+        Overlays can be nested, the values of the inner overlay taking precedence. An overlay only overrides the
+        values of existing sections: it does not add sections. The sections referenced by a section read with the
+        overlay, like the tasks of a scenario, are read with the overlay too.
+
+        Parameters:
+            values (Dict[str, Any]): The values to override, by section name, then by section id for the non unique
+                sections, then by attribute or property name. The global application values are under the "TAIPY" key.
+        """
+
     @classmethod
     def block_update(cls):
         """Block update on the configuration signgleton."""
@@ -106,8 +296,29 @@ class Config:
     def unblock_update(cls):
         """Unblock update on the configuration signgleton."""
 
+    @classmethod
+    def freeze(cls) -> _FrozenConfig:
+        """Block update on the configuration singleton and take an immutable snapshot of it.
+
+        The snapshot exposes the `sections`, `unique_sections` and `global_config` of the applied configuration. Its
+        sections are read-only objects whose attributes and properties are resolved once when the snapshot is taken,
+        including the values provided by environment variables. Reading them is as fast as a plain attribute access.
+
+        Until the snapshot is discarded, `Config.sections`, `Config.unique_sections`, `Config.global_config` and the
+        section attributes of `Config` read the sections of the snapshot. Inside a `Config.overlay()^` block, they
+        keep reading the applied configuration with the values of the overlay.
+
+        The snapshot is discarded when the configuration is unblocked with `Config.unblock_update()^`.
+
+        Returns:
+            The immutable snapshot of the applied configuration.
+        Raises:
+            MissingEnvVariableError: If an environment variable used in a configuration value is not set.
+        """
+
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def configure_global_app(cls, **properties) -> GlobalAppConfig:
         """Configure the global application.
 
@@ -118,32 +329,59 @@ class Config:
         """
 
     @classmethod
-    def check(cls) -> IssueCollector:
+    def check(cls, incremental: bool = False) -> IssueCollector:
         """Check configuration.
 
         This method logs issue messages and returns an issue collector.
 
+        Parameters:
+            incremental (bool): If True, only the checks of the sections modified since the previous check are
+                performed again, the issues found by the others are reused. Otherwise, the whole configuration is
+                checked.
         Returns:
             Collector containing the info, warning and error issues.
         """
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def _register_default(cls, default_section: Section):
         """"""
 
     @classmethod
     @_ConfigBlocker._check()
+    @_ConfigLock._synchronized()
     def _register(cls, section):
         """"""
 
     @classmethod
-    def _override_env_file(cls):
-        """"""
+    def _override_env_file(cls) -> bool:
+        """Set the environment file config from the file provided by the `TAIPY_CONFIG_PATH` environment variable.
+
+        The file is only read again if its path, modification time or size changed since the last time it was read.
+
+        Returns:
+            True if the environment file config changed, False otherwise.
+        """
 
     @classmethod
-    def _compile_configs(cls):
-        """"""
+    def _invalidate_env_file_cache(cls):
+        """Force the environment file config to be read again at the next compilation.
+
+        This is only needed when the file is modified without changing its modification time or its size.
+        """
+
+    @classmethod
+    @_ConfigLock._synchronized()
+    def _compile_configs(cls, changed_sections: Optional[Set[Tuple[str, Optional[str]]]] = None):
+        """Compile the applied config from the default, python, file and environment file configs.
+
+        Parameters:
+            changed_sections (Optional[Set[Tuple[str, Optional[str]]]]): The (section name, section id) keys that
+                changed since the last compilation. The section id is None for unique sections and for the global
+                config. If provided, only these sections are merged again into the applied config. Otherwise, or if
+                the environment file config was reloaded, the applied config is fully rebuilt.
+        """
 
     @classmethod
     def _to_json(cls, _config: _Config) -> str:
@@ -28,3 +28,7 @@ class InvalidConfigurationId(Exception):
 
 class ConfigurationUpdateBlocked(Exception):
     """The configuration is being blocked from update by other Taipy services."""
+
+
+class CyclicDependencyError(Exception):
+    """Sections of the configuration reference each other in a cycle."""
@@ -14,10 +14,12 @@ from __future__ import annotations
 from typing import Any, Dict, Optional, Union
 
 from ..common._config_blocker import _ConfigBlocker
+from ..common._fingerprint import _Fingerprinted
+from ..common._resolved_properties import _ResolvedProperties
 from ..common._template_handler import _TemplateHandler as _tpl
 
 
-class GlobalAppConfig:
+class GlobalAppConfig(_ResolvedProperties, _Fingerprinted):
     """
     Configuration fields related to the global application.
 
@@ -30,15 +32,14 @@ class GlobalAppConfig:
 
     @property
     def properties(self):
-        return {k: _tpl._replace_templates(v) for k, v in self._properties.items()}
+        cache = self._resolution_cache()
+        return {k: _tpl._replace_templates_with_cache(cache, k, v) for k, v in self._properties.items()}
 
     @properties.setter  # type: ignore
     @_ConfigBlocker._check()
     def properties(self, val):
         self._properties = val
-
-    def __getattr__(self, item: str) -> Optional[Any]:
-        return _tpl._replace_templates(self._properties.get(item))
+        self._forget_resolved_properties()
 
     @classmethod
     def default_config(cls) -> GlobalAppConfig:
@@ -46,6 +47,7 @@ class GlobalAppConfig:
 
     def _clean(self):
         self._properties.clear()
+        self._forget_resolved_properties()
 
     def _to_dict(self):
         as_dict = {}
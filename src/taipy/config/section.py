@@ -10,14 +10,17 @@
 # specific language governing permissions and limitations under the License.
 
 from abc import abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from .common._config_blocker import _ConfigBlocker
+from .common._fingerprint import _Fingerprinted
+from .common._inherited_properties import _InheritedProperties
+from .common._resolved_properties import _ResolvedProperties
 from .common._template_handler import _TemplateHandler as _tpl
 from .common._validate_id import _validate_id
 
 
-class Section:
+class Section(_ResolvedProperties, _Fingerprinted):
     """A Section as a consistent part of the Config.
 
     A section is defined by the section name (representing the type of objects that are configured) and a section id.
@@ -26,6 +29,14 @@ class Section:
     _DEFAULT_KEY = "default"
     _ID_KEY = "id"
 
+    # The names of the sections that the `id:SECTION` references read from a file can designate, by name of the
+    # attribute holding them, in order of precedence. The references held by other attributes are looked up by id in
+    # all the sections.
+    _REFERENCED_SECTION_NAMES: Dict[str, Tuple[str, ...]] = {}
+
+    _nested_references_cache: Optional[Tuple[object, Tuple[Tuple[str, Tuple[Any, ...]], ...]]] = None
+    _inherited_properties_cache: Optional[Tuple[object, Any, Dict[str, Any]]] = None
+
     def __init__(self, id, **properties):
         self.id = _validate_id(id)
         self._properties = properties or dict()
@@ -56,17 +67,139 @@ class Section:
     def _update(self, config_as_dict, default_section=None):
         raise NotImplementedError
 
-    def __getattr__(self, item: str) -> Optional[Any]:
-        return self._replace_templates(self._properties.get(item, None))
+    def _inherit_properties(self, default_section: Optional["Section"]):
+        """Inherit the properties of a default section that are not set on self, without copying them.
+
+        The properties of self then read like `{**default_section._properties, **self._properties}`. The properties of
+        the default section are not copied into self: the sections inheriting from the same state of the default
+        section share a snapshot of its properties, which they never modify. The inherited templates are resolved when
+        they are read.
+
+        The snapshot is taken again once the configuration is modified (see `_Fingerprinted`) or once the properties of
+        the default section are replaced. A default section whose properties are modified in place in between must
+        reset its `_inherited_properties_cache` to None.
+
+        Args:
+            default_section (Optional[Section]): The section to inherit from. If None, nothing is done.
+        """
+        if default_section is None:
+            return
+        inherited = default_section.__inheritable_properties()
+        properties = self._properties
+        if isinstance(properties, _InheritedProperties):
+            if properties._inherited is inherited:
+                return
+            if not properties._inherited and not properties._deleted:
+                # Nothing was inherited yet, so the own properties are kept, shared or not.
+                self._properties = _InheritedProperties(properties._own, inherited, shared=properties._shared)
+                return
+            # The properties inherited from a previous state of the default section are kept, as if they were copied.
+            properties = dict(properties.items())
+        self._properties = _InheritedProperties(properties, inherited)
+
+    def _share_properties(self, other: "Section"):
+        """Share the own properties of another section if they are the same as the ones of self, so they are stored once.
+
+        The properties are the same if they have the same keys holding equal values, for instance once a section is
+        copied from another one. Both sections then copy the shared properties before modifying them. The properties
+        holding a section are not shared, since it is replaced in place by the section of the same id in the compiled
+        config.
+
+        Args:
+            other (Section): The section to share the properties of, typically the section of a config layer that
+                self was compiled from.
+        """
+        own, other_own = self.__own_properties(), other.__own_properties()
+        if own is None or other_own is None or own is other_own or own != other_own:
+            return
+        for value in other_own.values():
+            if isinstance(value, Section):
+                return
+        for section in (self, other):
+            if isinstance(properties := section._properties, _InheritedProperties):
+                properties._own = other_own
+                properties._shared = True
+            else:
+                section._properties = _InheritedProperties._shared_by(other_own)
+
+    def __own_properties(self) -> Optional[Dict[str, Any]]:
+        properties = self._properties
+        if not isinstance(properties, _InheritedProperties):
+            return properties
+        # The deleted inherited properties only make sense with the properties of self.
+        return None if properties._deleted else properties._own
+
+    def __inheritable_properties(self) -> Dict[str, Any]:
+        epoch = _Fingerprinted._epoch
+        properties = self._properties
+        if (cache := self._inherited_properties_cache) is not None and cache[0] is epoch and cache[1] is properties:
+            return cache[2]
+        snapshot = dict(properties.items())
+        # Set like a slot-less attribute, since the snapshots of frozen configurations reject assignments.
+        object.__setattr__(self, "_inherited_properties_cache", (epoch, properties, snapshot))
+        return snapshot
+
+    def _nested_references(self) -> Tuple[Tuple[str, Tuple[Any, ...]], ...]:
+        """Return where the sections referenced by self are stored.
+
+        Each reference is given by the name of the attribute holding it and by the path of indices and keys leading to
+        it through the lists and dictionaries of the attribute value, at any depth. The references found are indexed
+        by the section, and searched again only once the configuration is modified, like the fingerprints are computed
+        again (see `_Fingerprinted`). A reference added in place to a list or a dictionary of the section is therefore
+        found after the next modification of the configuration, for instance the next compilation.
+        """
+        epoch = _Fingerprinted._epoch
+        if (cache := self._nested_references_cache) is not None and cache[0] is epoch:
+            return cache[1]
+        found = []
+        for name, value in vars(self).items():
+            if isinstance(value, (list, dict, _InheritedProperties)):
+                found.extend((name, path) for path in self.__find_references(value))
+        references = tuple(found)
+        # Set like a slot-less attribute, since the snapshots of frozen configurations reject assignments.
+        object.__setattr__(self, "_nested_references_cache", (epoch, references))
+        return references
+
+    def _nested_sections(self) -> Iterator["Section"]:
+        """Iterate over the sections referenced by self, in the order of `_nested_references()`."""
+        attributes = vars(self)
+        for attribute_name, path in self._nested_references():
+            value = attributes.get(attribute_name, None)
+            try:
+                for key in path:
+                    value = value[key]
+            except (IndexError, KeyError, TypeError):
+                # The container was modified in place since the references were indexed.
+                continue
+            if isinstance(value, Section):
+                yield value
+
+    @staticmethod
+    def __find_references(value) -> List[Tuple[Any, ...]]:
+        paths = []
+        to_visit: List[Tuple[Any, Tuple[Any, ...]]] = [(value, ())]
+        while to_visit:
+            container, path = to_visit.pop()
+            for key, item in enumerate(container) if isinstance(container, list) else container.items():
+                # Most items are neither sections nor containers, so they are discarded with a single check.
+                if not isinstance(item, (Section, list, dict)):
+                    continue
+                if isinstance(item, Section):
+                    paths.append((*path, key))
+                else:
+                    to_visit.append((item, (*path, key)))
+        return paths
 
     @property
     def properties(self):
-        return {k: _tpl._replace_templates(v) for k, v in self._properties.items()}
+        cache = self._resolution_cache()
+        return {k: _tpl._replace_templates_with_cache(cache, k, v) for k, v in self._properties.items()}
 
     @properties.setter  # type: ignore
     @_ConfigBlocker._check()
     def properties(self, val):
         self._properties = val
+        self._forget_resolved_properties()
 
     def _replace_templates(self, value):
         return _tpl._replace_templates(value)
@@ -10,14 +10,19 @@
 # specific language governing permissions and limitations under the License.
 
 import json
-from typing import Any, Callable, Dict, List, Optional, Union
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from datetime import timedelta
 
 from taipy.core.config import DataNodeConfig, JobConfig, ScenarioConfig, TaskConfig, MigrationConfig, CoreSection
 
+from ._config_comparator._config_diff import _ChangeKey
+from ._config_watcher import _ConfigWatcher
+from ._frozen_config import _FrozenConfig
 from .checker.issue_collector import IssueCollector
 from .common._classproperty import _Classproperty
 from .common._config_blocker import _ConfigBlocker
+from .common._config_lock import _ConfigLock
 from .common.frequency import Frequency
 from .common.scope import Scope
 from .global_app.global_app_config import GlobalAppConfig
@@ -10,13 +10,20 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from unittest import mock
 from unittest.mock import MagicMock
 
+import pytest
+
 from src.taipy.config import Config
 from src.taipy.config.checker._checker import _Checker
+from src.taipy.config.checker._checkers._config_checker import _ConfigChecker
 from src.taipy.config.checker.issue_collector import IssueCollector
 from tests.config.utils.checker_for_tests import CheckerForTest
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.unique_section_for_tests import UniqueSectionForTest
 
 
 def test_register_checker():
@@ -25,3 +32,171 @@ def test_register_checker():
     _Checker.add_checker(checker)
     Config.check()
     checker._check.assert_called_once()
+
+
+class _FirstCheckerForTest(_ConfigChecker):
+    def _check(self) -> IssueCollector:
+        self._warning("first_field", 1, "First warning.")
+        self._error("first_field", 1, "First error.")
+        return self._collector
+
+
+class _SecondCheckerForTest(_ConfigChecker):
+    def _check(self) -> IssueCollector:
+        time.sleep(0.01)
+        self._error("second_field", 2, "Second error.")
+        self._info("second_field", 2, "Second info.")
+        return self._collector
+
+
+@pytest.fixture
+def _ordered_checkers(monkeypatch):
+    monkeypatch.setattr(_Checker, "_checkers", [_SecondCheckerForTest, _FirstCheckerForTest])
+    yield
+    _Checker._set_executor()
+
+
+def _issues(collector):
+    return [(issue.level, issue.message, issue.tag) for issue in collector.all]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_concurrent_checkers_merge_issues_in_registration_order(_ordered_checkers, executor):
+    sequential_issues = _issues(_Checker._check(Config._applied_config))
+
+    _Checker._set_executor(executor, max_workers=2)
+    collector = _Checker._check(Config._applied_config)
+
+    assert _issues(collector) == sequential_issues
+    assert [issue.message for issue in collector.errors] == ["Second error.", "First error."]
+    assert [issue.message for issue in collector.warnings] == ["First warning."]
+    assert [issue.message for issue in collector.infos] == ["Second info."]
+
+
+def test_checker_timings(_ordered_checkers):
+    _Checker._set_executor("thread")
+    _Checker._check(Config._applied_config)
+
+    assert list(_Checker._timings) == ["_SecondCheckerForTest", "_FirstCheckerForTest"]
+    assert _Checker._timings["_SecondCheckerForTest"] >= 0.01
+
+
+def test_set_unknown_executor():
+    with pytest.raises(ValueError):
+        _Checker._set_executor("coroutine")
+    assert _Checker._executor is None
+
+
+class _SectionCheckerForTest(_ConfigChecker):
+    _SECTION_NAMES = (SectionForTest.name,)
+    _CHECKS_EACH_SECTION = True
+    checked = []
+
+    def _check(self) -> IssueCollector:
+        for section in self._config._sections[SectionForTest.name].values():
+            self._check_section(section)
+        return self._collector
+
+    def _check_section(self, section) -> IssueCollector:
+        self.checked.append(section.id)
+        if section.attribute == "wrong":
+            self._error("attribute", section.attribute, f"Wrong attribute of `{section.id}`.")
+        return self._collector
+
+
+class _UniqueSectionCheckerForTest(_ConfigChecker):
+    _SECTION_NAMES = (UniqueSectionForTest.name,)
+    nb_checks = 0
+
+    def _check(self) -> IssueCollector:
+        _UniqueSectionCheckerForTest.nb_checks += 1
+        return self._collector
+
+
+def test_incremental_check_reruns_only_modified_sections(monkeypatch):
+    monkeypatch.setattr(_Checker, "_checkers", [_SectionCheckerForTest, _UniqueSectionCheckerForTest, CheckerForTest])
+    monkeypatch.setattr(_SectionCheckerForTest, "checked", [])
+    monkeypatch.setattr(_UniqueSectionCheckerForTest, "nb_checks", 0)
+    Config.configure_section_for_tests("s1", attribute="wrong")
+    Config.configure_section_for_tests("s2", attribute="foo")
+
+    assert [issue.message for issue in _Checker._check(Config._applied_config).errors] == ["Wrong attribute of `s1`."]
+    assert sorted(_SectionCheckerForTest.checked) == ["default", "s1", "s2"]
+    assert _UniqueSectionCheckerForTest.nb_checks == 1
+
+    _SectionCheckerForTest.checked.clear()
+    Config.configure_section_for_tests("s2", attribute="wrong")
+    collector = _Checker._check(Config._applied_config, incremental=True)
+    assert [issue.message for issue in collector.errors] == ["Wrong attribute of `s1`.", "Wrong attribute of `s2`."]
+    assert _SectionCheckerForTest.checked == ["s2"]
+    assert _UniqueSectionCheckerForTest.nb_checks == 1
+    assert _Checker._timings["_UniqueSectionCheckerForTest"] == 0.0
+
+    Config.configure_unique_section_for_tests("bar")
+    Config.configure_section_for_tests("s1", attribute="foo")
+    collector = _Checker._check(Config._applied_config, incremental=True)
+    assert [issue.message for issue in collector.errors] == ["Wrong attribute of `s2`."]
+    assert _SectionCheckerForTest.checked == ["s2", "s1"]
+    assert _UniqueSectionCheckerForTest.nb_checks == 2
+
+    _SectionCheckerForTest.checked.clear()
+    _Checker._check(Config._applied_config)
+    assert sorted(_SectionCheckerForTest.checked) == ["default", "s1", "s2"]
+    assert _UniqueSectionCheckerForTest.nb_checks == 3
+
+
+def test_incremental_check_reruns_all_sections_after_a_default_section_or_a_full_compilation(monkeypatch):
+    monkeypatch.setattr(_Checker, "_checkers", [_SectionCheckerForTest])
+    monkeypatch.setattr(_SectionCheckerForTest, "checked", [])
+    Config.configure_section_for_tests("s1", attribute="foo")
+    Config.configure_section_for_tests("s2", attribute="foo")
+    _Checker._check(Config._applied_config)
+
+    _SectionCheckerForTest.checked.clear()
+    Config.configure_section_for_tests("default", attribute="bar")
+    _Checker._check(Config._applied_config, incremental=True)
+    assert sorted(_SectionCheckerForTest.checked) == ["default", "s1", "s2"]
+
+    _SectionCheckerForTest.checked.clear()
+    Config._compile_configs()
+    _Checker._check(Config._applied_config, incremental=True)
+    assert sorted(_SectionCheckerForTest.checked) == ["default", "s1", "s2"]
+
+    _SectionCheckerForTest.checked.clear()
+    _Checker._check(Config._applied_config, incremental=True)
+    assert _SectionCheckerForTest.checked == []
+
+
+def test_incremental_check_does_not_fingerprint_the_sections(monkeypatch):
+    monkeypatch.setattr(_Checker, "_checkers", [_SectionCheckerForTest, _UniqueSectionCheckerForTest])
+    for i in range(10):
+        Config.configure_section_for_tests(f"s{i}", attribute="foo")
+    _Checker._check(Config._applied_config)
+
+    Config.configure_section_for_tests("s1", attribute="wrong")
+    with mock.patch.object(SectionForTest, "_fingerprint") as mck:
+        collector = _Checker._check(Config._applied_config, incremental=True)
+    assert [issue.message for issue in collector.errors] == ["Wrong attribute of `s1`."]
+    mck.assert_not_called()
+
+
+def test_process_executor_sends_the_config_once_per_worker(monkeypatch):
+    monkeypatch.setattr(_Checker, "_checkers", [_SectionCheckerForTest, _UniqueSectionCheckerForTest])
+    Config.configure_unique_section_for_tests("foo")
+    for i in range(4):
+        Config.configure_section_for_tests(f"s{i}", attribute="wrong" if i % 2 else "foo")
+    sequential_issues = _issues(_Checker._check(Config._applied_config))
+
+    _Checker._set_executor("process", max_workers=2)
+    try:
+        with mock.patch.object(
+            ProcessPoolExecutor, "submit", autospec=True, side_effect=ProcessPoolExecutor.submit
+        ) as mck:
+            collector = _Checker._check(Config._applied_config)
+    finally:
+        _Checker._set_executor()
+
+    assert _issues(collector) == sequential_issues
+    assert [issue.message for issue in collector.errors] == ["Wrong attribute of `s1`.", "Wrong attribute of `s3`."]
+    assert mck.call_count == 6
+    assert all(Config._applied_config not in call.args for call in mck.call_args_list)
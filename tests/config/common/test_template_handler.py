@@ -11,6 +11,7 @@
 
 import datetime
 import os
+from operator import attrgetter
 from unittest import mock
 
 import pytest
@@ -197,3 +198,25 @@ def test_to_frequency():
     assert Frequency.MONTHLY == _TemplateHandler._to_frequency("MONThLY")
     assert Frequency.QUARTERLY == _TemplateHandler._to_frequency("QuaRtERlY")
     assert Frequency.YEARLY == _TemplateHandler._to_frequency("Yearly")
+
+
+def test_to_function_and_to_class_are_memoized():
+    _TemplateHandler._clear_resolution_cache()
+    with mock.patch("src.taipy.config.common._template_handler.locate", side_effect=lambda v: attrgetter) as mck:
+        assert _TemplateHandler._to_class("operator.attrgetter") is attrgetter
+        assert _TemplateHandler._to_class("operator.attrgetter") is attrgetter
+        assert mck.call_count == 1
+    with mock.patch("src.taipy.config.common._template_handler.import_module", return_value=os) as mck:
+        assert _TemplateHandler._to_function("os.getcwd") is os.getcwd
+        assert _TemplateHandler._to_function("os.getcwd") is os.getcwd
+        assert mck.call_count == 1
+    _TemplateHandler._clear_resolution_cache()
+
+
+def test_to_class_does_not_memoize_unknown_classes():
+    with mock.patch("src.taipy.config.common._template_handler.locate", return_value=None) as mck:
+        assert _TemplateHandler._to_class("not.a.Class") is None
+        assert _TemplateHandler._to_class("not.a.Class") is None
+        assert mck.call_count == 2
+    with pytest.raises(InconsistentEnvVariableError):
+        _TemplateHandler._to_function("not_a_module.fct")
@@ -37,6 +37,7 @@ def reset_configuration_singleton():
     Config._collector = IssueCollector()
     Config._serializer = _TomlSerializer()
     Config._comparator = _ConfigComparator()
+    Config._subscribers = []
 
 
 def register_test_sections():
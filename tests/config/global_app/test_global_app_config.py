@@ -14,8 +14,10 @@ from unittest import mock
 
 import pytest
 
+from src.taipy.config.common._fingerprint import _Fingerprinted
 from src.taipy.config.config import Config
 from src.taipy.config.exceptions.exceptions import ConfigurationUpdateBlocked
+from src.taipy.config.global_app.global_app_config import GlobalAppConfig
 
 
 def test_global_config_with_env_variable_value():
@@ -44,3 +46,27 @@ def test_block_update_global_app_config():
     # Test if the global_config stay as default
     assert Config.global_config.foo is None
     assert len(Config.global_config.properties) == 0
+
+
+def test_global_config_env_variable_value_is_resolved_again_when_env_variable_changes():
+    with mock.patch.dict(os.environ, {"FOO": "bar"}):
+        Config.configure_global_app(foo="ENV[FOO]")
+        assert Config.global_config.foo == "bar"
+        os.environ["FOO"] = "baz"
+        assert Config.global_config.foo == "baz"
+        assert Config.global_config.properties == {"foo": "baz"}
+
+
+def test_global_config_fingerprint():
+    global_config = GlobalAppConfig(foo="bar", baz=1)
+    fingerprint = global_config._fingerprint()
+    assert GlobalAppConfig(baz=1, foo="bar")._fingerprint() == fingerprint
+
+    global_config.properties = {"foo": "qux"}
+    assert global_config._fingerprint() != fingerprint
+
+    # Modifying the properties outside of a setter or a compilation keeps the cached fingerprint until the next one.
+    global_config._clean()
+    assert global_config._fingerprint() != GlobalAppConfig()._fingerprint()
+    _Fingerprinted._invalidate_fingerprints()
+    assert global_config._fingerprint() == GlobalAppConfig()._fingerprint()
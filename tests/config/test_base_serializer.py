@@ -0,0 +1,98 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import datetime
+import sys
+from datetime import timedelta
+
+import pytest
+
+from src.taipy.config._serializer._base_serializer import _BaseSerializer
+from src.taipy.config.common.frequency import Frequency
+from src.taipy.config.common.scope import Scope
+from src.taipy.config.exceptions.exceptions import LoadingError
+
+
+def test_pythonify_type_tags():
+    assert _BaseSerializer._pythonify("1:int") == 1
+    assert _BaseSerializer._pythonify("1.5:float") == 1.5
+    assert _BaseSerializer._pythonify("True:bool") is True
+    assert _BaseSerializer._pythonify("1d2h:timedelta") == timedelta(days=1, hours=2)
+    assert _BaseSerializer._pythonify("SCENARIO:SCOPE") == Scope.SCENARIO
+    assert _BaseSerializer._pythonify("DAILY:FREQUENCY") == Frequency.DAILY
+    assert _BaseSerializer._pythonify("s1:SECTION") == "s1"
+    assert _BaseSerializer._pythonify("foo:str") == "foo"
+    assert _BaseSerializer._pythonify("a:b:str") == "a:b"
+
+
+def test_pythonify_leaves_untagged_values_unchanged():
+    assert _BaseSerializer._pythonify("foo") == "foo"
+    assert _BaseSerializer._pythonify(":int") == ":int"
+    assert _BaseSerializer._pythonify("http://taipy.io") == "http://taipy.io"
+    assert _BaseSerializer._pythonify("1:int\n") == "1:int\n"
+    assert _BaseSerializer._pythonify("ENV[FOO]:int") == "ENV[FOO]:int"
+    assert _BaseSerializer._pythonify("ENV[FOO]") == "ENV[FOO]"
+    assert _BaseSerializer._pythonify((1, "1:int")) == (1, "1:int")
+    assert _BaseSerializer._pythonify(None) is None
+
+
+def test_pythonify_empty_type_tag():
+    with pytest.raises(LoadingError):
+        _BaseSerializer._pythonify("foo:")
+    with pytest.raises(LoadingError):
+        _BaseSerializer._pythonify({"a": ["foo:"]})
+
+
+def test_pythonify_nested_values():
+    value = {"a": [{"b": "1:int", "c": ["s1:SECTION", {"d": "ENV[FOO]:int"}]}], 3: "2.0:float", "e": []}
+
+    assert _BaseSerializer._pythonify(value) == {
+        "a": [{"b": 1, "c": ["s1", {"d": "ENV[FOO]:int"}]}],
+        "3": 2.0,
+        "e": [],
+    }
+
+
+def test_pythonify_deeply_nested_values():
+    depth = sys.getrecursionlimit() * 2
+    value = leaf = {}
+    for _ in range(depth):
+        leaf["child"] = [{}]
+        leaf = leaf["child"][0]
+    leaf["value"] = "1:int"
+
+    result = _BaseSerializer._pythonify(value)
+
+    for _ in range(depth):
+        result = result["child"][0]
+    assert result == {"value": 1}
+
+
+def test_pythonify_interns_keys():
+    key = "".join(["prop", "_name"])
+    result = _BaseSerializer._pythonify({key: "foo"})
+    assert next(iter(result)) is sys.intern("prop_name")
+
+
+def test_pythonify_shares_values_in_compact_storage():
+    value = [{"a": "".join(["fo", "o"]), "b": "1d:timedelta"}, {"a": "".join(["f", "oo"]), "b": "1d:timedelta"}]
+    result = _BaseSerializer._pythonify(value)
+    assert result[0]["b"] == result[1]["b"]
+    assert result[0]["b"] is not result[1]["b"]
+
+    _BaseSerializer._set_compact_storage(True)
+    try:
+        result = _BaseSerializer._pythonify(value)
+    finally:
+        _BaseSerializer._set_compact_storage(False)
+    assert result[0]["a"] is result[1]["a"]
+    assert result[0]["b"] is result[1]["b"]
+    assert result == [{"a": "foo", "b": timedelta(days=1)}] * 2
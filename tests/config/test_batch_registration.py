@@ -0,0 +1,87 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from unittest import mock
+
+from src.taipy.config.config import Config
+from src.taipy.config.section import Section
+from tests.config.utils.named_temporary_file import NamedTemporaryFile
+from tests.config.utils.section_for_tests import SectionForTest
+
+
+def test_batch_compiles_once_on_exit():
+    with mock.patch.object(Config, "_override_env_file", return_value=False) as mck:
+        with Config.batch():
+            s1 = Config.configure_section_for_tests("s1", attribute="foo")
+            s2 = Config.configure_section_for_tests("s2", attribute=None, prop="bar")
+            Config.configure_unique_section_for_tests("qux")
+            Config.configure_global_app(foo="bar")
+            assert mck.call_count == 0
+            assert s1 is Config.section_name["s1"]
+            assert s2.prop == "bar"
+            assert s2.attribute is None
+        assert mck.call_count == 1
+
+    # The sections returned take the state of the compiled sections replacing them.
+    assert s1.attribute == "foo"
+    assert s1.prop == "default_prop"
+    assert s2.attribute == "default_attribute"
+    assert s2.prop == "bar"
+    assert Config.unique_section_name.attribute == "qux"
+    assert Config.global_config.foo == "bar"
+
+
+def test_nested_batches_compile_once_on_outermost_exit():
+    with mock.patch.object(Config, "_override_env_file", return_value=False) as mck:
+        with Config.batch():
+            with Config.batch():
+                Config._register_default(SectionForTest(Section._DEFAULT_KEY, "new_default", prop="new_prop"))
+                Config.configure_section_for_tests("s1", attribute=None)
+            assert mck.call_count == 0
+        assert mck.call_count == 1
+
+    assert Config.section_name["default"].attribute == "new_default"
+    assert Config.section_name["s1"].attribute == "new_default"
+    assert Config.section_name["s1"].prop == "new_prop"
+
+
+def test_batch_with_load_rebuilds_the_whole_config():
+    tf = NamedTemporaryFile(
+        """
+[TAIPY]
+foo = "bar"
+
+[section_name.s1]
+attribute = "from_file"
+    """
+    )
+    with Config.batch():
+        Config.configure_section_for_tests("s2", attribute="foo")
+        Config.load(tf.filename)
+
+    assert Config.global_config.foo == "bar"
+    assert Config.section_name["s1"].attribute == "from_file"
+    assert Config.section_name["s1"].prop == "default_prop"
+
+
+def test_batch_does_not_block_other_threads():
+    with Config.batch():
+        Config.configure_section_for_tests("s1", attribute="foo")
+        thread = threading.Thread(target=Config.configure_section_for_tests, args=("s2",), kwargs={"attribute": "bar"})
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert Config.section_name["s2"].attribute == "bar"
+        assert Config.section_name["s1"].attribute == "foo"
+
+    assert Config.section_name["s1"].prop == "default_prop"
+    assert Config.section_name["s2"].attribute == "bar"
@@ -9,8 +9,12 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import threading
+from unittest import mock
+
 import pytest
 
+from src.taipy.config.common._fingerprint import _Fingerprinted
 from src.taipy.config.config import Config
 from src.taipy.config.section import Section
 from tests.config.utils.named_temporary_file import NamedTemporaryFile
@@ -150,3 +154,304 @@ def test_nested_section_instance_override_toml(_init_list_section_for_test):
     assert ss_cfg.sections_list[1] is not s1_config_python_instance
     assert ss_cfg.sections_list[2] is s2_config_applied_instance
     assert ss_cfg.sections_list[1] is not s2_config_python_instance
+
+
+def test_incremental_compilation_gives_same_result_as_full_compilation(_init_list_section_for_test):
+    s1_cfg = Config.configure_section_for_tests("s1", attribute="foo", prop="bar")
+    s2_cfg = Config.configure_section_for_tests("s2", attribute=None, prop_int=2)
+    Config.configure_list_section_for_tests("ss", attribute="foo", sections_list=[s1_cfg, s2_cfg])
+    Config.configure_unique_section_for_tests("qwe", prop="rty")
+    Config.configure_global_app(foo="bar")
+    Config.configure_section_for_tests("s1", attribute="baz")
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "new_default_attribute", prop="new_default_prop"))
+    incrementally_compiled = Config._to_json(Config._applied_config)
+
+    Config._compile_configs()
+
+    assert Config._to_json(Config._applied_config) == incrementally_compiled
+    assert Config.section_name["s1"].attribute == "baz"
+    assert Config.section_name["s2"].attribute == "new_default_attribute"
+    assert Config.section_name["s2"].prop == "new_default_prop"
+    assert Config.list_section_name["ss"].sections_list[0] is Config.section_name["s1"]
+
+
+def test_section_registration_cost_is_linear():
+    with mock.patch.object(SectionForTest, "_update", autospec=True, side_effect=SectionForTest._update) as mck:
+        for i in range(100):
+            Config.configure_section_for_tests(f"section_{i}", attribute="foo")
+        first_hundred_call_count = mck.call_count
+        for i in range(100, 200):
+            Config.configure_section_for_tests(f"section_{i}", attribute="foo")
+
+    assert len(Config.section_name) == 201
+    assert mck.call_count == 2 * first_hundred_call_count
+
+
+def test_incremental_compilation_removes_sections_no_longer_configured():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    Config.configure_section_for_tests("s2", attribute="bar")
+    s2 = Config.section_name["s2"]
+    del Config._python_config._sections[SectionForTest.name]["s1"]
+
+    Config._compile_configs({(SectionForTest.name, "s1")})
+
+    assert "s1" not in Config.section_name
+    assert Config.section_name["s2"] is s2
+    incrementally_compiled = Config._to_json(Config._applied_config)
+    Config._compile_configs()
+    assert Config._to_json(Config._applied_config) == incrementally_compiled
+
+
+def test_compilation_publishes_complete_sections_to_concurrent_readers():
+    for i in range(50):
+        Config.configure_section_for_tests(f"s{i}", attribute="foo", prop="bar")
+    sections = Config._applied_config._sections[SectionForTest.name]
+    s0 = sections["s0"]
+    toml_config = NamedTemporaryFile(
+        content="\n".join(f'[section_name.s{i}]\nattribute = "baz"\n' for i in range(50)).join(["[TAIPY]\n", ""])
+    )
+    stop = threading.Event()
+    torn_reads = []
+    errors = []
+
+    def read():
+        while not stop.is_set():
+            try:
+                for section_id, section in Config.section_name.items():
+                    if section_id == Section._DEFAULT_KEY:
+                        continue
+                    if section.attribute not in ("foo", "baz") or section.prop != "bar":
+                        torn_reads.append((section_id, section.attribute, section.prop))
+            except RuntimeError as e:
+                errors.append(e)
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        for i in range(5):
+            Config.override(toml_config)
+            Config._compile_configs()
+            for j in range(20):
+                Config.configure_section_for_tests(f"new_{i}_{j}", attribute="foo", prop="bar")
+    finally:
+        stop.set()
+        reader.join()
+
+    assert errors == []
+    assert torn_reads == []
+    # A section held by a reader takes the state of the section replacing it.
+    assert s0.attribute == "baz"
+    # The published configs are never modified, a new one is published instead.
+    assert list(sections) == [Section._DEFAULT_KEY, *(f"s{i}" for i in range(50))]
+    assert len(Config.section_name) == 151
+
+
+def test_compilation_publishes_a_new_config_and_keeps_the_held_mappings_live():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    applied_config = Config._applied_config
+    applied_sections = applied_config._sections[SectionForTest.name]
+    sections = Config.sections[SectionForTest.name]
+
+    Config.configure_section_for_tests("s2", attribute="bar")
+    Config.override(NamedTemporaryFile(content='[TAIPY]\n[section_name.s1]\nattribute = "baz"\n'))
+
+    assert Config._applied_config is not applied_config
+    assert list(applied_config._sections[SectionForTest.name]) == [Section._DEFAULT_KEY, "s1"]
+    assert applied_config._sections[SectionForTest.name] is applied_sections
+    assert Config.sections[SectionForTest.name] is sections
+    assert list(sections) == [Section._DEFAULT_KEY, "s1", "s2"]
+    assert sections["s1"].attribute == "baz"
+    assert Config.section_name is sections
+
+
+def test_configuration_updates_are_serialized():
+    def configure(start):
+        for i in range(start, start + 100):
+            Config.configure_section_for_tests(f"section_{i}", attribute="foo")
+
+    threads = [threading.Thread(target=configure, args=(start,)) for start in range(0, 400, 100)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(Config.section_name) == 401
+    assert all(Config.section_name[f"section_{i}"].attribute == "foo" for i in range(400))
+
+
+def test_nested_sections_in_dicts_and_nested_lists_point_to_applied_instances(_init_list_section_for_test):
+    s1_cfg = Config.configure_section_for_tests("s1", attribute="foo")
+    s2_cfg = Config.configure_section_for_tests("s2", attribute="bar")
+    s1_python_instance = Config._python_config._sections[SectionForTest.name]["s1"]
+    s2_python_instance = Config._python_config._sections[SectionForTest.name]["s2"]
+    ss_cfg = Config.configure_list_section_for_tests(
+        "ss",
+        attribute="foo",
+        sections_list=[s1_python_instance],
+        sections_by_key={"first": s1_python_instance, "others": [[s2_python_instance]]},
+    )
+
+    assert ss_cfg.sections_list[0] is s1_cfg
+    assert ss_cfg.sections_by_key["first"] is s1_cfg
+    assert ss_cfg.sections_by_key["others"][0][0] is s2_cfg
+
+    Config._compile_configs()
+
+    ss = Config.list_section_name["ss"]
+    assert ss.sections_list[0] is Config.section_name["s1"]
+    assert ss.sections_by_key["first"] is Config.section_name["s1"]
+    assert ss.sections_by_key["others"][0][0] is Config.section_name["s2"]
+    # The sections held take the state of the sections replacing them.
+    assert ss_cfg.sections_list[0] is Config.section_name["s1"]
+    assert s1_cfg.attribute == "foo"
+
+
+def test_nested_section_references_are_indexed_until_the_configuration_is_modified(_init_list_section_for_test):
+    s1 = SectionForTest("s1", "foo")
+    s2 = SectionForTest("s2", "bar")
+    ss = SectionOfSectionsListForTest("ss", "foo", [s1, "s2"], sections_by_key={"a": [s2, {"b": s1}], "c": "s1"})
+
+    assert sorted(ss._nested_references(), key=repr) == sorted(
+        [
+            ("_sections_list", (0,)),
+            ("_properties", ("sections_by_key", "a", 0)),
+            ("_properties", ("sections_by_key", "a", 1, "b")),
+        ],
+        key=repr,
+    )
+
+    ss._sections_list.append(s2)
+    ss._properties["sections_by_key"]["a"].pop()
+    # The index is kept until the configuration is modified, and the references gone since are skipped.
+    assert len(ss._nested_references()) == 3
+    assert list(ss._nested_sections()) == [s1, s2]
+
+    _Fingerprinted._invalidate_fingerprints()
+    assert sorted(ss._nested_references(), key=repr) == sorted(
+        [("_sections_list", (0,)), ("_sections_list", (2,)), ("_properties", ("sections_by_key", "a", 0))], key=repr
+    )
+
+    ss.sections_list = ["s1", [s2]]
+    assert sorted(ss._nested_references(), key=repr) == sorted(
+        [("_sections_list", (1, 0)), ("_properties", ("sections_by_key", "a", 0))], key=repr
+    )
+
+
+def test_nested_sections_modified_in_place_point_to_applied_instances(_init_list_section_for_test):
+    s1_cfg = Config.configure_section_for_tests("s1", attribute="foo")
+    s2_cfg = Config.configure_section_for_tests("s2", attribute="bar")
+    Config.configure_list_section_for_tests("ss", attribute="qux", sections_list=[s1_cfg, s2_cfg])
+    python_ss = Config._python_config._sections[SectionOfSectionsListForTest.name]["ss"]
+    python_s2 = Config._python_config._sections[SectionForTest.name]["s2"]
+
+    python_ss._sections_list.pop(0)
+    Config._compile_configs()
+    assert Config.list_section_name["ss"].sections_list == [Config.section_name["s2"]]
+    assert s2_cfg.attribute == "bar"
+
+    python_ss._sections_list.append(python_s2)
+    Config._compile_configs()
+    assert [section.id for section in Config.list_section_name["ss"].sections_list] == ["s2", "s2"]
+    assert all(section is Config.section_name["s2"] for section in Config.list_section_name["ss"].sections_list)
+
+
+def test_section_references_are_resolved_whatever_the_order_of_the_sections(_init_list_section_for_test):
+    toml_config = NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[list_section_name.ss]
+sections_list = [ "s1:SECTION", "ss2:SECTION", "foo",]
+
+[list_section_name.ss2]
+attribute = "bar"
+
+[section_name.s1]
+attribute = "foo"
+prop_list = [ "s1:SECTION",]
+    """
+    )
+    Config.load(toml_config)
+
+    ss_cfg = Config.list_section_name["ss"]
+    assert ss_cfg.sections_list == [Config.section_name["s1"], Config.list_section_name["ss2"], "foo"]
+    # Properties keep the ids, and are written back as references.
+    assert Config.section_name["s1"].prop_list == ["s1"]
+    tf = NamedTemporaryFile()
+    Config.backup(tf.filename)
+    assert 'prop_list = [ "s1:SECTION",]' in tf.read()
+
+
+def test_section_references_are_resolved_in_the_section_names_of_their_attribute(_init_list_section_for_test):
+    toml_config = NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[section_name.foo]
+attribute = "foo:SECTION"
+
+[section_name.s1]
+attribute = "bar:SECTION"
+
+[list_section_name.foo]
+sections_list = [ "foo:SECTION",]
+
+[list_section_name.bar]
+sections_list = [ "foo:SECTION", "s1:SECTION", "bar:SECTION",]
+    """
+    )
+    Config.load(toml_config)
+
+    foo, s1 = Config.section_name["foo"], Config.section_name["s1"]
+    list_foo, list_bar = Config.list_section_name["foo"], Config.list_section_name["bar"]
+    # The sections list looks the ids up in the `section_name` sections first.
+    assert list_foo.sections_list == [foo]
+    assert list_foo.sections_list[0] is foo
+    assert list_bar.sections_list[0] is foo
+    assert list_bar.sections_list[1] is s1
+    assert list_bar.sections_list[2] is list_bar
+    # An attribute without section names resolves the references matching a single section, and keeps the others.
+    assert isinstance(s1.attribute, SectionOfSectionsListForTest)
+    assert s1.attribute.id == "bar"
+    assert foo.attribute == "foo"
+    assert not isinstance(foo.attribute, Section)
+
+
+def test_unresolved_section_references_are_kept_as_ids(_init_list_section_for_test):
+    toml_config = NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[section_name.s1]
+attribute = "foo"
+
+[list_section_name.s1]
+sections_list = [ "s1:SECTION",]
+
+[list_section_name.ss]
+sections_list = [ "s1:SECTION", "unknown:SECTION", "s1:SECTION", "other:SECTION",]
+    """
+    )
+    Config.load(toml_config)
+
+    s1 = Config.section_name["s1"]
+    assert Config.list_section_name["ss"].sections_list == [s1, "unknown", s1, "other"]
+
+
+def test_section_references_of_a_partial_override_file_to_other_layers_are_kept_as_ids(_init_list_section_for_test):
+    Config.configure_section_for_tests("s1", attribute="foo")
+    toml_config = NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[list_section_name.ss]
+sections_list = [ "s1:SECTION",]
+    """
+    )
+    Config.override(toml_config)
+
+    assert Config.list_section_name["ss"].sections_list == ["s1"]
+
+    with mock.patch("src.taipy.config._serializer._base_serializer._BaseSerializer._lazy_sections", True):
+        Config.override(toml_config)
+    assert Config.list_section_name["ss"].sections_list == ["s1"]
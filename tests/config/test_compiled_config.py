@@ -0,0 +1,176 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from unittest import mock
+
+import pytest
+
+from src.taipy.config._serializer._compiled_config_serializer import _CompiledConfigSerializer
+from src.taipy.config._serializer._toml_serializer import _TomlSerializer
+from src.taipy.config.config import Config
+from src.taipy.config.section import Section
+from tests.config.conftest import register_test_sections, reset_configuration_singleton
+from tests.config.utils.named_temporary_file import NamedTemporaryFile
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.section_of_sections_list_for_tests import SectionOfSectionsListForTest
+
+
+def _configure_in_python():
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop", prop_int=0))
+    Config.configure_list_section_for_tests = SectionOfSectionsListForTest._configure
+    Config.configure_global_app(foo="bar")
+    s1 = Config.configure_section_for_tests("s1", attribute="foo", prop="python_prop")
+    ss = Config.configure_list_section_for_tests("ss", attribute="qux", sections_list=[s1])
+    return s1, ss
+
+
+def _configure_in_toml():
+    return NamedTemporaryFile(
+        content="""
+[TAIPY]
+foo = "baz"
+
+[section_name.s1]
+prop_int = "2:int"
+
+[section_name.s2]
+attribute = "bar"
+
+[list_section_name.ss2]
+sections_list = [ "s1:SECTION", "s2:SECTION",]
+    """
+    )
+
+
+@pytest.fixture
+def artifact(tmp_path):
+    return str(tmp_path / "config.bin")
+
+
+def test_load_compiled_compiles_then_reuses_the_artifact(artifact):
+    toml_config = _configure_in_toml()
+    _configure_in_python()
+
+    assert not Config.load_compiled(artifact, toml_config.filename)
+    assert os.path.exists(artifact)
+    compiled = Config._to_json(Config._applied_config)
+
+    reset_configuration_singleton()
+    register_test_sections()
+    s1, ss = _configure_in_python()
+    with mock.patch.object(_TomlSerializer, "_read") as mck:
+        assert Config.load_compiled(artifact, toml_config.filename)
+        mck.assert_not_called()
+
+    assert Config._to_json(Config._applied_config) == compiled
+    # The sections held take the state of the loaded sections replacing them.
+    assert s1.prop_int == 2
+    assert Config.global_config.foo == "baz"
+    assert ss.sections_list[0] is Config.sections[SectionForTest.name]["s1"]
+    assert Config.sections[SectionOfSectionsListForTest.name]["ss2"].sections_list[0] is ss.sections_list[0]
+
+    s3 = Config.configure_section_for_tests("s3", attribute="qux")
+    assert s3.prop == "default_prop"
+    Config._compile_configs()
+    assert s1.prop_int == 2
+
+
+def test_load_compiled_compiles_again_when_a_layer_changes(artifact):
+    toml_config = _configure_in_toml()
+    _configure_in_python()
+    assert not Config.load_compiled(artifact, toml_config.filename)
+    assert Config.load_compiled(artifact, toml_config.filename)
+
+    Config.configure_section_for_tests("s1", attribute="new_foo")
+    assert not Config.load_compiled(artifact, toml_config.filename)
+    assert Config.load_compiled(artifact, toml_config.filename)
+    assert Config.sections[SectionForTest.name]["s1"].attribute == "new_foo"
+
+    with open(toml_config.filename, "a") as fd:
+        fd.write('\n[section_name.s3]\nattribute = "baz"\n')
+    assert not Config.load_compiled(artifact, toml_config.filename)
+    assert Config.sections[SectionForTest.name]["s3"].attribute == "baz"
+    assert Config.load_compiled(artifact, toml_config.filename)
+
+    with mock.patch.object(_CompiledConfigSerializer, "_FORMAT_VERSION", _CompiledConfigSerializer._FORMAT_VERSION + 1):
+        assert not Config.load_compiled(artifact, toml_config.filename)
+
+
+def test_load_compiled_ignores_corrupted_artifact(artifact):
+    _configure_in_python()
+    assert not Config.load_compiled(artifact)
+    with open(artifact, "r+b") as fd:
+        fd.truncate(_CompiledConfigSerializer._HEADER.size + 10)
+
+    assert not Config.load_compiled(artifact)
+    assert Config.load_compiled(artifact)
+
+
+def test_dump_compiled_with_env_file(artifact):
+    env_file = NamedTemporaryFile("[TAIPY]\nfoo = 'env'\n")
+    toml_config = _configure_in_toml()
+    with mock.patch.dict(os.environ, {Config._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH: env_file.filename}):
+        _configure_in_python()
+        Config.override(toml_config.filename)
+        Config.dump_compiled(artifact)
+
+        reset_configuration_singleton()
+        register_test_sections()
+        _configure_in_python()
+        with mock.patch.object(_TomlSerializer, "_read", side_effect=_TomlSerializer._read) as mck:
+            assert Config.load_compiled(artifact, toml_config.filename)
+            Config.configure_section_for_tests("s4", attribute="qux")
+            mck.assert_not_called()
+
+        assert Config.global_config.foo == "env"
+        assert Config.sections[SectionForTest.name]["s1"].prop_int == 2
+        assert Config.sections[SectionForTest.name]["s4"].attribute == "qux"
+
+
+def test_load_compiled_checks_the_key_of_the_artifact(artifact):
+    _configure_in_python()
+    Config._compile_configs()
+    Config.dump_compiled(artifact, key=b"secret")
+
+    assert Config.load_compiled(artifact, key=b"secret")
+    assert not Config.load_compiled(artifact, key=b"other secret")
+    assert Config.load_compiled(artifact, key=b"other secret")
+    assert not Config.load_compiled(artifact)
+    assert Config.load_compiled(artifact)
+
+    Config.dump_compiled(artifact, key=b"secret")
+    with open(artifact, "r+b") as fd:
+        fd.seek(-1, os.SEEK_END)
+        last_byte = fd.read(1)
+        fd.seek(-1, os.SEEK_END)
+        fd.write(bytes([last_byte[0] ^ 1]))
+    with mock.patch("pickle.loads") as mck:
+        assert not Config.load_compiled(artifact, key=b"secret")
+        mck.assert_not_called()
+
+
+def test_layers_digest_is_cached_until_the_configuration_changes(artifact):
+    _configure_in_python()
+    assert not Config.load_compiled(artifact)
+    assert Config.load_compiled(artifact)
+
+    with mock.patch.object(Config, "_to_json") as to_json, mock.patch.object(
+        SectionForTest, "_to_dict", side_effect=SectionForTest._to_dict, autospec=True
+    ) as to_dict:
+        assert Config.load_compiled(artifact)
+        assert Config.load_compiled(artifact)
+        to_json.assert_not_called()
+        to_dict.assert_not_called()
+
+    Config.configure_section_for_tests("s2", attribute="baz")
+    assert not Config.load_compiled(artifact)
+    assert Config.load_compiled(artifact)
@@ -14,6 +14,7 @@ from unittest import mock
 from src.taipy.config import Config
 from src.taipy.config._config import _Config
 from src.taipy.config._config_comparator._comparator_result import _ComparatorResult
+from src.taipy.config._serializer._json_serializer import _JsonSerializer
 from src.taipy.config.global_app.global_app_config import GlobalAppConfig
 from tests.config.utils.section_for_tests import SectionForTest
 from tests.config.utils.unique_section_for_tests import UniqueSectionForTest
@@ -190,6 +191,74 @@ class TestConfigComparator:
         # There should be no difference since the order of list attributes is ignored
         assert config_diff == {}
 
+    def test_comparator_with_replaced_list_items(self):
+        _config_1 = _Config._default_config()
+        _config_1._sections[SectionForTest.name] = {"section_3": self.section_3b}
+
+        _config_2 = _Config._default_config()
+        section_3d = SectionForTest("section_3", attribute=[1, 2], prop=["prop_1", "prop_4", "prop_3"])
+        _config_2._sections[SectionForTest.name] = {"section_3": section_3d}
+        config_diff = Config._comparator._find_conflict_config(_config_1, _config_2)
+
+        conflicted_config_diff = config_diff["conflicted_sections"]
+        assert conflicted_config_diff["modified_items"] == [
+            (("section_name", "section_3", "prop"), (["prop_1", "prop_2", "prop_3"], ["prop_1", "prop_4", "prop_3"])),
+        ]
+
+    def test_comparator_with_modified_attribute_type(self):
+        _config_1 = _Config._default_config()
+        _config_1._sections[SectionForTest.name] = {"section_2": self.section_2}
+
+        _config_2 = _Config._default_config()
+        section_2c = SectionForTest("section_2", attribute=[2], prop={"foo": "bar"})
+        _config_2._sections[SectionForTest.name] = {"section_2": section_2c}
+        config_diff = Config._comparator._find_conflict_config(_config_1, _config_2)
+
+        conflicted_config_diff = config_diff["conflicted_sections"]
+        assert conflicted_config_diff["modified_items"] == [
+            (("section_name", "section_2", "attribute"), ("2:int", ["2:int"])),
+            (("section_name", "section_2", "prop"), ("prop_2", {"foo": "bar"})),
+        ]
+
+    def test_comparator_skips_identical_sections(self):
+        _config_1 = _Config._default_config()
+        _config_1._sections[SectionForTest.name] = {"section_1": self.section_1, "section_2": self.section_2}
+
+        _config_2 = _Config._default_config()
+        section_1b = SectionForTest("section_1", attribute="attribute_1", prop="prop_1")
+        _config_2._sections[SectionForTest.name] = {"section_1": section_1b, "section_2": self.section_2b}
+        assert _config_1._fingerprint() != _config_2._fingerprint()
+
+        with mock.patch.object(_JsonSerializer, "_stringify", side_effect=_JsonSerializer._stringify) as mck:
+            config_diff = Config._comparator._find_conflict_config(_config_1, _config_2)
+            assert len(config_diff["conflicted_sections"]["modified_items"]) == 2
+            # Only the two versions of "section_2" are stringified.
+            assert len([c for c in mck.call_args_list if isinstance(c.args[0], dict)]) == 2
+
+            _config_2._sections[SectionForTest.name]["section_2"] = self.section_2
+            assert _config_1._fingerprint() == _config_2._fingerprint()
+            mck.reset_mock()
+            assert Config._comparator._find_conflict_config(_config_1, _config_2) == {}
+            mck.assert_not_called()
+
+    def test_comparator_sees_sections_modified_in_place_once_the_configuration_is_modified(self):
+        _config_1 = _Config._default_config()
+        _config_1._sections[SectionForTest.name] = {"section_3": SectionForTest("section_3", attribute=[1, 2])}
+        _config_2 = _Config._default_config()
+        section_3 = SectionForTest("section_3", attribute=[1, 2])
+        _config_2._sections[SectionForTest.name] = {"section_3": section_3}
+        assert _config_1._fingerprint() == _config_2._fingerprint()
+
+        # Modifying a list in place does not invalidate the cached fingerprint of the section, the next modification of
+        # the configuration does.
+        section_3._attribute.append(3)
+        assert Config._comparator._find_conflict_config(_config_1, _config_2) == {}
+        Config.configure_section_for_tests("other_section", attribute="foo")
+        config_diff = Config._comparator._find_conflict_config(_config_1, _config_2)
+        assert config_diff["conflicted_sections"]["modified_items"] == [
+            (("section_name", "section_3", "attribute"), (["1:int", "2:int"], ["1:int", "2:int", "3:int"]))
+        ]
+
     def test_comparator_with_new_unique_section(self):
         _config_1 = _Config._default_config()
 
@@ -240,6 +309,40 @@ class TestConfigComparator:
         assert conflicted_config_diff.get("removed_items") is None
         assert conflicted_config_diff.get("added_items") is None
 
+    def test_comparator_with_modified_dict_attribute_of_unique_section(self):
+        _config_1 = _Config._default_config()
+        _config_1._unique_sections[UniqueSectionForTest.name] = UniqueSectionForTest(
+            attribute="a", prop={"k1": "v1", "k2": "v2", "k3": {"k4": "v4"}}
+        )
+
+        _config_2 = _Config._default_config()
+        _config_2._unique_sections[UniqueSectionForTest.name] = UniqueSectionForTest(
+            attribute="a", prop={"k1": "v1b", "k3": {"k4": "v4b"}, "k5": "v5"}
+        )
+        config_diff = Config._comparator._find_conflict_config(_config_1, _config_2)
+
+        # Each key of the dictionary is reported in place of the attribute. Deeper values are reported as a whole.
+        conflicted_config_diff = config_diff["conflicted_sections"]
+        assert conflicted_config_diff["added_items"] == [(("unique_section_name", "prop", "k5"), "v5")]
+        assert conflicted_config_diff["removed_items"] == [(("unique_section_name", "prop", "k2"), "v2")]
+        assert conflicted_config_diff["modified_items"] == [
+            (("unique_section_name", "prop", "k1"), ("v1", "v1b")),
+            (("unique_section_name", "prop", "k3"), ({"k4": "v4"}, {"k4": "v4b"})),
+        ]
+
+    def test_comparator_with_modified_dict_attribute_of_section(self):
+        _config_1 = _Config._default_config()
+        _config_1._sections[SectionForTest.name] = {"s1": SectionForTest("s1", attribute="a", prop={"k1": "v1"})}
+
+        _config_2 = _Config._default_config()
+        _config_2._sections[SectionForTest.name] = {"s1": SectionForTest("s1", attribute="a", prop={"k1": "v1b"})}
+        config_diff = Config._comparator._find_conflict_config(_config_1, _config_2)
+
+        # The keys of a non unique section already hold the config id, so the dictionary is reported as a whole.
+        assert config_diff["conflicted_sections"]["modified_items"] == [
+            (("section_name", "s1", "prop"), ({"k1": "v1"}, {"k1": "v1b"})),
+        ]
+
     def test_unconflicted_section_name_store_statically(self):
         Config._comparator._add_unconflicted_section("section_name_1")
         assert Config._comparator._unconflicted_sections == {"section_name_1"}
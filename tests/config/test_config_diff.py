@@ -0,0 +1,59 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from copy import deepcopy
+
+from src.taipy.config._config_comparator._config_diff import _diff_configs
+from src.taipy.config.config import Config
+
+
+def test_diff_identical_configs():
+    Config.configure_section_for_tests("s1", attribute="foo", prop_list=["a", "b"])
+
+    assert _diff_configs(Config._applied_config, deepcopy(Config._applied_config)) == []
+
+
+def test_diff_configs():
+    Config.configure_global_app(foo="bar")
+    Config.configure_unique_section_for_tests("unique_attribute")
+    Config.configure_section_for_tests("s1", attribute="foo", prop_list=["a", "b"])
+    Config.configure_section_for_tests("s2", attribute="foo")
+    old_config = deepcopy(Config._applied_config)
+
+    Config.configure_global_app(foo="baz", bar="qux")
+    Config.configure_section_for_tests("s1", attribute="foo", prop_list=["b", "a"], prop="new_prop")
+    Config.configure_section_for_tests("s3", attribute="foo")
+    del Config._applied_config._sections["section_name"]["s2"]
+    del Config._applied_config._unique_sections["unique_section_name"]
+
+    assert _diff_configs(old_config, Config._applied_config) == [
+        ("TAIPY", None, "foo"),
+        ("TAIPY", None, "bar"),
+        ("unique_section_name", None, None),
+        ("section_name", "s1", "prop"),
+        ("section_name", "s1", "prop_list"),
+        ("section_name", "s2", None),
+        ("section_name", "s3", None),
+    ]
+
+
+def test_diff_configs_modified_in_place_once_the_configuration_is_modified():
+    Config.configure_section_for_tests("s1", attribute="foo", prop_list=["a", "b"])
+    old_config = deepcopy(Config._applied_config)
+    assert _diff_configs(old_config, Config._applied_config) == []
+
+    Config._applied_config._sections["section_name"]["s1"]._properties["prop_list"].append("c")
+    assert _diff_configs(old_config, Config._applied_config) == []
+    Config.configure_global_app(foo="bar")
+    assert _diff_configs(old_config, Config._applied_config) == [
+        ("TAIPY", None, "foo"),
+        ("section_name", "s1", "prop_list"),
+    ]
@@ -0,0 +1,177 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import asyncio
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from src.taipy.config.config import Config
+from src.taipy.config.exceptions.exceptions import ConfigurationUpdateBlocked
+from src.taipy.config.section import Section
+from src.taipy.config.unique_section import UniqueSection
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.section_of_sections_list_for_tests import SectionOfSectionsListForTest
+
+
+def test_overlay_overrides_values_in_context_only():
+    Config.configure_section_for_tests("s1", attribute="foo", prop="bar")
+    Config.configure_section_for_tests("s2", attribute="baz")
+    Config.configure_unique_section_for_tests("qwe", prop="rty")
+    Config.configure_global_app(foo="bar")
+    s1 = Config.sections[SectionForTest.name]["s1"]
+
+    with Config.overlay(
+        {
+            "TAIPY": {"foo": "tenant"},
+            "unique_section_name": {"attribute": "tenant_attribute"},
+            "section_name": {"s1": {"attribute": "tenant_attribute", "prop": "tenant_prop"}},
+        }
+    ):
+        overlaid_s1 = Config.sections[SectionForTest.name]["s1"]
+        assert overlaid_s1.attribute == "tenant_attribute"
+        assert overlaid_s1.prop == "tenant_prop"
+        assert overlaid_s1.prop_int == 0
+        assert overlaid_s1.id == "s1"
+        assert overlaid_s1.properties == {"prop": "tenant_prop", "prop_int": 0}
+        assert isinstance(overlaid_s1, SectionForTest)
+        assert isinstance(overlaid_s1, Section)
+        assert Config.sections[SectionForTest.name]["s2"] is Config.section_name["s2"]
+        assert set(Config.sections[SectionForTest.name]) == {"default", "s1", "s2"}
+        assert Config.unique_sections["unique_section_name"].attribute == "tenant_attribute"
+        assert Config.unique_sections["unique_section_name"].prop == "rty"
+        assert isinstance(Config.unique_sections["unique_section_name"], UniqueSection)
+        assert Config.global_config.foo == "tenant"
+
+        # The applied configuration is not modified.
+        assert s1.attribute == "foo"
+        assert s1.prop == "bar"
+        assert Config._applied_config._global_config.foo == "bar"
+
+    assert Config.sections[SectionForTest.name]["s1"] is s1
+    assert s1.attribute == "foo"
+    assert Config.unique_sections["unique_section_name"].attribute == "qwe"
+    assert Config.global_config.foo == "bar"
+
+
+def test_overlay_does_not_copy_the_applied_config():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    with mock.patch.object(SectionForTest, "__copy__") as mck:
+        with Config.overlay({"section_name": {"s1": {"attribute": "bar"}}}):
+            assert Config.sections[SectionForTest.name]["s1"].attribute == "bar"
+    mck.assert_not_called()
+
+
+def test_nested_overlays():
+    Config.configure_section_for_tests("s1", attribute="foo", prop="bar")
+
+    with Config.overlay({"section_name": {"s1": {"attribute": "outer", "prop": "outer_prop"}}}):
+        with Config.overlay({"section_name": {"s1": {"attribute": "inner"}}}):
+            assert Config.sections[SectionForTest.name]["s1"].attribute == "inner"
+            assert Config.sections[SectionForTest.name]["s1"].prop == "outer_prop"
+        assert Config.sections[SectionForTest.name]["s1"].attribute == "outer"
+    assert Config.sections[SectionForTest.name]["s1"].attribute == "foo"
+
+
+def test_overlay_values_can_use_environment_variables():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    with mock.patch.dict(os.environ, {"TENANT_PATH": "tenant/path"}):
+        with Config.overlay({"section_name": {"s1": {"attribute": "ENV[TENANT_PATH]"}}}):
+            assert Config.sections[SectionForTest.name]["s1"].attribute == "tenant/path"
+
+
+def test_overlay_is_isolated_between_asyncio_tasks():
+    Config.configure_section_for_tests("s1", attribute="foo")
+
+    async def read_with_overlay(tenant):
+        with Config.overlay({"section_name": {"s1": {"attribute": tenant}}}):
+            await asyncio.sleep(0.01)
+            return Config.sections[SectionForTest.name]["s1"].attribute
+
+    async def main():
+        return await asyncio.gather(*(read_with_overlay(f"tenant_{i}") for i in range(5)))
+
+    assert asyncio.run(main()) == [f"tenant_{i}" for i in range(5)]
+    assert Config.sections[SectionForTest.name]["s1"].attribute == "foo"
+
+
+def test_overlay_is_isolated_between_threads():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    entered = threading.Event()
+    read = threading.Event()
+    results = {}
+
+    def read_with_overlay():
+        with Config.overlay({"section_name": {"s1": {"attribute": "bar"}}}):
+            entered.set()
+            read.wait()
+            results["thread"] = Config.sections[SectionForTest.name]["s1"].attribute
+
+    thread = threading.Thread(target=read_with_overlay)
+    thread.start()
+    entered.wait()
+    results["main"] = Config.sections[SectionForTest.name]["s1"].attribute
+    read.set()
+    thread.join()
+
+    assert results == {"thread": "bar", "main": "foo"}
+
+
+def test_overlay_applies_to_referenced_sections():
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop"))
+    s1 = Config.configure_section_for_tests("s1", attribute="foo")
+    s2 = Config.configure_section_for_tests("s2", attribute="bar")
+    ss1 = SectionOfSectionsListForTest._configure("ss1", "qux", [s1, s2], prop={"main": s1})
+    ss2 = SectionOfSectionsListForTest._configure("ss2", "quux", [ss1])
+
+    with Config.overlay({"section_name": {"s1": {"attribute": "tenant_attribute"}}}):
+        # ss2 is not overlaid, but it references s1 through ss1.
+        overlaid_ss2 = Config.sections[SectionOfSectionsListForTest.name]["ss2"]
+        overlaid_ss1 = overlaid_ss2.sections_list[0]
+        assert overlaid_ss1.id == "ss1"
+        assert [section.attribute for section in overlaid_ss1.sections_list] == ["tenant_attribute", "bar"]
+        assert overlaid_ss1.prop["main"].attribute == "tenant_attribute"
+        assert overlaid_ss1.properties["prop"]["main"].attribute == "tenant_attribute"
+        assert overlaid_ss1.sections_list[1] is s2
+
+    assert ss2.sections_list[0] is ss1
+    assert ss1.sections_list == [s1, s2]
+    assert s1.attribute == "foo"
+
+
+def test_overlaid_sections_are_read_only():
+    s1 = Config.configure_section_for_tests("s1", attribute="foo")
+
+    with Config.overlay({"TAIPY": {"foo": "tenant"}, "section_name": {"s1": {"attribute": "tenant_attribute"}}}):
+        overlaid_s1 = Config.sections[SectionForTest.name]["s1"]
+        with pytest.raises(ConfigurationUpdateBlocked):
+            overlaid_s1.attribute = "bar"
+        with pytest.raises(ConfigurationUpdateBlocked):
+            Config.global_config.foo = "bar"
+        assert overlaid_s1.attribute == "tenant_attribute"
+
+    assert s1.attribute == "foo"
+
+
+def test_overlaid_sections_to_dict_returns_the_overlaid_values_and_other_methods_ignore_them():
+    s1 = Config.configure_section_for_tests("s1", attribute="foo", prop="bar")
+    Config.configure_global_app(foo="bar")
+
+    with Config.overlay({"TAIPY": {"foo": "tenant"}, "section_name": {"s1": {"prop": "tenant_prop"}}}):
+        overlaid_s1 = Config.sections[SectionForTest.name]["s1"]
+        assert overlaid_s1._to_dict() == {"attribute": "foo", "prop": "tenant_prop", "prop_int": 0}
+        assert Config.global_config._to_dict()["foo"] == "tenant"
+        # The other methods are the ones of the section.
+        assert overlaid_s1._fingerprint() == s1._fingerprint()
+
+    assert s1._to_dict() == {"attribute": "foo", "prop": "bar", "prop_int": 0}
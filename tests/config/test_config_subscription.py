@@ -0,0 +1,153 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+from unittest import mock
+
+from src.taipy.config.config import Config
+from src.taipy.config.section import Section
+from tests.config.utils.named_temporary_file import NamedTemporaryFile
+from tests.config.utils.section_for_tests import SectionForTest
+
+
+def test_subscriber_is_notified_of_changes():
+    subscriber = mock.MagicMock()
+    Config.subscribe(subscriber)
+
+    Config.configure_section_for_tests("s1", attribute="foo")
+    subscriber.assert_called_once_with([("section_name", "s1", None)])
+
+    subscriber.reset_mock()
+    Config.configure_section_for_tests("s1", attribute="bar", prop="new_prop")
+    subscriber.assert_called_once_with([("section_name", "s1", "attribute"), ("section_name", "s1", "prop")])
+
+    subscriber.reset_mock()
+    Config.configure_section_for_tests("s1", attribute="bar")
+    Config.configure_global_app(foo="bar")
+    subscriber.assert_called_once_with([("TAIPY", None, "foo")])
+
+    subscriber.reset_mock()
+    Config.configure_unique_section_for_tests("qwe")
+    subscriber.assert_called_once_with([("unique_section_name", None, "attribute")])
+
+
+def test_default_section_change_notifies_all_sections():
+    Config.configure_section_for_tests("s1", attribute=None)
+    Config.configure_section_for_tests("s2", attribute="foo")
+    subscriber = mock.MagicMock()
+    Config.subscribe(subscriber)
+
+    Config._register_default(
+        SectionForTest(Section._DEFAULT_KEY, "new_default_attribute", prop="default_prop", prop_int=0)
+    )
+
+    subscriber.assert_called_once_with([("section_name", "default", "attribute"), ("section_name", "s1", "attribute")])
+
+
+def test_batch_notifies_once():
+    subscriber = mock.MagicMock()
+    Config.subscribe(subscriber)
+
+    with Config.batch():
+        for i in range(100):
+            Config.configure_section_for_tests(f"s{i}", attribute="foo")
+
+    subscriber.assert_called_once_with([("section_name", f"s{i}", None) for i in sorted(range(100), key=str)])
+
+
+def test_subscribe_to_a_section():
+    section_subscriber = mock.MagicMock()
+    id_subscriber = mock.MagicMock()
+    Config.subscribe(section_subscriber, section_name="section_name")
+    Config.subscribe(id_subscriber, section_name="section_name", section_id="s2")
+
+    Config.configure_global_app(foo="bar")
+    Config.configure_section_for_tests("s1", attribute="foo")
+    Config.configure_section_for_tests("s2", attribute="foo")
+
+    assert section_subscriber.call_args_list == [
+        mock.call([("section_name", "s1", None)]),
+        mock.call([("section_name", "s2", None)]),
+    ]
+    id_subscriber.assert_called_once_with([("section_name", "s2", None)])
+
+
+def test_override_and_restore_notify_changes():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    subscriber = mock.MagicMock()
+    Config.subscribe(subscriber)
+    toml_config = NamedTemporaryFile(
+        """
+[TAIPY]
+
+[section_name.s1]
+attribute = "bar"
+"""
+    )
+
+    Config.override(toml_config.filename)
+    subscriber.assert_called_once_with([("section_name", "s1", "attribute")])
+
+    subscriber.reset_mock()
+    backup = NamedTemporaryFile()
+    Config.backup(backup.filename)
+    empty_toml_config = NamedTemporaryFile("[TAIPY]\n")
+    Config.override(empty_toml_config.filename)
+    subscriber.assert_called_once_with([("section_name", "s1", "attribute")])
+
+    subscriber.reset_mock()
+    Config.restore(backup.filename)
+    subscriber.assert_called_once_with([("section_name", "s1", "attribute")])
+
+
+def test_unsubscribe_and_failing_subscriber():
+    failing_subscriber = mock.MagicMock(side_effect=ValueError())
+    subscriber = mock.MagicMock()
+    Config.subscribe(failing_subscriber)
+    Config.subscribe(subscriber)
+
+    Config.configure_section_for_tests("s1", attribute="foo")
+    failing_subscriber.assert_called_once()
+    subscriber.assert_called_once()
+
+    Config.unsubscribe(failing_subscriber)
+    Config.unsubscribe(subscriber)
+    Config.configure_section_for_tests("s1", attribute="bar")
+    failing_subscriber.assert_called_once()
+    subscriber.assert_called_once()
+
+
+def test_no_snapshot_without_subscriber():
+    with mock.patch("src.taipy.config.config._snapshot") as snapshot:
+        Config.configure_section_for_tests("s1", attribute="foo")
+        Config._compile_configs()
+
+    snapshot.assert_not_called()
+
+
+def test_subscriber_can_wait_for_another_thread_updating_the_configuration():
+    notified = []
+
+    def subscriber(changes):
+        notified.append(changes)
+        if len(notified) == 1:
+            thread = threading.Thread(
+                target=Config.configure_section_for_tests, args=("s2",), kwargs={"attribute": "bar"}
+            )
+            thread.start()
+            thread.join(timeout=5)
+            assert not thread.is_alive()
+
+    Config.subscribe(subscriber)
+    Config.configure_section_for_tests("s1", attribute="foo")
+
+    assert notified == [[("section_name", "s1", None)], [("section_name", "s2", None)]]
+    assert Config.section_name["s2"].attribute == "bar"
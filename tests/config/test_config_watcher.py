@@ -0,0 +1,157 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+import threading
+from unittest import mock
+
+import pytest
+
+from src.taipy.config._config import _Config
+from src.taipy.config._config_watcher import _ConfigWatcher, _InotifyBackend
+from src.taipy.config.config import Config
+from src.taipy.config.exceptions.exceptions import ConfigurationUpdateBlocked
+
+override_config = """
+[TAIPY]
+foo = "bar"
+
+[unique_section_name]
+attribute = "unique_attribute"
+
+[section_name.s1]
+attribute = "s1_attribute"
+
+[section_name.s2]
+attribute = "s2_attribute"
+prop = "s2_prop"
+"""
+
+modified_override_config = """
+[TAIPY]
+foo = "bar"
+
+[unique_section_name]
+attribute = "unique_attribute"
+
+[section_name.s1]
+attribute = "new_s1_attribute"
+
+[section_name.s3]
+attribute = "s3_attribute"
+"""
+
+
+def _write(filename, content):
+    # Written atomically, as editors and deployment tools usually do.
+    with open(f"{filename}.tmp", "w") as fd:
+        fd.write(content)
+    os.replace(f"{filename}.tmp", filename)
+
+
+@pytest.fixture
+def override_file(tmp_path):
+    filename = str(tmp_path / "config.toml")
+    _write(filename, override_config)
+    Config.override(filename)
+    return filename
+
+
+def test_reload_override_file(override_file):
+    s1 = Config.sections["section_name"]["s1"]
+    _write(override_file, modified_override_config)
+
+    with mock.patch.object(_Config, "_clean", autospec=True) as clean:
+        changes = Config._reload_files({override_file})
+
+    clean.assert_not_called()
+    assert sorted(changes) == [
+        ("section_name", "s1", "attribute"),
+        ("section_name", "s2", None),
+        ("section_name", "s3", None),
+    ]
+    assert Config.sections["section_name"]["s1"].attribute == "new_s1_attribute"
+    assert s1.attribute == "new_s1_attribute"
+    assert "s2" not in Config.sections["section_name"]
+    assert Config.sections["section_name"]["s3"].attribute == "s3_attribute"
+    assert Config.sections["section_name"]["s3"].prop == "default_prop"
+    incrementally_compiled = Config._to_json(Config._applied_config)
+    Config._compile_configs()
+    assert Config._to_json(Config._applied_config) == incrementally_compiled
+
+
+def test_reload_ignores_other_and_unchanged_files(override_file, tmp_path):
+    assert Config._reload_files({str(tmp_path / "other.toml")}) == []
+    assert Config._reload_files({override_file}) == []
+
+
+def test_reload_env_file(override_file, tmp_path, monkeypatch):
+    env_filename = str(tmp_path / "env_config.toml")
+    _write(env_filename, '[TAIPY]\nfoo = "baz"\n')
+    monkeypatch.setenv(Config._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH, env_filename)
+    Config._compile_configs()
+    assert Config.global_config.foo == "baz"
+
+    _write(env_filename, '[TAIPY]\nfoo = "qux"\n\n[unique_section_name]\nprop = "env_prop"\n')
+    changes = Config._reload_files({env_filename})
+
+    assert changes == [("TAIPY", None, "foo"), ("unique_section_name", None, None)]
+    assert Config.global_config.foo == "qux"
+    assert Config.unique_sections["unique_section_name"].attribute == "unique_attribute"
+    assert Config.unique_sections["unique_section_name"].prop == "env_prop"
+
+
+def test_reload_blocked(override_file):
+    _write(override_file, modified_override_config)
+    Config.block_update()
+
+    with pytest.raises(ConfigurationUpdateBlocked):
+        Config._reload_files({override_file})
+    assert Config.sections["section_name"]["s1"].attribute == "s1_attribute"
+
+
+def test_invalid_file_is_not_applied(override_file):
+    watcher = _ConfigWatcher(lambda: [override_file], Config._reload_files, use_inotify=False)
+    subscriber = mock.MagicMock()
+    watcher.subscribe(subscriber)
+    _write(override_file, "[TAIPY\n")
+
+    watcher._reload({override_file})
+
+    subscriber.assert_not_called()
+    assert Config.sections["section_name"]["s1"].attribute == "s1_attribute"
+
+
+@pytest.mark.parametrize("use_inotify", [False, True])
+def test_watcher_reloads_changed_file(override_file, use_inotify):
+    if use_inotify and not _InotifyBackend._is_available():
+        pytest.skip("inotify is not available")
+    reloaded = threading.Event()
+    received_changes = []
+
+    def subscriber(changes):
+        received_changes.append(changes)
+        reloaded.set()
+
+    with mock.patch("src.taipy.config._config_watcher._InotifyBackend._is_available", return_value=use_inotify):
+        watcher = Config.watch(debounce=0.05, poll_interval=0.05)
+    watcher.subscribe(subscriber)
+    try:
+        _write(override_file, override_config.replace("s1_attribute", "first_s1_attribute"))
+        _write(override_file, modified_override_config)
+        assert reloaded.wait(5)
+    finally:
+        watcher.stop()
+
+    assert not watcher.is_alive
+    assert ("section_name", "s1", "attribute") in received_changes[-1]
+    assert Config.sections["section_name"]["s1"].attribute == "new_s1_attribute"
+    assert "s2" not in Config.sections["section_name"]
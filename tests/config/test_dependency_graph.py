@@ -0,0 +1,133 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+from unittest import mock
+
+import pytest
+
+from src.taipy.config.checker._checker import _Checker
+from src.taipy.config.checker._checkers._config_checker import _ConfigChecker
+from src.taipy.config.checker.issue_collector import IssueCollector
+from src.taipy.config.config import Config
+from src.taipy.config.exceptions.exceptions import CyclicDependencyError
+from src.taipy.config.section import Section
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.section_of_sections_list_for_tests import SectionOfSectionsListForTest
+
+LIST = SectionOfSectionsListForTest.name
+SECTION = SectionForTest.name
+
+
+@pytest.fixture(autouse=True)
+def _init_list_section_for_test():
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop", prop_int=0))
+    Config.configure_list_section_for_tests = SectionOfSectionsListForTest._configure
+
+
+def _configure_graph():
+    s1 = Config.configure_section_for_tests("s1", attribute="foo")
+    s2 = Config.configure_section_for_tests("s2", attribute="bar")
+    ss1 = Config.configure_list_section_for_tests("ss1", attribute="foo", sections_list=[s1, s2])
+    Config.configure_list_section_for_tests("ss2", attribute="foo", sections_list=[ss1], by_key={"s": [s2]})
+
+
+def test_direct_dependencies_and_dependents():
+    _configure_graph()
+    graph = Config._applied_config._dependency_graph()
+
+    assert graph._successors_of((LIST, "ss1")) == [(SECTION, "s1"), (SECTION, "s2")]
+    assert sorted(graph._successors_of((LIST, "ss2"))) == [(LIST, "ss1"), (SECTION, "s2")]
+    assert graph._predecessors_of((SECTION, "s1")) == [(LIST, "ss1")]
+    assert sorted(graph._predecessors_of((SECTION, "s2"))) == [(LIST, "ss1"), (LIST, "ss2")]
+    assert graph._successors_of((SECTION, "unknown")) == []
+
+
+def test_transitive_dependencies_and_dependents():
+    _configure_graph()
+    graph = Config._applied_config._dependency_graph()
+
+    assert sorted(graph._dependents((SECTION, "s1"))) == [(LIST, "ss1"), (LIST, "ss2")]
+    assert sorted(graph._dependencies((LIST, "ss2"))) == [(LIST, "ss1"), (SECTION, "s1"), (SECTION, "s2")]
+    assert graph._dependencies((SECTION, "s1")) == []
+
+
+def test_topological_order():
+    _configure_graph()
+    order = Config._applied_config._dependency_graph()._topological_order()
+
+    assert sorted(order) == [
+        (LIST, "ss1"),
+        (LIST, "ss2"),
+        (SECTION, "s1"),
+        (SECTION, "s2"),
+        ("unique_section_name", None),
+    ]
+    assert order.index((SECTION, "s1")) < order.index((LIST, "ss1")) < order.index((LIST, "ss2"))
+    assert order.index((SECTION, "s2")) < order.index((LIST, "ss1"))
+
+
+def test_graph_is_refreshed_incrementally_after_compilation():
+    _configure_graph()
+    graph = Config._applied_config._dependency_graph()
+    graph._topological_order()
+
+    with mock.patch.object(Section, "_nested_sections", autospec=True, side_effect=Section._nested_sections) as mck:
+        s1 = Config.section_name["s1"]
+        Config.configure_list_section_for_tests("ss1", attribute="foo", sections_list=[s1])
+        assert graph._predecessors_of((SECTION, "s2")) == [(LIST, "ss2")]
+        assert graph._successors_of((LIST, "ss1")) == [(SECTION, "s1")]
+    assert [call.args[0].id for call in mck.call_args_list] == ["ss1"]
+
+    del Config._python_config._sections[LIST]["ss1"]
+    Config._compile_configs({(LIST, "ss1")})
+    assert graph._predecessors_of((SECTION, "s1")) == []
+    assert (LIST, "ss1") not in graph._topological_order()
+
+    Config._compile_configs()
+    assert Config._applied_config._dependency_graph() is graph
+    assert graph._predecessors_of((SECTION, "s2")) == [(LIST, "ss2")]
+
+
+def test_cycles_are_detected():
+    _configure_graph()
+    ss2 = Config.sections[LIST]["ss2"]
+    Config.configure_list_section_for_tests("ss1", attribute="foo", sections_list=[ss2])
+    ss3 = Config.configure_list_section_for_tests("ss3", attribute="foo", sections_list=[])
+    Config.configure_list_section_for_tests("ss3", attribute="foo", sections_list=[ss3])
+    graph = Config._applied_config._dependency_graph()
+
+    assert sorted(graph._find_cycles()) == [[(LIST, "ss1"), (LIST, "ss2")], [(LIST, "ss3")]]
+    with pytest.raises(CyclicDependencyError):
+        graph._topological_order()
+
+
+def test_cycles_are_reported_by_the_checker():
+    _configure_graph()
+    ss2 = Config.sections[LIST]["ss2"]
+    Config.configure_list_section_for_tests("ss1", attribute="foo", sections_list=[ss2])
+    collector = IssueCollector()
+    _ConfigChecker(Config._applied_config, collector)._check_no_cyclic_dependency()
+
+    assert len(collector.errors) == 1
+    assert collector.errors[0].message == (f"Sections {LIST}:ss1 -> {LIST}:ss2 reference each other in a cycle.")
+
+
+def test_cycles_are_reported_by_the_default_checkers():
+    _configure_graph()
+    assert not _Checker._check(Config._applied_config).errors
+
+    ss2 = Config.sections[LIST]["ss2"]
+    Config.configure_list_section_for_tests("ss1", attribute="foo", sections_list=[ss2])
+    collector = _Checker._check(Config._applied_config, incremental=True)
+
+    assert [issue.message for issue in collector.errors] == [
+        f"Sections {LIST}:ss1 -> {LIST}:ss2 reference each other in a cycle."
+    ]
@@ -10,9 +10,11 @@
 # specific language governing permissions and limitations under the License.
 
 import os
+from unittest import mock
 
 import pytest
 
+from src.taipy.config._serializer._toml_serializer import _TomlSerializer
 from src.taipy.config.config import Config
 from src.taipy.config.exceptions.exceptions import ConfigurationUpdateBlocked
 from tests.config.utils.named_temporary_file import NamedTemporaryFile
@@ -56,3 +58,34 @@ def test_block_load_from_environment_overwrite_load_from_filename():
     os.environ.pop(Config._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH)
     assert Config.global_config.custom_property_not_overwritten is True
     assert Config.global_config.custom_property_overwritten == 10  # The Config.load is failed to override
+
+
+def test_env_file_is_only_read_again_when_it_changes():
+    env_file = NamedTemporaryFile(
+        """
+[TAIPY]
+custom_property_overwritten = 11
+"""
+    )
+    os.environ[Config._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH] = env_file.filename
+
+    with mock.patch.object(_TomlSerializer, "_read", side_effect=_TomlSerializer._read) as mck:
+        Config.configure_global_app(custom_property_overwritten=10)
+        Config.configure_section_for_tests("my_id", attribute="foo")
+        Config.configure_unique_section_for_tests("bar")
+        assert mck.call_count == 1
+        assert Config.global_config.custom_property_overwritten == 11
+
+        with open(env_file.filename, "w") as fd:
+            fd.write("[TAIPY]\ncustom_property_overwritten = 120\n")
+        Config.configure_section_for_tests("my_other_id", attribute="foo")
+        assert mck.call_count == 2
+        assert Config.global_config.custom_property_overwritten == 120
+        assert Config.section_name["my_id"].attribute == "foo"
+
+        Config._invalidate_env_file_cache()
+        Config.configure_section_for_tests("my_id", attribute="baz")
+        assert mck.call_count == 3
+        assert Config.section_name["my_id"].attribute == "baz"
+
+    os.environ.pop(Config._ENVIRONMENT_VARIABLE_NAME_WITH_CONFIG_PATH)
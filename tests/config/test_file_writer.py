@@ -0,0 +1,142 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from unittest import mock
+
+import pytest
+
+from src.taipy.config._serializer._base_serializer import _BaseSerializer
+from src.taipy.config._serializer._file_writer import _FileWriter
+from src.taipy.config.config import Config
+
+
+@pytest.fixture
+def write_options():
+    yield
+    _BaseSerializer._set_write_options(atomic=False, buffer_size=-1, fsync=False, skip_unchanged=False)
+
+
+def test_atomic_write_replaces_the_file_once_complete(tmp_path):
+    filename = tmp_path / "config.toml"
+    filename.write_text("previous")
+
+    with _FileWriter(str(filename), atomic=True) as writer:
+        writer.write("new ")
+        assert filename.read_text() == "previous"
+        writer.writelines(["con", "tent"])
+
+    assert filename.read_text() == "new content"
+    assert writer.written
+    assert os.listdir(tmp_path) == ["config.toml"]
+
+
+def test_atomic_write_keeps_the_file_on_error(tmp_path):
+    filename = tmp_path / "config.toml"
+    filename.write_text("previous")
+
+    with pytest.raises(ValueError):
+        with _FileWriter(str(filename), atomic=True) as writer:
+            writer.write("new")
+            raise ValueError()
+
+    assert filename.read_text() == "previous"
+    assert not writer.written
+    assert os.listdir(tmp_path) == ["config.toml"]
+
+
+def test_atomic_write_keeps_file_permissions(tmp_path):
+    filename = tmp_path / "config.toml"
+    filename.write_text("previous")
+    os.chmod(filename, 0o640)
+
+    with _FileWriter(str(filename), atomic=True) as writer:
+        writer.write("new")
+
+    assert os.stat(filename).st_mode & 0o777 == 0o640
+
+
+def test_skip_unchanged_write(tmp_path):
+    filename = tmp_path / "config.toml"
+
+    with _FileWriter(str(filename), skip_unchanged=True) as writer:
+        writer.write("content\nwith é\n")
+    assert writer.written
+    mtime = os.stat(filename).st_mtime_ns
+
+    with mock.patch("os.open") as os_open, mock.patch("builtins.open", side_effect=open) as builtins_open:
+        with _FileWriter(str(filename), atomic=True, skip_unchanged=True) as writer:
+            writer.writelines(["content\n", "with é\n"])
+    assert not writer.written
+    assert os.stat(filename).st_mtime_ns == mtime
+    # The content is compared in memory, so no file is created or opened for writing.
+    os_open.assert_not_called()
+    assert all(call.args[1] == "rb" for call in builtins_open.call_args_list)
+
+    with _FileWriter(str(filename), skip_unchanged=True) as writer:
+        writer.write("other content")
+    assert writer.written
+    assert filename.read_text() == "other content"
+    assert os.listdir(tmp_path) == ["config.toml"]
+
+    with _FileWriter(str(filename), skip_unchanged=True, binary=True) as writer:
+        writer.write(b"other content")
+    assert not writer.written
+
+
+def test_fsync_write(tmp_path):
+    filename = tmp_path / "config.toml"
+
+    with mock.patch("os.fsync", side_effect=os.fsync) as fsync:
+        with _FileWriter(str(filename), fsync=True) as writer:
+            writer.write("content")
+        assert fsync.call_count == 1
+        with _FileWriter(str(filename), atomic=True, fsync=True, buffer_size=16) as writer:
+            writer.write("content")
+        assert fsync.call_count == 3 if hasattr(os, "O_DIRECTORY") else 2
+
+    assert filename.read_text() == "content"
+
+
+def test_backup_with_write_options(tmp_path, write_options):
+    filename = tmp_path / "config.toml"
+    _BaseSerializer._set_write_options(atomic=True, skip_unchanged=True)
+    Config.configure_section_for_tests("s1", attribute="foo")
+
+    Config.backup(str(filename))
+    mtime = os.stat(filename).st_mtime_ns
+    with mock.patch("os.replace") as replace:
+        Config.backup(str(filename))
+    replace.assert_not_called()
+    assert os.stat(filename).st_mtime_ns == mtime
+
+    Config.configure_section_for_tests("s1", attribute="bar")
+    Config.backup(str(filename))
+    assert 'attribute = "bar"' in filename.read_text()
+    assert os.listdir(tmp_path) == ["config.toml"]
+
+
+def test_export_with_write_options(tmp_path):
+    filename = tmp_path / "config.toml"
+    Config.configure_section_for_tests("s1", attribute="foo")
+
+    Config.export(str(filename), skip_unchanged=True)
+    with mock.patch("os.replace") as replace:
+        Config.export(str(filename), atomic=True, skip_unchanged=True)
+    replace.assert_not_called()
+
+    Config.configure_section_for_tests("s1", attribute="bar")
+    with mock.patch("os.fsync", side_effect=os.fsync) as fsync:
+        Config.export(str(filename), atomic=True, fsync=True, skip_unchanged=True)
+    assert fsync.call_count >= 1
+    assert 'attribute = "bar"' in filename.read_text()
+    assert os.listdir(tmp_path) == ["config.toml"]
+    assert not _BaseSerializer._skip_unchanged
@@ -0,0 +1,147 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import os
+from unittest import mock
+
+import pytest
+
+from src.taipy.config import _inject_section
+from src.taipy.config._config import _Config
+from src.taipy.config._frozen_config import _FrozenConfig
+from src.taipy.config.common.scope import Scope
+from src.taipy.config.config import Config
+from src.taipy.config.exceptions.exceptions import ConfigurationUpdateBlocked
+from src.taipy.config.section import Section
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.section_of_sections_list_for_tests import SectionOfSectionsListForTest
+from tests.config.utils.unique_section_for_tests import UniqueSectionForTest
+
+
+class SectionWithComputedPropertyForTest(SectionForTest):
+    @property
+    def upper_attribute(self):
+        return self.attribute.upper()
+
+    def describe(self):
+        return f"{self.id}: {self.upper_attribute}"
+
+
+def test_freeze_takes_a_resolved_snapshot():
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop"))
+    Config.configure_global_app(foo="ENV[FOO]")
+    Config.configure_unique_section_for_tests("ENV[BAR]", scope=Scope.SCENARIO)
+    s1 = Config.configure_section_for_tests("s1", attribute="ENV[FOO]", prop_int="ENV[BAZ]:int")
+    SectionOfSectionsListForTest._configure("ss", attribute="qux", sections_list=[s1], mapping={"s1": s1})
+
+    with mock.patch.dict(os.environ, {"FOO": "foo", "BAR": "bar", "BAZ": "1"}):
+        frozen_config = Config.freeze()
+
+    assert Config._frozen_config is frozen_config
+    assert frozen_config.global_config.foo == "foo"
+    assert frozen_config.global_config.properties == {"foo": "foo"}
+    frozen_unique_section = frozen_config.unique_sections["unique_section_name"]
+    assert frozen_unique_section.attribute == "bar"
+    assert frozen_unique_section.scope == Scope.SCENARIO
+    assert frozen_unique_section.name == "unique_section_name"
+    frozen_s1 = frozen_config.sections["section_name"]["s1"]
+    assert frozen_s1.id == "s1"
+    assert frozen_s1.attribute == "foo"
+    assert frozen_s1.prop_int == 1
+    assert frozen_s1.prop == "default_prop"
+    assert isinstance(frozen_s1, SectionForTest)
+    assert frozen_s1.not_a_property is None
+    frozen_ss = frozen_config.sections["list_section_name"]["ss"]
+    assert frozen_ss.sections_list == (frozen_s1,)
+    assert frozen_ss.mapping["s1"] is frozen_s1
+
+
+def test_frozen_config_is_immutable():
+    Config.configure_section_for_tests("s1", attribute="foo")
+    frozen_config = Config.freeze()
+
+    with pytest.raises(ConfigurationUpdateBlocked):
+        frozen_config.sections["section_name"]["s1"].attribute = "bar"
+    with pytest.raises(ConfigurationUpdateBlocked):
+        frozen_config.global_config.foo = "bar"
+    with pytest.raises(ConfigurationUpdateBlocked):
+        frozen_config.sections = {}
+    with pytest.raises(TypeError):
+        frozen_config.sections["section_name"]["s2"] = None
+    with pytest.raises(ConfigurationUpdateBlocked):
+        Config.configure_section_for_tests("s2", attribute="bar")
+
+    Config.unblock_update()
+    assert Config._frozen_config is None
+    Config.configure_section_for_tests("s2", attribute="bar")
+    assert "s2" not in frozen_config.sections["section_name"]
+
+
+def test_frozen_section_keeps_computed_properties_and_methods():
+    config = _Config()
+    config._sections[SectionForTest.name] = {"s1": SectionWithComputedPropertyForTest("s1", "ENV[FOO]")}
+
+    with mock.patch.dict(os.environ, {"FOO": "foo"}):
+        frozen_config = _FrozenConfig._from_config(config)
+
+    frozen_s1 = frozen_config.sections[SectionForTest.name]["s1"]
+    assert isinstance(frozen_s1, SectionWithComputedPropertyForTest)
+    assert frozen_s1.upper_attribute == "FOO"
+    assert frozen_s1.describe() == "s1: FOO"
+
+
+def test_config_reads_the_frozen_config_until_unblocked():
+    Config.configure_global_app(foo="ENV[FOO]")
+    Config.configure_section_for_tests("s1", attribute="ENV[FOO]")
+    _inject_section(UniqueSectionForTest, "injected_unique_section", UniqueSectionForTest("default"), [])
+    Config.configure_unique_section_for_tests("ENV[FOO]")
+    held_sections = Config.sections[SectionForTest.name]
+
+    with mock.patch.dict(os.environ, {"FOO": "foo"}):
+        frozen_config = Config.freeze()
+
+    try:
+        with mock.patch.dict(os.environ, {"FOO": "bar"}):
+            assert Config.sections[SectionForTest.name]["s1"] is frozen_config.sections[SectionForTest.name]["s1"]
+            assert held_sections["s1"].attribute == "foo"
+            assert Config.section_name["s1"].attribute == "foo"
+            assert Config.unique_sections[UniqueSectionForTest.name].attribute == "foo"
+            assert Config.injected_unique_section.attribute == "foo"
+            assert Config.global_config is frozen_config.global_config
+            assert Config.global_config.foo == "foo"
+            with Config.overlay({"section_name": {"s1": {"attribute": "baz"}}}):
+                assert Config.sections[SectionForTest.name]["s1"].attribute == "baz"
+                assert Config.global_config.foo == "bar"
+
+            Config.unblock_update()
+            assert held_sections["s1"].attribute == "bar"
+            assert Config.injected_unique_section.attribute == "bar"
+            assert Config.global_config.foo == "bar"
+    finally:
+        del Config.injected_unique_section
+
+
+def test_frozen_sections_to_dict_returns_the_values_as_set():
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop"))
+    s1 = Config.configure_section_for_tests("s1", attribute="ENV[FOO]", prop="bar")
+    SectionOfSectionsListForTest._configure("ss", attribute="qux", sections_list=[s1])
+
+    with mock.patch.dict(os.environ, {"FOO": "foo"}):
+        frozen_config = Config.freeze()
+
+    frozen_s1 = frozen_config.sections[SectionForTest.name]["s1"]
+    assert frozen_s1._to_dict() == {"attribute": "ENV[FOO]", "prop": "bar", "prop_int": 0}
+    frozen_ss = frozen_config.sections[SectionOfSectionsListForTest.name]["ss"]
+    as_dict = frozen_ss._to_dict()
+    assert as_dict["sections_list"] == [frozen_s1]
+    as_dict["sections_list"].clear()
+    assert frozen_ss._to_dict()["sections_list"] == [frozen_s1]
+    assert frozen_config.global_config._to_dict() == Config._applied_config._global_config._to_dict()
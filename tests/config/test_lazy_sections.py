@@ -0,0 +1,186 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+
+from src.taipy.config._lazy_sections import _LazySections
+from src.taipy.config._serializer._base_serializer import _BaseSerializer
+from src.taipy.config.config import Config
+from src.taipy.config.section import Section
+from tests.config.utils.named_temporary_file import NamedTemporaryFile
+from tests.config.utils.section_for_tests import SectionForTest
+from tests.config.utils.section_of_sections_list_for_tests import SectionOfSectionsListForTest
+
+
+@pytest.fixture
+def lazy_sections():
+    Config._register_default(SectionOfSectionsListForTest(Section._DEFAULT_KEY, [], prop="default_prop", prop_int=0))
+    _BaseSerializer._set_lazy_sections(True)
+    yield
+    _BaseSerializer._set_lazy_sections(False)
+
+
+def _configure_in_toml():
+    return NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[section_name.default]
+prop = "file_default_prop"
+
+[section_name.s1]
+attribute = "foo"
+prop_int = "1:int"
+
+[section_name.s2]
+attribute = "bar"
+
+[section_name.s3]
+attribute = "baz"
+
+[list_section_name.ss]
+sections_list = [ "foo", "s1:SECTION", "s2:SECTION",]
+    """
+    )
+
+
+def test_lazy_sections_build_entries_on_first_access():
+    builder = mock.Mock(side_effect=lambda section_id, payload: SectionForTest(section_id, payload))
+    sections = _LazySections(builder, {"s0": SectionForTest("s0", "qux")})
+    sections._add_pending("s1", "foo")
+    sections._add_pending("s2", "bar")
+
+    assert list(sections) == ["s0", "s1", "s2"]
+    assert len(sections) == 3
+    assert "s1" in sections
+    assert "s4" not in sections
+    builder.assert_not_called()
+
+    s1 = sections["s1"]
+    assert s1.attribute == "foo"
+    assert sections["s1"] is s1
+    assert sections._is_built("s1")
+    assert not sections._is_built("s2")
+    builder.assert_called_once_with("s1", "foo")
+
+    assert [s.attribute for s in sections.values()] == ["qux", "foo", "bar"]
+    assert builder.call_count == 2
+
+
+def test_lazy_sections_hide_the_section_being_built():
+    def builder(section_id, payload):
+        assert section_id not in sections
+        assert sections.get(section_id) is None
+        return SectionForTest(section_id, payload)
+
+    sections = _LazySections(builder)
+    sections._add_pending("s1", "foo")
+
+    assert sections["s1"].attribute == "foo"
+    assert "s1" in sections
+
+
+def test_lazy_loading_builds_only_accessed_sections(lazy_sections):
+    toml_config = _configure_in_toml()
+    Config.load(toml_config.filename)
+
+    file_sections = Config._python_config._sections[SectionForTest.name]
+    applied_sections = Config._applied_config._sections[SectionForTest.name]
+    assert isinstance(file_sections, _LazySections)
+    assert isinstance(applied_sections, _LazySections)
+    assert list(applied_sections) == ["default", "s1", "s2", "s3"]
+    assert not file_sections._is_built("s1")
+    assert not applied_sections._is_built("s1")
+
+    assert applied_sections["s1"].attribute == "foo"
+    assert applied_sections["s1"].prop == "file_default_prop"
+    assert applied_sections["s1"].prop_int == 1
+    assert file_sections._is_built("s1")
+    assert not file_sections._is_built("s2")
+    assert not applied_sections._is_built("s2")
+
+
+def test_lazy_loading_gives_same_result_as_eager_loading(lazy_sections):
+    toml_config = _configure_in_toml()
+    Config.configure_section_for_tests("s3", attribute=None, prop="python_prop")
+    Config.override(toml_config.filename)
+    ss_cfg = Config.sections[SectionOfSectionsListForTest.name]["ss"]
+    assert ss_cfg.sections_list[1] is Config.sections[SectionForTest.name]["s1"]
+    lazily_loaded = Config._to_json(Config._applied_config)
+
+    _BaseSerializer._set_lazy_sections(False)
+    Config.override(toml_config.filename)
+
+    assert Config._to_json(Config._applied_config) == lazily_loaded
+
+
+def test_lazy_loading_resolves_references_in_the_section_names_of_their_attribute(lazy_sections):
+    toml_config = NamedTemporaryFile(
+        content="""
+[TAIPY]
+
+[section_name.s1]
+attribute = "foo"
+
+[list_section_name.s1]
+sections_list = [ "s1:SECTION",]
+
+[list_section_name.ss]
+sections_list = [ "s1:SECTION",]
+    """
+    )
+    Config.override(toml_config.filename)
+
+    s1 = Config.sections[SectionForTest.name]["s1"]
+    assert Config.sections[SectionOfSectionsListForTest.name]["ss"].sections_list[0] is s1
+    assert Config.sections[SectionOfSectionsListForTest.name]["s1"].sections_list[0] is s1
+
+
+def test_lazy_loaded_sections_are_recompiled_on_registration(lazy_sections):
+    toml_config = _configure_in_toml()
+    Config.override(toml_config.filename)
+    Config.configure_section_for_tests("s2", attribute="qux", prop="python_prop")
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "default_attribute", prop_int=2))
+
+    assert Config.sections[SectionForTest.name]["s2"].attribute == "bar"
+    assert Config.sections[SectionForTest.name]["s2"].prop == "python_prop"
+    assert Config.sections[SectionForTest.name]["s3"].prop == "file_default_prop"
+    assert Config.sections[SectionForTest.name]["s3"].prop_int == 2
+    assert len(Config.check()._errors) == 0
+
+
+def test_lazy_sections_build_each_entry_once_across_threads():
+    started = threading.Event()
+
+    def build(section_id, payload):
+        started.set()
+        time.sleep(0.05)
+        return SectionForTest(section_id, payload)
+
+    builder = mock.Mock(side_effect=build)
+    sections = _LazySections(builder)
+    sections._add_pending("s1", "foo")
+    results = []
+
+    threads = [threading.Thread(target=lambda: results.append(sections["s1"])) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert started.is_set()
+    assert builder.call_count == 1
+    assert len(results) == 4
+    assert all(section is results[0] for section in results)
@@ -9,12 +9,22 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import json
 import os
+import pickle
+from copy import copy
 from unittest import mock
 
 import pytest
 
+from src.taipy.config.common._fingerprint import _Fingerprinted
+from src.taipy.config.common._inherited_properties import _InheritedProperties
+from src.taipy.config.common._template_handler import _TemplateHandler
+from src.taipy.config.config import Config
 from src.taipy.config.exceptions.exceptions import InvalidConfigurationId
+from src.taipy.config.global_app.global_app_config import GlobalAppConfig
+from src.taipy.config.section import Section
+from tests.config.utils.named_temporary_file import NamedTemporaryFile
 from tests.config.utils.section_for_tests import SectionForTest
 from tests.config.utils.unique_section_for_tests import UniqueSectionForTest
 
@@ -45,3 +55,285 @@ def test_templated_properties_are_replaced():
 
         sect = SectionForTest(id="my_id", attribute="attribute", tpl_property="ENV[baz]:int")
         assert sect.tpl_property == 1
+
+
+def test_templated_properties_resolution_is_cached_until_a_change():
+    with mock.patch.dict(os.environ, {"foo": "bar"}):
+        sect = SectionForTest(id="my_id", attribute="attribute", tpl_property="ENV[foo]", prop="baz")
+        with mock.patch.object(
+            _TemplateHandler, "_replace_templates", wraps=_TemplateHandler._replace_templates
+        ) as mck:
+            assert sect.tpl_property == "bar"
+            assert sect.tpl_property == "bar"
+            assert sect.prop == "baz"
+            assert sect.properties == {"tpl_property": "bar", "prop": "baz"}
+            assert mck.call_count == 2
+
+            os.environ["foo"] = "qux"
+            assert sect.tpl_property == "qux"
+            assert mck.call_count == 3
+
+            sect._update({"prop": "quux"})
+            assert sect.prop == "quux"
+            assert mck.call_count == 4
+
+            sect.properties = {"prop": "corge"}
+            assert sect.prop == "corge"
+            assert sect.tpl_property is None
+
+
+def test_resolved_properties_are_stored_as_attributes_until_updated():
+    with mock.patch.dict(os.environ, {"foo": "bar"}):
+        sect = SectionForTest(id="my_id", attribute="attribute", tpl_property="ENV[foo]", prop="baz", items=[1])
+
+        assert sect.prop == "baz"
+        assert sect.tpl_property == "bar"
+        assert sect.items == [1]
+        # Only the values that do not depend on an environment variable and are not mutable are stored.
+        assert vars(sect)["prop"] == "baz"
+        assert "tpl_property" not in vars(sect)
+        assert "items" not in vars(sect)
+        with mock.patch.object(SectionForTest, "__getattr__") as getattr_mock:
+            assert sect.prop == "baz"
+        getattr_mock.assert_not_called()
+        assert sect._to_dict()["prop"] == "baz"
+
+        sect._update({"prop": "qux"})
+        assert "prop" not in vars(sect)
+        # Nothing is left on the section, so the sections never read do not hold more attributes.
+        assert "_resolved_properties" not in vars(sect)
+        assert "_stored_property_names" not in vars(sect)
+        assert sect.prop == "qux"
+        sect._clean()
+        assert sect.prop is None
+        assert sect.not_a_property is None
+        assert "not_a_property" not in vars(sect)
+
+    global_config = GlobalAppConfig(foo="bar")
+    assert global_config.foo == "bar"
+    assert vars(global_config)["foo"] == "bar"
+    global_config._update({"foo": "baz"})
+    assert global_config.foo == "baz"
+
+
+def test_templated_properties_resolution_cache_is_allocated_on_first_read():
+    sect = SectionForTest(id="my_id", attribute="attribute", prop="baz")
+    assert sect._resolved_properties is None
+    fingerprint = sect._fingerprint()
+
+    assert sect.prop == "baz"
+    assert sect._resolved_properties is not None
+    assert sect._fingerprint_cache == (_Fingerprinted._epoch, fingerprint)
+
+
+def test_section_created_without_init_has_no_properties():
+    sect = SectionForTest.__new__(SectionForTest)
+
+    assert sect._resolved_properties is None
+    with pytest.raises(AttributeError):
+        _ = sect._properties
+    with pytest.raises(AttributeError):
+        _ = sect.prop
+
+
+def test_section_can_be_pickled():
+    sect = SectionForTest(id="my_id", attribute="attribute", prop="baz", tpl_property="ENV[foo]")
+
+    unpickled = pickle.loads(pickle.dumps(sect))
+
+    assert unpickled.id == "my_id"
+    assert unpickled.attribute == "attribute"
+    assert unpickled.prop == "baz"
+    assert unpickled._properties == sect._properties
+
+
+def test_section_fingerprint_is_cached_until_a_change():
+    sect = SectionForTest(id="my_id", attribute="attribute", prop="baz", prop_list=[1, "a"])
+    same_sect = SectionForTest(id="my_id", prop_list=[1, "a"], prop="baz", attribute="attribute")
+    fingerprint = sect._fingerprint()
+    assert same_sect._fingerprint() == fingerprint
+
+    with mock.patch("src.taipy.config.common._fingerprint.json.dumps", wraps=json.dumps) as mck:
+        assert sect._fingerprint() == fingerprint
+        mck.assert_not_called()
+
+    sect.attribute = "new_attribute"
+    assert sect._fingerprint() != fingerprint
+    sect.attribute = "attribute"
+    assert sect._fingerprint() == fingerprint
+
+    sect.properties = {"prop": "qux"}
+    assert sect._fingerprint() != fingerprint
+    sect.properties = {"prop": "baz", "prop_list": [1, "a"]}
+    assert sect._fingerprint() == fingerprint
+
+    # Modifying the section outside of a setter or a compilation keeps the cached fingerprint until the next one.
+    sect._properties["prop_list"].append("b")
+    sect._clean()
+    assert sect._fingerprint() == fingerprint
+    _Fingerprinted._invalidate_fingerprints()
+    assert sect._fingerprint() == SectionForTest(id="other_id")._fingerprint()
+
+
+def test_section_fingerprint_is_not_invalidated_when_unpickled():
+    sect = SectionForTest(id="my_id", attribute="attribute")
+    fingerprint = sect._fingerprint()
+
+    unpickled = pickle.loads(pickle.dumps(sect))
+    unpickled._attribute = "other_attribute"
+    assert unpickled._fingerprint() != fingerprint
+
+
+def test_section_fingerprint_references_nested_sections_by_id():
+    nested = SectionForTest(id="nested", attribute="foo")
+    sect = SectionForTest(id="my_id", prop_list=[nested])
+    fingerprint = sect._fingerprint()
+
+    nested.attribute = "bar"
+    assert sect._fingerprint() == fingerprint
+    assert SectionForTest(id="my_id", prop_list=[SectionForTest(id="other")])._fingerprint() != fingerprint
+
+
+def test_sections_share_the_properties_inherited_from_the_default_section():
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "default", prop="ENV[FOO]", other="default_other"))
+    Config.configure_section_for_tests("s1", attribute="foo", other="s1_other", own="s1_own")
+    Config.configure_section_for_tests("s2", attribute="bar")
+    Config._compile_configs()
+    s1 = Config.section_name["s1"]
+    s2 = Config.section_name["s2"]
+
+    # The sections compiled together share a snapshot of the default properties.
+    assert s1._properties._inherited is s2._properties._inherited
+    assert list(s1._properties) == ["prop", "other", "own"]
+    assert dict(s1._properties) == {"prop": "ENV[FOO]", "other": "s1_other", "own": "s1_own"}
+    with mock.patch.dict(os.environ, {"FOO": "foo"}):
+        assert s1.prop == "foo"
+        assert s1.properties == {"prop": "foo", "other": "s1_other", "own": "s1_own"}
+    assert s2.other == "default_other"
+
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "default", prop="new", other="default_other"))
+    assert Config.section_name["s1"].prop == "new"
+    assert Config.section_name["s2"].prop == "new"
+
+
+def test_inherited_properties_are_copied_on_write():
+    inherited = {"a": 1, "b": 2}
+    properties = _InheritedProperties({"b": 3, "c": 4}, inherited)
+
+    assert list(properties.items()) == [("a", 1), ("b", 3), ("c", 4)]
+    properties["a"] = 5
+    del properties["b"]
+    assert properties.pop("c") == 4
+    assert dict(properties) == {"a": 5}
+    del properties["a"]
+    assert "a" not in properties and properties.get("a") is None and len(properties) == 0
+    with pytest.raises(KeyError):
+        del properties["a"]
+    properties["b"] = 6
+    assert dict(properties) == {"b": 6}
+    assert inherited == {"a": 1, "b": 2}
+
+    copied = _InheritedProperties({"c": 4}, inherited).copy()
+    copied["c"] = 7
+    copied.clear()
+    assert len(copied) == 0 and copied.get("a") is None
+    assert inherited == {"a": 1, "b": 2}
+
+
+def test_shared_own_properties_are_copied_on_write():
+    own = {"a": 1, "b": [2]}
+    properties = _InheritedProperties._shared_by(own)
+    copied = properties.copy()
+
+    properties["a"] = 1
+    properties.update({"b": own["b"]})
+    assert properties._own is own and copied._own is own
+    properties["a"] = 3
+    assert dict(properties) == {"a": 3, "b": [2]}
+    del copied["b"]
+    assert dict(copied) == {"a": 1}
+    assert own == {"a": 1, "b": [2]}
+
+    cleared = _InheritedProperties._shared_by(own)
+    cleared.clear()
+    assert len(cleared) == 0
+    assert own == {"a": 1, "b": [2]}
+
+
+def test_compiled_sections_share_their_properties_with_their_layer():
+    Config.configure_section_for_tests("s1", attribute="foo", own="s1_own")
+    Config.override(
+        NamedTemporaryFile(
+            content='[TAIPY]\n[section_name.s1]\nother = "file"\n[section_name.s2]\nattribute = "bar"\nown = "s2_own"\n'
+        )
+    )
+    s1 = Config.section_name["s1"]
+    s2 = Config.section_name["s2"]
+    file_s2 = Config._file_config._sections[SectionForTest.name]["s2"]
+
+    assert s2._properties._own is file_s2._properties._own
+    assert s2.own == "s2_own" and s2.prop == "default_prop"
+    # The properties merged from several layers are not shared.
+    assert s1._to_dict() == {
+        "attribute": "foo",
+        "own": "s1_own",
+        "other": "file",
+        "prop": "default_prop",
+        "prop_int": 0,
+    }
+    assert s1._properties._own is not Config._python_config._sections[SectionForTest.name]["s1"]._properties._own
+
+    s2._update({"own": "modified"})
+    assert file_s2._properties["own"] == "s2_own"
+    assert s2.own == "modified"
+
+    # A layer section modified in place does not modify the sections compiled before.
+    Config.configure_section_for_tests("s3", attribute="baz", own="s3_own")
+    python_s3 = Config._python_config._sections[SectionForTest.name]["s3"]
+    assert Config.section_name["s3"]._properties._own is python_s3._properties._own
+    subscriber = mock.MagicMock()
+    Config.subscribe(subscriber)
+    Config.configure_section_for_tests("s3", attribute="baz", own="new_s3_own")
+    subscriber.assert_called_once_with([("section_name", "s3", "own")])
+    assert Config.section_name["s3"].own == "new_s3_own"
+
+
+def test_properties_referencing_sections_are_not_shared():
+    s1 = Config.configure_section_for_tests("s1", attribute="foo")
+    Config.configure_section_for_tests("s2", attribute="bar", ref=s1)
+
+    python_s2 = Config._python_config._sections[SectionForTest.name]["s2"]
+    assert Config.section_name["s2"]._properties._own is not python_s2._properties
+    assert Config.section_name["s2"].ref is Config.section_name["s1"]
+
+
+def test_section_with_inherited_properties_can_be_cleaned_copied_and_pickled():
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "default", prop="default_prop"))
+    s1 = Config.configure_section_for_tests("s1", attribute="foo", own="s1_own")
+
+    unpickled = pickle.loads(pickle.dumps(s1))
+    assert unpickled._to_dict() == s1._to_dict() == {"attribute": "foo", "prop": "default_prop", "own": "s1_own"}
+    copied = copy(s1)
+    copied._properties["prop"] = "copied_prop"
+    assert s1.prop == "default_prop"
+
+    s1._clean()
+    assert s1._properties == {}
+    assert s1.prop is None
+    assert Config.section_name["default"].prop == "default_prop"
+
+
+def test_sections_inherit_the_default_section_overridden_by_a_file():
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "default", prop="default_prop"))
+    Config.configure_section_for_tests("s1", attribute="foo")
+    Config.override(
+        NamedTemporaryFile(
+            content='[TAIPY]\n[section_name.default]\nprop = "file_prop"\n[section_name.s2]\nattribute = "bar"\n'
+        )
+    )
+    Config._register_default(SectionForTest(Section._DEFAULT_KEY, "default", prop="new_default_prop"))
+
+    assert Config.section_name["s2"].prop == "file_prop"
+    incrementally_compiled = Config._to_json(Config._applied_config)
+    Config._compile_configs()
+    assert Config._to_json(Config._applied_config) == incrementally_compiled
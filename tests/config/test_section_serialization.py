@@ -9,15 +9,22 @@
 # an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
 # specific language governing permissions and limitations under the License.
 
+import copy
 import datetime
 import json
 import os
 from unittest import mock
 
+import pytest
+
 from src.taipy.config import Config
+from src.taipy.config._serializer._base_serializer import _BaseSerializer
 from src.taipy.config._serializer._json_serializer import _JsonSerializer
+from src.taipy.config.common._lazy_reference import _LazyReference
+from src.taipy.config.common._template_handler import _TemplateHandler
 from src.taipy.config.common.frequency import Frequency
 from src.taipy.config.common.scope import Scope
+from src.taipy.config.exceptions.exceptions import InconsistentEnvVariableError
 from tests.config.utils.named_temporary_file import NamedTemporaryFile
 from tests.config.utils.section_for_tests import SectionForTest
 from tests.config.utils.unique_section_for_tests import UniqueSectionForTest
@@ -260,6 +267,38 @@ prop_fct_list = [ "builtins.print:function", "builtins.pow:function",]
     assert actual_exported_toml_2 == expected_toml_config
 
 
+def test_read_toml_configuration_file_with_lazy_function_and_class():
+    toml_config = """
+[TAIPY]
+
+[section_name.my_id]
+attribute = "my_attribute"
+prop_fct_list = [ "tests.config.test_section_serialization.add:function",]
+prop_class_list = [ "tests.config.test_section_serialization.CustomClass:class",]
+prop_invalid = "not_a_module.fct:function"
+    """.strip()
+    tf = NamedTemporaryFile(toml_config)
+
+    _BaseSerializer._set_lazy_resolution(True)
+    try:
+        Config.override(tf.filename)
+    finally:
+        _BaseSerializer._set_lazy_resolution(False)
+
+    raw_properties = Config.sections[SectionForTest.name]["my_id"]._properties
+    assert isinstance(raw_properties["prop_fct_list"][0], _LazyReference)
+    assert isinstance(raw_properties["prop_class_list"][0], _LazyReference)
+    assert Config.sections[SectionForTest.name]["my_id"].prop_fct_list == [add]
+    assert Config.sections[SectionForTest.name]["my_id"].prop_class_list == [CustomClass]
+    with pytest.raises(InconsistentEnvVariableError):
+        _ = Config.sections[SectionForTest.name]["my_id"].prop_invalid
+
+    tf2 = NamedTemporaryFile()
+    Config.backup(tf2.filename)
+    assert 'prop_fct_list = [ "tests.config.test_section_serialization.add:function",]' in tf2.read()
+    assert 'prop_invalid = "not_a_module.fct:function"' in tf2.read()
+
+
 def test_write_json_configuration_file():
     expected_json_config = """
 {
@@ -474,3 +513,43 @@ def test_read_write_json_configuration_file_with_function_and_class():
 
     actual_exported_json_2 = tf2.read().strip()
     assert actual_exported_json_2 == expected_json_config
+
+
+def test_streamed_json_is_identical_to_json_of_the_whole_configuration():
+    Config.configure_global_app(foo="bär", bar=datetime.timedelta(hours=1))
+    Config.configure_unique_section_for_tests("attribute", prop_list=["a", 1])
+    s1 = Config.configure_section_for_tests("s1", attribute=None, prop_dict={"a": {"b": True}, "c": []}, prop_fct=add)
+    Config.configure_section_for_tests("s2", attribute="s", prop_list=[s1], prop_scope=Scope.SCENARIO)
+    Config._applied_config._sections["empty_section_name"] = {}
+
+    expected = json.dumps(
+        _BaseSerializer._str(Config._applied_config), ensure_ascii=False, indent=0, check_circular=False
+    )
+
+    assert _JsonSerializer._serialize(Config._applied_config) == expected
+    tf = NamedTemporaryFile()
+    _JsonSerializer._write(Config._applied_config, tf.filename)
+    with open(tf.filename) as fd:
+        assert fd.read() == expected
+
+
+def test_lazy_function_and_class_read_as_attributes_stand_for_the_function_and_the_class():
+    function_reference = _LazyReference(
+        "tests.config.test_section_serialization.add", "function", _TemplateHandler._to_function
+    )
+    class_reference = _LazyReference(
+        "tests.config.test_section_serialization.CustomEncoder", "class", _TemplateHandler._to_class
+    )
+
+    assert function_reference(1, 2) == 3
+    assert function_reference.__name__ == "add"
+    assert isinstance(class_reference(), CustomEncoder)
+    assert class_reference.__qualname__ == "CustomEncoder"
+    assert issubclass(class_reference, json.JSONEncoder)
+    assert class_reference.item_separator == CustomEncoder.item_separator
+    assert copy.deepcopy(class_reference) == class_reference
+
+    invalid_reference = _LazyReference("not_a_module.fct", "function", _TemplateHandler._to_function)
+    assert copy.deepcopy(invalid_reference) == invalid_reference
+    with pytest.raises(InconsistentEnvVariableError):
+        invalid_reference()
@@ -0,0 +1,128 @@
+# Copyright 2021-2024 Avaiga Private Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License"); you may not use this file except in compliance with
+# the License. You may obtain a copy of the License at
+#
+#        http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under the License is distributed on
+# an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the License for the
+# specific language governing permissions and limitations under the License.
+
+import datetime
+
+import pytest
+
+from src.taipy.config._serializer._toml_serializer import _TomlSerializer
+from src.taipy.config.common.scope import Scope
+from src.taipy.config.config import Config
+from src.taipy.config.exceptions.exceptions import LoadingError
+from tests.config.utils.named_temporary_file import NamedTemporaryFile
+
+toml_config = """
+[TAIPY]
+foo = "bar"
+
+[unique_section_name]
+attribute = "my_attribute"
+prop_int = "1:int"
+prop_list = [ "p1", "1991-01-01T00:00:00:datetime", "1d0h0m0s:timedelta",]
+prop_scope = "SCENARIO:SCOPE"
+
+[section_name.my_id]
+attribute = "my_attribute"
+prop_bool = "False:bool"
+prop_list = [ "unique_section_name:SECTION",]
+"""
+
+
+@pytest.fixture
+def restore_backend():
+    reader, writer = _TomlSerializer._reader, _TomlSerializer._writer
+    yield
+    _TomlSerializer._reader, _TomlSerializer._writer = reader, writer
+
+
+@pytest.mark.parametrize("reader", ["tomllib", "tomli", "toml"])
+def test_read_with_each_reader(reader, restore_backend):
+    pytest.importorskip(reader)
+    _TomlSerializer._set_backend(reader=reader)
+    tf = NamedTemporaryFile(toml_config)
+
+    Config.override(tf.filename)
+
+    assert Config.global_config.foo == "bar"
+    assert Config.unique_sections["unique_section_name"].prop_int == 1
+    assert Config.unique_sections["unique_section_name"].prop_list == [
+        "p1",
+        datetime.datetime(1991, 1, 1),
+        datetime.timedelta(days=1),
+    ]
+    assert Config.unique_sections["unique_section_name"].prop_scope == Scope.SCENARIO
+    assert Config.sections["section_name"]["my_id"].prop_bool is False
+    assert Config.sections["section_name"]["my_id"].prop_list == ["unique_section_name"]
+
+
+@pytest.mark.parametrize("reader", ["tomllib", "tomli", "toml"])
+def test_read_invalid_file_with_each_reader(reader, restore_backend):
+    pytest.importorskip(reader)
+    _TomlSerializer._set_backend(reader=reader)
+    tf = NamedTemporaryFile("[TAIPY]\nfoo = \n")
+
+    with pytest.raises(LoadingError, match="Can not load configuration"):
+        Config.override(tf.filename)
+
+
+@pytest.mark.parametrize("writer", ["toml", "tomli_w"])
+def test_backup_with_each_writer_can_be_read_back(writer, restore_backend):
+    pytest.importorskip(writer)
+    _TomlSerializer._set_backend(writer=writer)
+    config_file = NamedTemporaryFile(toml_config)
+    Config.override(config_file.filename)
+    tf = NamedTemporaryFile()
+
+    Config.backup(tf.filename)
+
+    assert Config._to_json(_TomlSerializer._read(tf.filename)) == Config._to_json(Config._applied_config)
+
+
+def test_set_unknown_backend():
+    with pytest.raises(ImportError):
+        _TomlSerializer._set_backend(reader="not_a_toml_library")
+
+
+@pytest.mark.parametrize("writer", ["toml", "tomli_w"])
+def test_streamed_backup_with_each_writer_can_be_read_back(writer, restore_backend, monkeypatch):
+    pytest.importorskip(writer)
+    _TomlSerializer._set_backend(writer=writer)
+    monkeypatch.setattr(_TomlSerializer, "_STREAMING_THRESHOLD", 1)
+    config_file = NamedTemporaryFile(toml_config)
+    Config.override(config_file.filename)
+    Config.configure_section_for_tests("other_id", attribute="foo", prop_dict={"a": "1:int", "nested": {"b": True}})
+    Config._applied_config._sections["empty_section_name"] = {}
+    tf = NamedTemporaryFile()
+
+    Config.backup(tf.filename)
+
+    with open(tf.filename) as fd:
+        content = fd.read()
+    assert content.startswith("[TAIPY]\n")
+    assert "\n[empty_section_name]\n" in content
+    del Config._applied_config._sections["empty_section_name"]
+    assert Config._to_json(_TomlSerializer._read(tf.filename)) == Config._to_json(Config._applied_config)
+
+
+def test_streamed_backup_with_tomli_w_gives_same_file(restore_backend, monkeypatch):
+    pytest.importorskip("tomli_w")
+    _TomlSerializer._set_backend(writer="tomli_w")
+    config_file = NamedTemporaryFile(toml_config)
+    Config.override(config_file.filename)
+    Config.configure_section_for_tests("other_id", attribute="foo", prop_dict={"a": "1:int", "nested": {"b": True}})
+    full_file, streamed_file = NamedTemporaryFile(), NamedTemporaryFile()
+
+    Config.backup(full_file.filename)
+    monkeypatch.setattr(_TomlSerializer, "_STREAMING_THRESHOLD", 1)
+    Config.backup(streamed_file.filename)
+
+    with open(full_file.filename) as full, open(streamed_file.filename) as streamed:
+        assert streamed.read() == full.read()
@@ -61,7 +61,7 @@ class SectionForTest(Section):
             self._attribute = default_section._attribute
         self._properties.update(as_dict)
         if default_section:
-            self._properties = {**default_section.properties, **self._properties}
+            self._inherit_properties(default_section)
 
     @staticmethod
     def _configure(id: str, attribute: str, **properties):
@@ -24,6 +24,7 @@ class SectionOfSectionsListForTest(Section):
     name = "list_section_name"
     _MY_ATTRIBUTE_KEY = "attribute"
     _SECTIONS_LIST_KEY = "sections_list"
+    _REFERENCED_SECTION_NAMES = {"_sections_list": (SectionForTest.name, name)}
 
     def __init__(self, id: str, attribute: Any = None, sections_list: List = None, **properties):
         self._attribute = attribute
@@ -71,14 +72,8 @@ class SectionOfSectionsListForTest(Section):
     def _from_dict(cls, as_dict: Dict[str, Any], id: str, config: Optional[_Config] = None):
         as_dict.pop(cls._ID_KEY, id)
         attribute = as_dict.pop(cls._MY_ATTRIBUTE_KEY, None)
-        section_configs = config._sections.get(SectionForTest.name, None) or []  # type: ignore
-        sections_list = []
-        if inputs_as_str := as_dict.pop(cls._SECTIONS_LIST_KEY, None):
-            for section_id in inputs_as_str:
-                if section_id in section_configs:
-                    sections_list.append(section_configs[section_id])
-                else:
-                    sections_list.append(section_id)
+        # The `id:SECTION` references of the list are replaced by the sections once the whole file is loaded.
+        sections_list = as_dict.pop(cls._SECTIONS_LIST_KEY, None) or []
         return SectionOfSectionsListForTest(id=id, attribute=attribute, sections_list=sections_list, **as_dict)
 
     def _update(self, as_dict: Dict[str, Any], default_section=None):
@@ -90,7 +85,7 @@ class SectionOfSectionsListForTest(Section):
             self._sections_list = default_section._sections_list
         self._properties.update(as_dict)
         if default_section:
-            self._properties = {**default_section.properties, **self._properties}
+            self._inherit_properties(default_section)
 
     @staticmethod
     def _configure(id: str, attribute: str, sections_list: List = None, **properties):
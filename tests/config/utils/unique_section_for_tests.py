@@ -62,7 +62,7 @@ class UniqueSectionForTest(UniqueSection):
             self._attribute = default_section._attribute
         self._properties.update(as_dict)
         if default_section:
-            self._properties = {**default_section.properties, **self._properties}
+            self._inherit_properties(default_section)
 
     @staticmethod
     def _configure(attribute: str, **properties):